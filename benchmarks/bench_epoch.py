@@ -0,0 +1,65 @@
+"""
+Compare the epoch-integer entry points against going through :class:`datetime.datetime`
+with :func:`pyrfc3339.parse()` and :func:`pyrfc3339.generate()`.
+
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from common import best_of, report, sample_timestamps
+
+from pyrfc3339 import generate, parse
+from pyrfc3339.generator import generate_from_epoch
+from pyrfc3339.parser import parse_to_epoch_ns, parse_to_epoch_us
+
+COUNT = 2_000
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+MICROSECOND = timedelta(microseconds=1)
+
+
+def main() -> None:
+    for microseconds in (False, True):
+        timestamps = sample_timestamps(COUNT, microseconds=microseconds)
+        report(
+            f"parse {COUNT} timestamps (microseconds={microseconds})",
+            COUNT,
+            {
+                "(parse() - EPOCH) // MICROSECOND": best_of(
+                    lambda: [(parse(t) - EPOCH) // MICROSECOND for t in timestamps]
+                ),
+                "parse_to_epoch_us()": best_of(
+                    lambda: [parse_to_epoch_us(t) for t in timestamps]
+                ),
+                "parse_to_epoch_ns()": best_of(
+                    lambda: [parse_to_epoch_ns(t) for t in timestamps]
+                ),
+            },
+        )
+
+        values = [parse_to_epoch_ns(t) for t in timestamps]
+        report(
+            f"generate {COUNT} timestamps (microseconds={microseconds})",
+            COUNT,
+            {
+                "generate(EPOCH + timedelta(...))": best_of(
+                    lambda: [
+                        generate(
+                            EPOCH + timedelta(microseconds=ns // 1000),
+                            microseconds=microseconds,
+                        )
+                        for ns in values
+                    ]
+                ),
+                "generate_from_epoch()": best_of(
+                    lambda: [
+                        generate_from_epoch(ns, microseconds=microseconds)
+                        for ns in values
+                    ]
+                ),
+            },
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Compare the current :func:`pyrfc3339.parse()` against the regular-expression-based implementation
+of pyRFC3339 2.1.0 and against a hand-written positional scanner, for several input shapes.
+
+Run this script under each supported Python release to compare them, e.g.::
+
+    $ for v in 3.10 3.11 3.12 3.13 3.14; do python$v benchmarks/bench_fast_path.py; done
+
+"""
+
+import re
+import sys
+from datetime import datetime, timedelta, timezone
+
+from common import best_of, report
+
+from pyrfc3339 import parse
+
+COUNT = 2_000
+
+SHAPES = {
+    "seconds, Z": "2009-01-01T10:01:02Z",
+    "3 fractional digits, offset": "2009-01-01T10:01:02.123-04:00",
+    "6 fractional digits, Z": "2009-01-01T10:01:02.123456Z",
+    "9 fractional digits, offset": "2009-01-01T10:01:02.123456789+05:30",
+}
+
+
+def parse_2_1_0(timestamp: str) -> datetime:
+    """
+    The parsing path of pyRFC3339 2.1.0.
+
+    """
+    timestamp = re.sub("Z$", "+00:00", timestamp, flags=re.IGNORECASE)
+
+    if sys.version_info < (3, 11):
+        timestamp = re.sub(
+            r"(\.)([0-9]+)(?=[+\-][0-9]{2}:[0-9]{2}$)",
+            lambda match: match.group(1) + match.group(2).ljust(6, "0")[:6],
+            timestamp,
+        )
+
+    return datetime.fromisoformat(timestamp)
+
+
+def parse_positional(timestamp: str) -> datetime:
+    """
+    A scanner for ``YYYY-MM-DDTHH:MM:SS[.f{1,9}](Z|±HH:MM)`` using only position and length checks.
+
+    """
+    if (
+        len(timestamp) < 20
+        or timestamp[4] != "-"
+        or timestamp[7] != "-"
+        or timestamp[13] != ":"
+        or timestamp[16] != ":"
+    ):
+        raise ValueError(timestamp)
+    digits = (
+        timestamp[0:4]
+        + timestamp[5:7]
+        + timestamp[8:10]
+        + timestamp[11:13]
+        + timestamp[14:16]
+        + timestamp[17:19]
+    )
+    if not (digits.isascii() and digits.isdigit()):
+        raise ValueError(timestamp)
+    end = 19
+    microsecond = 0
+    if timestamp[19] == ".":
+        end = 20
+        while end < len(timestamp) and "0" <= timestamp[end] <= "9":
+            end += 1
+        microsecond = int(timestamp[20:end][:6].ljust(6, "0"))
+    suffix = timestamp[end:]
+    if suffix in ("Z", "z"):
+        tz = timezone.utc
+    else:
+        sign = -1 if suffix[0] == "-" else 1
+        tz = timezone(
+            sign * timedelta(hours=int(suffix[1:3]), minutes=int(suffix[4:6]))
+        )
+    return datetime(
+        int(digits[0:4]),
+        int(digits[4:6]),
+        int(digits[6:8]),
+        int(digits[8:10]),
+        int(digits[10:12]),
+        int(digits[12:14]),
+        microsecond,
+        tz,
+    )
+
+
+def main() -> None:
+    print(f"Python {sys.version.split()[0]}")
+    for shape, timestamp in SHAPES.items():
+        timestamps = [timestamp] * COUNT
+        assert parse_positional(timestamp) == parse_2_1_0(timestamp) == parse(timestamp)
+        report(
+            shape,
+            COUNT,
+            {
+                "pyRFC3339 2.1.0": best_of(
+                    lambda: [parse_2_1_0(s) for s in timestamps]
+                ),
+                "positional scanner": best_of(
+                    lambda: [parse_positional(s) for s in timestamps]
+                ),
+                "parse()": best_of(lambda: [parse(s) for s in timestamps]),
+            },
+        )
+
+
+if __name__ == "__main__":
+    main()
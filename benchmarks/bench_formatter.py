@@ -0,0 +1,47 @@
+"""
+Compare :class:`pyrfc3339.generator.Rfc3339Formatter` against :func:`pyrfc3339.generate()`
+on a monotonic stream of timestamps, such as a log shipper would produce.
+
+"""
+
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from common import best_of, report
+
+from pyrfc3339 import generate
+from pyrfc3339.generator import Rfc3339Formatter
+
+COUNT = 2_000
+
+
+def main() -> None:
+    start = datetime(2024, 11, 5, 19, 7, 6, tzinfo=timezone.utc)
+    for step in (timedelta(milliseconds=7), timedelta(seconds=1)):
+        for tz, utc in (
+            (timezone.utc, True),
+            (ZoneInfo("US/Eastern"), True),
+            (ZoneInfo("US/Eastern"), False),
+        ):
+            datetimes = [(start + step * i).astimezone(tz) for i in range(COUNT)]
+            for microseconds in (False, True):
+                formatter = Rfc3339Formatter(utc=utc, microseconds=microseconds)
+                report(
+                    f"{COUNT} timestamps {step} apart in {tz} (utc={utc}, microseconds={microseconds})",
+                    COUNT,
+                    {
+                        "generate()": best_of(
+                            lambda: [
+                                generate(dt, utc=utc, microseconds=microseconds)
+                                for dt in datetimes
+                            ]
+                        ),
+                        "Rfc3339Formatter": best_of(
+                            lambda: [formatter(dt) for dt in datetimes]
+                        ),
+                    },
+                )
+
+
+if __name__ == "__main__":
+    main()
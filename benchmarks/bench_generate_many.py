@@ -0,0 +1,39 @@
+"""
+Compare :func:`pyrfc3339.generate_many()` and :func:`pyrfc3339.generator.write_many()`
+against a list comprehension around :func:`pyrfc3339.generate()`.
+
+"""
+
+import io
+
+from common import best_of, report, sample_datetimes
+
+from pyrfc3339 import generate, generate_many
+from pyrfc3339.generator import write_many
+
+COUNT = 2_000
+
+
+def main() -> None:
+    for offsets in (False, True):
+        datetimes = sample_datetimes(COUNT, offsets=offsets)
+        for utc in (False, True):
+            report(
+                f"generate {COUNT} timestamps (offsets={offsets}, utc={utc})",
+                COUNT,
+                {
+                    "[generate(dt) for dt in datetimes]": best_of(
+                        lambda: [generate(dt, utc=utc) for dt in datetimes]
+                    ),
+                    "generate_many(datetimes)": best_of(
+                        lambda: generate_many(datetimes, utc=utc)
+                    ),
+                    "write_many(datetimes, StringIO())": best_of(
+                        lambda: write_many(datetimes, io.StringIO(), utc=utc)
+                    ),
+                },
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Compare :func:`pyrfc3339.generator.generate_range()` against a loop adding a :class:`~datetime.timedelta`
+and calling :func:`pyrfc3339.generate()`, as when backfilling a regular series of timestamps.
+
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from common import best_of, report
+
+from pyrfc3339 import generate
+from pyrfc3339.generator import generate_range
+
+COUNT = 10_000
+
+
+def loop(
+    start: datetime, stop: datetime, step: timedelta, utc: bool, microseconds: bool
+) -> list[str]:
+    timestamps = []
+    dt = start
+    while dt < stop:
+        timestamps.append(generate(dt, utc=utc, microseconds=microseconds))
+        dt += step
+    return timestamps
+
+
+def main() -> None:
+    start = datetime(2024, 2, 28, 23, 0, 0, tzinfo=timezone(timedelta(hours=-5)))
+    for step in (timedelta(milliseconds=7), timedelta(seconds=1), timedelta(hours=1)):
+        stop = start + step * COUNT
+        for utc in (True, False):
+            for microseconds in (False, True):
+                report(
+                    f"{COUNT} timestamps {step} apart (utc={utc}, microseconds={microseconds})",
+                    COUNT,
+                    {
+                        "generate() loop": best_of(
+                            lambda: loop(start, stop, step, utc, microseconds)
+                        ),
+                        "generate_range()": best_of(
+                            lambda: list(
+                                generate_range(
+                                    start,
+                                    stop,
+                                    step,
+                                    utc=utc,
+                                    microseconds=microseconds,
+                                )
+                            )
+                        ),
+                    },
+                )
+
+
+if __name__ == "__main__":
+    main()
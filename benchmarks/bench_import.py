@@ -0,0 +1,85 @@
+"""
+Measure the cost of ``import pyrfc3339`` in fresh interpreters with ``python -X importtime``,
+and fail if it exceeds a budget::
+
+    $ python benchmarks/bench_import.py --budget-ms 5
+
+The cost is the time spent executing the package's own modules, excluding the standard library modules they import,
+which most programs have loaded anyway; the total including those is reported too. Each figure is the median of
+``--runs`` interpreters. The exit status is 1 if the package's own cost exceeds ``--budget-ms``.
+
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+#: The default budget, in milliseconds, for the time spent in the package's own modules.
+BUDGET_MS = 10.0
+
+
+def measure() -> tuple[float, float]:
+    """
+    Import the package in a fresh interpreter, returning the time spent in its own modules
+    and the total time, both in milliseconds.
+
+    """
+    # Let the interpreter cache bytecode, as an installed package would have it.
+    environment = {
+        key: value
+        for key, value in os.environ.items()
+        if key != "PYTHONDONTWRITEBYTECODE"
+    }
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import pyrfc3339"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=environment,
+    )
+
+    own = total = 0
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        fields = line.split(":", 1)[1].split("|")
+        if not fields[0].strip().isdigit():
+            continue
+        name = fields[2].strip()
+        if name == "pyrfc3339":
+            total = int(fields[1])
+        if name.split(".")[0] == "pyrfc3339":
+            own += int(fields[0])
+    return own / 1000, total / 1000
+
+
+def main() -> None:
+    arguments = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    arguments.add_argument(
+        "--budget-ms",
+        type=float,
+        default=BUDGET_MS,
+        help=f"the greatest acceptable time in the package's own modules (default: {BUDGET_MS})",
+    )
+    arguments.add_argument(
+        "--runs", type=int, default=15, help="the number of interpreters (default: 15)"
+    )
+    options = arguments.parse_args()
+
+    # The first import writes any missing bytecode; do not count it.
+    measure()
+    samples = [measure() for _ in range(options.runs)]
+    own = statistics.median(sample[0] for sample in samples)
+    total = statistics.median(sample[1] for sample in samples)
+
+    print(f"import pyrfc3339: {own:.2f} ms in the package, {total:.2f} ms in total")
+    if own > options.budget_ms:
+        print(f"Over budget: {own:.2f} ms > {options.budget_ms:.2f} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Compare :func:`pyrfc3339.bulk.parse_parallel()`, with from one worker process to one per CPU,
+against parsing serially with :func:`pyrfc3339.parse()`, producing epoch microseconds in every case.
+
+Each timing includes starting the worker processes.
+
+"""
+
+import os
+
+from common import best_of, report, sample_timestamps
+
+from pyrfc3339 import parse
+from pyrfc3339.bulk import parse_parallel
+from pyrfc3339.utils import datetime_epoch_us
+
+COUNT = 400_000
+
+
+def main() -> None:
+    timestamps = sample_timestamps(COUNT, offsets=True, microseconds=True)
+
+    timings = {
+        "parse()": best_of(
+            lambda: [datetime_epoch_us(parse(timestamp)) for timestamp in timestamps],
+            number=1,
+            repeat=3,
+        )
+    }
+    for workers in range(1, (os.cpu_count() or 1) + 1):
+        timings[f"parse_parallel(workers={workers})"] = best_of(
+            lambda: parse_parallel(timestamps, workers), number=1, repeat=3
+        )
+
+    report(f"{COUNT} timestamps", COUNT, timings)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""
+Compare :func:`pyrfc3339.parse_many()` against a list comprehension around :func:`pyrfc3339.parse()`.
+
+"""
+
+from common import best_of, report, sample_timestamps
+
+from pyrfc3339 import parse, parse_many
+
+COUNT = 2_000
+
+
+def main() -> None:
+    for offsets in (False, True):
+        timestamps = sample_timestamps(COUNT, offsets=offsets, microseconds=True)
+        for utc in (False, True):
+            report(
+                f"parse {COUNT} timestamps (offsets={offsets}, utc={utc})",
+                COUNT,
+                {
+                    "[parse(s) for s in timestamps]": best_of(
+                        lambda: [parse(s, utc=utc) for s in timestamps]
+                    ),
+                    "parse_many(timestamps)": best_of(
+                        lambda: parse_many(timestamps, utc=utc)
+                    ),
+                },
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Compare :func:`pyrfc3339.bulk.parse_records()` against decoding and parsing each fixed-width record
+with :func:`pyrfc3339.parse()`, producing epoch microseconds in both cases.
+
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from common import best_of, report, sample_timestamps
+
+from pyrfc3339 import parse
+from pyrfc3339.bulk import parse_records
+
+COUNT = 2_000
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+MICROSECOND = timedelta(microseconds=1)
+
+
+def main() -> None:
+    for microseconds in (False, True):
+        timestamps = sample_timestamps(COUNT, microseconds=microseconds)
+        width = max(map(len, timestamps))
+        data = b"".join(timestamp.encode().ljust(width) for timestamp in timestamps)
+
+        def per_record() -> list[int]:
+            return [
+                (parse(data[start:end].decode().rstrip()) - EPOCH) // MICROSECOND
+                for start, end in zip(
+                    range(0, len(data), width), range(width, len(data) + 1, width)
+                )
+            ]
+
+        report(
+            f"{COUNT} {width}-byte records (microseconds={microseconds})",
+            COUNT,
+            {
+                "decode() + parse()": best_of(per_record),
+                "parse_records()": best_of(lambda: parse_records(data, width)),
+            },
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Compare the compiled :func:`pyrfc3339.parse()` and :func:`pyrfc3339.generate()` against
+the pure-Python implementations in :mod:`pyrfc3339.parser` and :mod:`pyrfc3339.generator`.
+
+"""
+
+import sys
+
+from common import best_of, report, sample_datetimes, sample_timestamps
+
+from pyrfc3339 import generator, parser
+
+COUNT = 2_000
+
+
+def main() -> None:
+    try:
+        from pyrfc3339 import _speedups
+    except ImportError:
+        sys.exit("pyrfc3339._speedups is not built")
+
+    for offsets in (False, True):
+        timestamps = sample_timestamps(COUNT, offsets=offsets, microseconds=True)
+        report(
+            f"parse {COUNT} timestamps (offsets={offsets})",
+            COUNT,
+            {
+                "parser.parse()": best_of(
+                    lambda: [parser.parse(t) for t in timestamps]
+                ),
+                "_speedups.parse()": best_of(
+                    lambda: [_speedups.parse(t) for t in timestamps]
+                ),
+            },
+        )
+
+        datetimes = sample_datetimes(COUNT, offsets=offsets)
+        for utc in (True, False):
+            report(
+                f"generate {COUNT} timestamps (offsets={offsets}, utc={utc})",
+                COUNT,
+                {
+                    "generator.generate()": best_of(
+                        lambda: [generator.generate(dt, utc=utc) for dt in datetimes]
+                    ),
+                    "_speedups.generate()": best_of(
+                        lambda: [_speedups.generate(dt, utc=utc) for dt in datetimes]
+                    ),
+                },
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Compare :func:`pyrfc3339.bulk.parse_threaded()` and :func:`pyrfc3339.bulk.generate_threaded()`, with from one
+thread to one per CPU, against parsing and generating serially.
+
+Threads run in parallel only on a free-threaded build of Python running without the GIL, such as ``python3.14t``;
+elsewhere the threaded functions work in the calling thread, and every figure should match the serial one.
+
+"""
+
+import os
+import sys
+
+from common import best_of, report, sample_datetimes, sample_timestamps
+
+from pyrfc3339 import generate, parse
+from pyrfc3339.bulk import generate_threaded, parse_threaded
+
+COUNT = 200_000
+
+
+def main() -> None:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    gil_enabled = is_gil_enabled is None or is_gil_enabled()
+    print(
+        f"Python {sys.version.split()[0]}, GIL {'enabled' if gil_enabled else 'disabled'}"
+    )
+
+    cpus = os.cpu_count() or 1
+    timestamps = sample_timestamps(COUNT, offsets=True, microseconds=True)
+    datetimes = sample_datetimes(COUNT, offsets=True)
+
+    timings = {
+        "parse()": best_of(
+            lambda: [parse(timestamp) for timestamp in timestamps], number=1, repeat=3
+        )
+    }
+    for workers in range(1, cpus + 1):
+        timings[f"parse_threaded(workers={workers})"] = best_of(
+            lambda: parse_threaded(timestamps, workers), number=1, repeat=3
+        )
+    report(f"Parsing {COUNT} timestamps", COUNT, timings)
+
+    timings = {
+        "generate()": best_of(
+            lambda: [generate(dt) for dt in datetimes], number=1, repeat=3
+        )
+    }
+    for workers in range(1, cpus + 1):
+        timings[f"generate_threaded(workers={workers})"] = best_of(
+            lambda: generate_threaded(datetimes, workers), number=1, repeat=3
+        )
+    report(f"Generating {COUNT} timestamps", COUNT, timings)
+
+
+if __name__ == "__main__":
+    main()
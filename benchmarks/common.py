@@ -0,0 +1,79 @@
+"""
+Shared helpers for the pyRFC3339 benchmarks.
+
+Each benchmark is a standalone script which may be run directly from a source checkout::
+
+    $ python benchmarks/bench_parse_many.py
+
+"""
+
+import random
+import sys
+import timeit
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable
+
+# Allow the benchmarks to be run from a source checkout without installing the package.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pyrfc3339 import generate  # noqa: E402
+
+
+def sample_datetimes(
+    count: int, offsets: bool = False, seed: int = 3339
+) -> list[datetime]:
+    """
+    Produce a reproducible list of aware datetimes, optionally with assorted UTC offsets.
+
+    """
+    rng = random.Random(seed)
+    start = datetime(2000, 1, 1, tzinfo=timezone.utc)
+    zones = [timezone.utc]
+    if offsets:
+        zones += [
+            timezone(timedelta(hours=h, minutes=m))
+            for h, m in ((-5, 0), (5, 30), (9, 0), (-3, -30))
+        ]
+
+    return [
+        (
+            start
+            + timedelta(seconds=rng.randrange(10**9), microseconds=rng.randrange(10**6))
+        ).astimezone(rng.choice(zones))
+        for _ in range(count)
+    ]
+
+
+def sample_timestamps(
+    count: int, offsets: bool = False, microseconds: bool = False, seed: int = 3339
+) -> list[str]:
+    """
+    Produce a reproducible list of RFC 3339 timestamps, optionally with assorted UTC offsets.
+
+    """
+    return [
+        generate(dt, utc=False, microseconds=microseconds)
+        for dt in sample_datetimes(count, offsets, seed)
+    ]
+
+
+def best_of(func: Callable[[], object], number: int = 50, repeat: int = 7) -> float:
+    """
+    Return the best of several wall-clock timings of a call to ``func``, in seconds.
+
+    """
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def report(title: str, items: int, timings: dict[str, float]) -> None:
+    """
+    Print a table of timings, with the throughput of each relative to the first.
+
+    """
+    print(title)
+    baseline = next(iter(timings.values()))
+    for label, seconds in timings.items():
+        print(
+            f"  {label:<40} {seconds / items * 1e9:9.1f} ns/item  {baseline / seconds:5.2f}x"
+        )
@@ -0,0 +1,183 @@
+"""
+Time :func:`pyrfc3339.parse()` and :func:`pyrfc3339.generate()` across input shapes and options,
+optionally saving the results as JSON and comparing them against a saved baseline::
+
+    $ python benchmarks/suite.py --output baseline.json
+    $ git checkout my-branch
+    $ python benchmarks/suite.py --compare baseline.json
+
+The exit status is 1 if any case is slower than the baseline by more than ``--threshold``.
+
+Reference baselines are kept in ``benchmarks/baselines/``, named for the implementation and Python version, each
+recording the machine it was measured on. Timings are only comparable on the same machine, so to check a change,
+record a baseline of the main branch locally as above. Before a release, refresh the reference baselines::
+
+    $ python benchmarks/suite.py --output benchmarks/baselines/compiled-3.11.json
+    $ PYRFC3339_PURE_PYTHON=1 python benchmarks/suite.py --output benchmarks/baselines/pure-3.11.json
+
+and compare the previous release's files against the new ones.
+Run the suite with each Python version of interest, or through tox::
+
+    $ tox -e bench -- --output baseline.json
+
+Set ``PYRFC3339_PURE_PYTHON`` to time the pure-Python implementation rather than the C extension.
+
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+from datetime import datetime
+from typing import Callable
+
+from common import best_of, sample_datetimes, sample_timestamps
+
+import pyrfc3339
+from pyrfc3339 import generate, parse
+
+COUNT = 1_000
+
+#: Options for each parse case; produce_naive requires utc.
+PARSE_OPTIONS: dict[str, dict[str, bool]] = {
+    "default": {},
+    "utc": {"utc": True},
+    "utc+naive": {"utc": True, "produce_naive": True},
+}
+
+
+def with_digits(timestamp: str, digits: int) -> str:
+    """
+    Rewrite a timestamp generated with microseconds to have the given number of fractional digits.
+
+    """
+    fraction = (timestamp[20:26] + "789")[:digits]
+    return timestamp[:19] + ("." + fraction if digits else "") + timestamp[26:]
+
+
+def parse_cases() -> dict[str, Callable[[], object]]:
+    cases: dict[str, Callable[[], object]] = {}
+    for shape, offsets in (("utc", False), ("offset", True)):
+        base = sample_timestamps(COUNT, offsets=offsets, microseconds=True)
+        for digits in (0, 3, 6, 9):
+            timestamps = [with_digits(timestamp, digits) for timestamp in base]
+            for label, options in PARSE_OPTIONS.items():
+                cases[f"parse/{shape}/{digits}-digits/{label}"] = (
+                    lambda timestamps=timestamps, options=options: [
+                        parse(timestamp, **options) for timestamp in timestamps
+                    ]
+                )
+    return cases
+
+
+def generate_cases() -> dict[str, Callable[[], object]]:
+    cases: dict[str, Callable[[], object]] = {}
+    for shape, offsets in (("utc", False), ("offset", True)):
+        datetimes: list[datetime] = sample_datetimes(COUNT, offsets=offsets)
+        for utc in (True, False):
+            for microseconds in (False, True):
+                cases[f"generate/{shape}/utc={utc}/microseconds={microseconds}"] = (
+                    lambda datetimes=datetimes, utc=utc, microseconds=microseconds: [
+                        generate(dt, utc=utc, microseconds=microseconds)
+                        for dt in datetimes
+                    ]
+                )
+    return cases
+
+
+def run(selected: str) -> dict[str, float]:
+    """
+    Time each case whose name contains ``selected``, returning nanoseconds per timestamp.
+
+    """
+    results = {}
+    for name, func in {**parse_cases(), **generate_cases()}.items():
+        if selected in name:
+            results[name] = best_of(func, number=20, repeat=5) / COUNT * 1e9
+            print(f"  {name:<50} {results[name]:9.1f} ns/item")
+    return results
+
+
+def compare(
+    baseline: dict[str, float], results: dict[str, float], threshold: float
+) -> bool:
+    """
+    Print each case's change against the baseline, returning whether any is slower by more than ``threshold``.
+
+    """
+    regressed = False
+    print("Comparison with baseline")
+    for name, current in results.items():
+        if name not in baseline:
+            continue
+        ratio = current / baseline[name]
+        slower = ratio > 1 + threshold
+        regressed |= slower
+        flag = "  SLOWER" if slower else ""
+        print(
+            f"  {name:<50} {baseline[name]:9.1f} -> {current:9.1f} ns/item  {ratio:5.2f}x{flag}"
+        )
+    return regressed
+
+
+def main() -> None:
+    arguments = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    arguments.add_argument("--output", help="save the results as JSON to this file")
+    arguments.add_argument(
+        "--compare", help="compare the results against this JSON file"
+    )
+    arguments.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="the slowdown, as a fraction, reported as a regression (default: 0.1)",
+    )
+    arguments.add_argument(
+        "--filter", default="", help="run only the cases whose names contain this"
+    )
+    options = arguments.parse_args()
+
+    implementation = "pure-Python" if parse is pyrfc3339.parser.parse else "compiled"
+    print(
+        f"pyRFC3339 {getattr(pyrfc3339, '__version__', 'unknown')} ({implementation}), "
+        f"{platform.python_implementation()} {platform.python_version()}"
+    )
+    results = run(options.filter)
+
+    if options.output:
+        with open(options.output, "w") as f:
+            json.dump(
+                {
+                    "pyrfc3339": getattr(pyrfc3339, "__version__", None),
+                    "implementation": implementation,
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "machine": platform.machine(),
+                    "processor": platform.processor(),
+                    "cpus": os.cpu_count(),
+                    "count": COUNT,
+                    "ns_per_item": results,
+                },
+                f,
+                indent=2,
+            )
+            f.write("\n")
+
+    if options.compare:
+        with open(options.compare) as f:
+            baseline = json.load(f)
+        if (baseline["implementation"], baseline["python"]) != (
+            implementation,
+            platform.python_version(),
+        ):
+            print(
+                f"Note: the baseline was recorded with the {baseline['implementation']} implementation "
+                f"on Python {baseline['python']}"
+            )
+        if compare(baseline["ns_per_item"], results, options.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
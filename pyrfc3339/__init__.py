@@ -13,14 +13,45 @@ datetime.datetime(2009, 1, 1, 14, 1, 2, tzinfo=datetime.timezone(datetime.timede
 
 """
 
-from importlib.metadata import PackageNotFoundError, version
+import os
 
-from .generator import generate
-from .parser import parse
+from .generator import generate, generate_bytes, generate_many, make_generator
+from .parser import ParseError, make_parser, parse, parse_bytes, parse_many
+from .utils import Timestamp
 
-try:
-    __version__ = version("pyrfc3339")
-except PackageNotFoundError:
-    pass
+# Prefer the compiled parse() and generate(), if they were built, unless told otherwise.
+if not os.environ.get("PYRFC3339_PURE_PYTHON"):
+    try:
+        from ._speedups import generate, parse  # type: ignore[no-redef]  # noqa: F811
+    except ImportError:
+        pass
 
-__all__ = ["generate", "parse"]
+
+def __getattr__(name: str) -> str:
+    # Look up the version only when it is first requested, as importlib.metadata is slow to import.
+    if name == "__version__":
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            value = version("pyrfc3339")
+        except PackageNotFoundError:
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = [
+    "ParseError",
+    "Timestamp",
+    "generate",
+    "generate_bytes",
+    "generate_many",
+    "make_generator",
+    "make_parser",
+    "parse",
+    "parse_bytes",
+    "parse_many",
+]
@@ -0,0 +1,598 @@
+/*
+ * Compiled implementations of pyrfc3339.parse() and pyrfc3339.generate().
+ *
+ * Each function handles the common case -- a canonical RFC 3339 timestamp, or a datetime whose
+ * UTC offset is a whole number of minutes -- natively, and delegates everything else, including
+ * every error, to the pure-Python implementation in pyrfc3339.parser or pyrfc3339.generator.
+ * The fast paths therefore only need to agree with the Python implementations on success.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <datetime.h>
+
+/* The pure-Python implementations, to which anything unusual is delegated. */
+static PyObject *py_parse;
+static PyObject *py_generate;
+
+/* pyrfc3339.parser's namespace, and the value of its _parse_default when no cache is enabled. */
+static PyObject *parser_dict;
+static PyObject *py_fromisoformat;
+
+static PyObject *str_parse_default;
+static PyObject *str_utcoffset;
+
+/* Set by pyrfc3339.instrumentation while it is enabled; read and written atomically without the GIL. */
+static int observed;
+
+#ifdef Py_GIL_DISABLED
+#define LOAD_OBSERVED() _Py_atomic_load_int_relaxed(&observed)
+#define STORE_OBSERVED(value) _Py_atomic_store_int_relaxed(&observed, (value))
+#else
+#define LOAD_OBSERVED() (observed)
+#define STORE_OBSERVED(value) (observed = (value))
+#endif
+
+/* The parameters of parse() and generate(); those after the first NPOSITIONAL are keyword-only. */
+static const char *const parse_kwlist[] = {"timestamp", "utc", "produce_naive", "strict", "precision"};
+static const char *const generate_kwlist[] = {"dt", "utc", "accept_naive", "microseconds"};
+
+#define NPOSITIONAL 4
+#define MAX_PARAMS 5
+
+/*
+ * Bind the arguments of a vectorcall to the parameters named in kwlist, as a Python function
+ * with the same signature would. Return 0 without setting an exception if they cannot be bound,
+ * leaving the Python implementation to raise the appropriate TypeError.
+ */
+static int
+bind_arguments(const char *const *kwlist, Py_ssize_t nparams, PyObject *const *args,
+               Py_ssize_t nargs, PyObject *kwnames, PyObject **bound)
+{
+    Py_ssize_t i, j, nkwargs;
+
+    if (nargs > NPOSITIONAL) {
+        return 0;
+    }
+    for (i = 0; i < nparams; i++) {
+        bound[i] = i < nargs ? args[i] : NULL;
+    }
+
+    nkwargs = kwnames == NULL ? 0 : PyTuple_GET_SIZE(kwnames);
+    for (i = 0; i < nkwargs; i++) {
+        PyObject *name = PyTuple_GET_ITEM(kwnames, i);
+        for (j = 0; j < nparams; j++) {
+            if (PyUnicode_CompareWithASCIIString(name, kwlist[j]) == 0) {
+                break;
+            }
+        }
+        if (j == nparams || bound[j] != NULL) {
+            return 0;
+        }
+        bound[j] = args[nargs + i];
+    }
+
+    return bound[0] != NULL;
+}
+
+/* The truth value of an optional argument, or -1 with an exception set. */
+static int
+flag(PyObject *value, int default_value)
+{
+    return value == NULL ? default_value : PyObject_IsTrue(value);
+}
+
+static int
+is_leap(int year)
+{
+    return year % 4 == 0 && (year % 100 != 0 || year % 400 == 0);
+}
+
+static int
+days_in_month(int year, int month)
+{
+    static const int days[] = {0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31};
+
+    return month == 2 && is_leap(year) ? 29 : days[month];
+}
+
+/*
+ * Shift a wall-clock time by less than a day's worth of minutes.
+ * Return -1 if the result falls outside the years 1 to 9999.
+ */
+static int
+shift_minutes(int *year, int *month, int *day, int *hour, int *minute, int delta)
+{
+    int total = *hour * 60 + *minute + delta;
+
+    if (total < 0) {
+        total += 1440;
+        if (--*day == 0) {
+            if (--*month == 0) {
+                *month = 12;
+                if (--*year == 0) {
+                    return -1;
+                }
+            }
+            *day = days_in_month(*year, *month);
+        }
+    }
+    else if (total >= 1440) {
+        total -= 1440;
+        if (++*day > days_in_month(*year, *month)) {
+            *day = 1;
+            if (++*month == 13) {
+                *month = 1;
+                if (++*year == 10000) {
+                    return -1;
+                }
+            }
+        }
+    }
+
+    *hour = total / 60;
+    *minute = total % 60;
+    return 0;
+}
+
+/* Read a field of two or four ASCII digits, or return -1. */
+static int
+digits(const Py_UCS1 *s, int width)
+{
+    int value = 0;
+
+    for (int i = 0; i < width; i++) {
+        if (s[i] < '0' || s[i] > '9') {
+            return -1;
+        }
+        value = value * 10 + (s[i] - '0');
+    }
+    return value;
+}
+
+/*
+ * Parse a canonical timestamp: YYYY-MM-DD(T|t| )HH:MM:SS[.fraction](Z|z|+HH:MM|-HH:MM).
+ * Return 1 with *result set, 0 to decline, or -1 with an exception set.
+ */
+static int
+parse_fast(PyObject *timestamp, int utc, int produce_naive, int strict, PyObject **result)
+{
+    const Py_UCS1 *s;
+    Py_ssize_t length, pos, start;
+    int year, month, day, hour, minute, second, microsecond = 0, offset = 0;
+    PyObject *tz, *delta;
+
+    if (!PyUnicode_CheckExact(timestamp) || !PyUnicode_IS_ASCII(timestamp)) {
+        return 0;
+    }
+    s = PyUnicode_1BYTE_DATA(timestamp);
+    length = PyUnicode_GET_LENGTH(timestamp);
+    if (length < 20 || s[4] != '-' || s[7] != '-' || s[13] != ':' || s[16] != ':'
+        || (s[10] != 'T' && s[10] != 't' && s[10] != ' ')) {
+        return 0;
+    }
+
+    year = digits(s, 4);
+    month = digits(s + 5, 2);
+    day = digits(s + 8, 2);
+    hour = digits(s + 11, 2);
+    minute = digits(s + 14, 2);
+    second = digits(s + 17, 2);
+    if (year < 1 || month < 1 || month > 12 || day < 1 || day > days_in_month(year, month)
+        || hour < 0 || hour > 23 || minute < 0 || minute > 59 || second < 0 || second > 59) {
+        return 0;
+    }
+
+    pos = 19;
+    if (s[pos] == '.') {
+        start = ++pos;
+        while (pos < length && s[pos] >= '0' && s[pos] <= '9') {
+            if (pos - start < 6) {
+                microsecond = microsecond * 10 + (s[pos] - '0');
+            }
+            pos++;
+        }
+        if (pos == start || (strict && pos - start > 9)) {
+            return 0;
+        }
+        for (Py_ssize_t n = pos - start; n < 6; n++) {
+            microsecond *= 10;
+        }
+    }
+
+    if (pos + 1 == length && (s[pos] == 'Z' || s[pos] == 'z')) {
+        offset = 0;
+    }
+    else if (pos + 6 == length && (s[pos] == '+' || s[pos] == '-') && s[pos + 3] == ':') {
+        int offset_hour = digits(s + pos + 1, 2), offset_minute = digits(s + pos + 4, 2);
+        if (offset_hour < 0 || offset_hour > 23 || offset_minute < 0 || offset_minute > 59) {
+            return 0;
+        }
+        offset = offset_hour * 60 + offset_minute;
+        if (s[pos] == '-') {
+            offset = -offset;
+        }
+    }
+    else {
+        return 0;
+    }
+
+    if (offset != 0 && utc) {
+        if (shift_minutes(&year, &month, &day, &hour, &minute, -offset) < 0) {
+            return 0;
+        }
+        offset = 0;
+    }
+
+    if (offset == 0) {
+        tz = produce_naive ? Py_None : PyDateTime_TimeZone_UTC;
+        Py_INCREF(tz);
+    }
+    else {
+        if (produce_naive) {
+            return 0;
+        }
+        delta = PyDelta_FromDSU(0, offset * 60, 0);
+        if (delta == NULL) {
+            return -1;
+        }
+        tz = PyTimeZone_FromOffset(delta);
+        Py_DECREF(delta);
+        if (tz == NULL) {
+            return -1;
+        }
+    }
+
+    *result = PyDateTimeAPI->DateTime_FromDateAndTime(year, month, day, hour, minute, second,
+                                                      microsecond, tz, PyDateTimeAPI->DateTimeType);
+    Py_DECREF(tz);
+    return *result == NULL ? -1 : 1;
+}
+
+/*
+ * Take the fast path for bound arguments of parse(), some of which may be NULL.
+ * Return -1 with an exception set, 0 if the Python implementation must handle the call, or 1 with *result set.
+ */
+static int
+try_parse(PyObject *const *bound, PyObject **result)
+{
+    int utc, produce_naive, strict;
+
+    /* Only the default precision produces a datetime; leave anything else to the Python implementation. */
+    if (bound[4] != NULL
+        && !(PyUnicode_Check(bound[4]) && PyUnicode_CompareWithASCIIString(bound[4], "us") == 0)) {
+        return 0;
+    }
+    if ((utc = flag(bound[1], 0)) < 0 || (produce_naive = flag(bound[2], 0)) < 0
+        || (strict = flag(bound[3], 0)) < 0) {
+        return -1;
+    }
+
+    /* The caches change what parse() returns, so leave them to the Python implementation. */
+    if (PyDict_GetItemWithError(parser_dict, str_parse_default) != py_fromisoformat) {
+        return PyErr_Occurred() ? -1 : 0;
+    }
+
+    return parse_fast(bound[0], utc, produce_naive, strict, result);
+}
+
+static PyObject *
+speedups_parse(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *bound[MAX_PARAMS], *result = NULL;
+    int status;
+
+    /* While instrumentation is enabled, the Python implementation observes every call. */
+    if (LOAD_OBSERVED() || !bind_arguments(parse_kwlist, 5, args, nargs, kwnames, bound)) {
+        goto fallback;
+    }
+
+    status = try_parse(bound, &result);
+    if (status < 0) {
+        return NULL;
+    }
+    if (status > 0) {
+        return result;
+    }
+
+fallback:
+    return PyObject_Vectorcall(py_parse, args, nargs, kwnames);
+}
+
+static void
+put_digits(char *out, int value, int width)
+{
+    for (int i = width - 1; i >= 0; i--) {
+        out[i] = (char)('0' + value % 10);
+        value /= 10;
+    }
+}
+
+/*
+ * Generate a timestamp for a datetime whose UTC offset is a whole number of minutes.
+ * Return 1 with *result set, 0 to decline, or -1 with an exception set.
+ */
+static int
+generate_fast(PyObject *dt, int utc, int accept_naive, int microseconds, PyObject **result)
+{
+    PyObject *tz, *offset;
+    int year, month, day, hour, minute, offset_minutes = 0, is_utc;
+    char buffer[32];
+    Py_ssize_t length;
+
+    if (!PyDateTime_CheckExact(dt)) {
+        return 0;
+    }
+
+    year = PyDateTime_GET_YEAR(dt);
+    month = PyDateTime_GET_MONTH(dt);
+    day = PyDateTime_GET_DAY(dt);
+    hour = PyDateTime_DATE_GET_HOUR(dt);
+    minute = PyDateTime_DATE_GET_MINUTE(dt);
+
+    tz = PyDateTime_DATE_GET_TZINFO(dt);
+    if (tz == Py_None) {
+        if (!accept_naive || !utc) {
+            return 0;
+        }
+        is_utc = 1;
+    }
+    else {
+        offset = PyObject_CallMethodNoArgs(dt, str_utcoffset);
+        if (offset == NULL) {
+            return -1;
+        }
+        if (!PyDelta_CheckExact(offset) || PyDateTime_DELTA_GET_MICROSECONDS(offset) != 0
+            || PyDateTime_DELTA_GET_SECONDS(offset) % 60 != 0) {
+            Py_DECREF(offset);
+            return 0;
+        }
+        offset_minutes = PyDateTime_DELTA_GET_DAYS(offset) * 1440
+                         + PyDateTime_DELTA_GET_SECONDS(offset) / 60;
+        Py_DECREF(offset);
+
+        if (utc) {
+            if (shift_minutes(&year, &month, &day, &hour, &minute, -offset_minutes) < 0) {
+                return 0;
+            }
+            is_utc = 1;
+        }
+        else if (tz == PyDateTime_TimeZone_UTC) {
+            is_utc = 1;
+        }
+        else if ((is_utc = PyObject_RichCompareBool(tz, PyDateTime_TimeZone_UTC, Py_EQ)) < 0) {
+            return -1;
+        }
+    }
+
+    put_digits(buffer, year, 4);
+    buffer[4] = '-';
+    put_digits(buffer + 5, month, 2);
+    buffer[7] = '-';
+    put_digits(buffer + 8, day, 2);
+    buffer[10] = 'T';
+    put_digits(buffer + 11, hour, 2);
+    buffer[13] = ':';
+    put_digits(buffer + 14, minute, 2);
+    buffer[16] = ':';
+    put_digits(buffer + 17, PyDateTime_DATE_GET_SECOND(dt), 2);
+    length = 19;
+
+    if (microseconds) {
+        buffer[length] = '.';
+        put_digits(buffer + length + 1, PyDateTime_DATE_GET_MICROSECOND(dt), 6);
+        length += 7;
+    }
+
+    if (is_utc) {
+        buffer[length++] = 'Z';
+    }
+    else {
+        buffer[length] = offset_minutes < 0 ? '-' : '+';
+        if (offset_minutes < 0) {
+            offset_minutes = -offset_minutes;
+        }
+        put_digits(buffer + length + 1, offset_minutes / 60, 2);
+        buffer[length + 3] = ':';
+        put_digits(buffer + length + 4, offset_minutes % 60, 2);
+        length += 6;
+    }
+
+    *result = PyUnicode_New(length, 127);
+    if (*result == NULL) {
+        return -1;
+    }
+    memcpy(PyUnicode_1BYTE_DATA(*result), buffer, length);
+    return 1;
+}
+
+/* As try_parse(), for the bound arguments of generate(). */
+static int
+try_generate(PyObject *const *bound, PyObject **result)
+{
+    int utc, accept_naive, microseconds;
+
+    if ((utc = flag(bound[1], 1)) < 0 || (accept_naive = flag(bound[2], 0)) < 0
+        || (microseconds = flag(bound[3], 0)) < 0) {
+        return -1;
+    }
+
+    return generate_fast(bound[0], utc, accept_naive, microseconds, result);
+}
+
+static PyObject *
+speedups_generate(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *bound[MAX_PARAMS], *result = NULL;
+    int status;
+
+    if (LOAD_OBSERVED() || !bind_arguments(generate_kwlist, 4, args, nargs, kwnames, bound)) {
+        goto fallback;
+    }
+
+    status = try_generate(bound, &result);
+    if (status < 0) {
+        return NULL;
+    }
+    if (status > 0) {
+        return result;
+    }
+
+fallback:
+    return PyObject_Vectorcall(py_generate, args, nargs, kwnames);
+}
+
+/*
+ * The fast paths alone, for pyrfc3339.instrumentation: given all of the arguments of parse() or generate()
+ * positionally, return the result, or None if the Python implementation must handle the call.
+ */
+static PyObject *
+fast_call(int (*attempt)(PyObject *const *, PyObject **), const char *name, Py_ssize_t nparams,
+          PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *result = NULL;
+    int status;
+
+    if (nargs != nparams) {
+        PyErr_Format(PyExc_TypeError, "%s() takes exactly %zd arguments (%zd given)", name, nparams, nargs);
+        return NULL;
+    }
+
+    status = attempt(args, &result);
+    if (status < 0) {
+        return NULL;
+    }
+    if (status == 0) {
+        Py_RETURN_NONE;
+    }
+    return result;
+}
+
+static PyObject *
+speedups_parse_fast(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    return fast_call(try_parse, "_parse_fast", 5, args, nargs);
+}
+
+static PyObject *
+speedups_generate_fast(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    return fast_call(try_generate, "_generate_fast", 4, args, nargs);
+}
+
+static PyObject *
+speedups_set_observed(PyObject *module, PyObject *value)
+{
+    int truth = PyObject_IsTrue(value);
+
+    if (truth < 0) {
+        return NULL;
+    }
+    STORE_OBSERVED(truth);
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(parse_doc,
+"parse($module, /, timestamp, utc=False, produce_naive=False, strict=False, *, precision='us')\n"
+"--\n"
+"\n"
+"Parse an RFC 3339-formatted timestamp and return a datetime.datetime.\n"
+"\n"
+"A compiled implementation of pyrfc3339.parser.parse(); see that function for details.");
+
+PyDoc_STRVAR(generate_doc,
+"generate($module, /, dt, utc=True, accept_naive=False, microseconds=False)\n"
+"--\n"
+"\n"
+"Generate an RFC 3339-formatted timestamp from a datetime.datetime.\n"
+"\n"
+"A compiled implementation of pyrfc3339.generator.generate(); see that function for details.");
+
+PyDoc_STRVAR(parse_fast_doc,
+"_parse_fast($module, timestamp, utc, produce_naive, strict, precision, /)\n"
+"--\n"
+"\n"
+"Parse a timestamp if the fast path can, returning None otherwise.");
+
+PyDoc_STRVAR(generate_fast_doc,
+"_generate_fast($module, dt, utc, accept_naive, microseconds, /)\n"
+"--\n"
+"\n"
+"Generate a timestamp if the fast path can, returning None otherwise.");
+
+PyDoc_STRVAR(set_observed_doc,
+"_set_observed($module, observed, /)\n"
+"--\n"
+"\n"
+"Defer every call of parse() and generate() to the Python implementation while observed is true.");
+
+static PyMethodDef speedups_methods[] = {
+    {"parse", (PyCFunction)(void (*)(void))speedups_parse, METH_FASTCALL | METH_KEYWORDS, parse_doc},
+    {"generate", (PyCFunction)(void (*)(void))speedups_generate, METH_FASTCALL | METH_KEYWORDS,
+     generate_doc},
+    {"_parse_fast", (PyCFunction)(void (*)(void))speedups_parse_fast, METH_FASTCALL, parse_fast_doc},
+    {"_generate_fast", (PyCFunction)(void (*)(void))speedups_generate_fast, METH_FASTCALL,
+     generate_fast_doc},
+    {"_set_observed", speedups_set_observed, METH_O, set_observed_doc},
+    {NULL, NULL, 0, NULL},
+};
+
+static struct PyModuleDef speedups_module = {
+    .m_base = PyModuleDef_HEAD_INIT,
+    .m_name = "pyrfc3339._speedups",
+    .m_doc = "Compiled implementations of pyrfc3339.parse() and pyrfc3339.generate().",
+    .m_size = -1,
+    .m_methods = speedups_methods,
+};
+
+/* Fetch a new reference to an attribute of a module. */
+static PyObject *
+import_attribute(const char *module_name, const char *name)
+{
+    PyObject *module = PyImport_ImportModule(module_name), *attribute;
+
+    if (module == NULL) {
+        return NULL;
+    }
+    attribute = PyObject_GetAttrString(module, name);
+    Py_DECREF(module);
+    return attribute;
+}
+
+PyMODINIT_FUNC
+PyInit__speedups(void)
+{
+    PyObject *module;
+
+    PyDateTime_IMPORT;
+    if (PyDateTimeAPI == NULL) {
+        return NULL;
+    }
+
+    if (py_parse == NULL) {
+        if ((py_parse = import_attribute("pyrfc3339.parser", "parse")) == NULL
+            || (py_generate = import_attribute("pyrfc3339.generator", "generate")) == NULL
+            || (parser_dict = import_attribute("pyrfc3339.parser", "__dict__")) == NULL
+            || (py_fromisoformat = import_attribute("pyrfc3339.parser", "_fromisoformat")) == NULL
+            || (str_parse_default = PyUnicode_InternFromString("_parse_default")) == NULL
+            || (str_utcoffset = PyUnicode_InternFromString("utcoffset")) == NULL) {
+            Py_CLEAR(py_parse);
+            Py_CLEAR(py_generate);
+            Py_CLEAR(parser_dict);
+            Py_CLEAR(py_fromisoformat);
+            Py_CLEAR(str_parse_default);
+            return NULL;
+        }
+    }
+
+    module = PyModule_Create(&speedups_module);
+    if (module == NULL) {
+        return NULL;
+    }
+
+#ifdef Py_GIL_DISABLED
+    PyUnstable_Module_SetGIL(module, Py_MOD_GIL_NOT_USED);
+#endif
+
+    return module;
+}
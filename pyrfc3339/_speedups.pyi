@@ -0,0 +1,45 @@
+from datetime import datetime
+from typing import Literal, overload
+
+from .utils import Timestamp
+
+@overload
+def parse(
+    timestamp: str,
+    utc: bool = False,
+    produce_naive: bool = False,
+    strict: bool = False,
+    *,
+    precision: Literal["us"] = "us",
+) -> datetime: ...
+@overload
+def parse(
+    timestamp: str,
+    utc: bool = False,
+    produce_naive: bool = False,
+    strict: bool = False,
+    *,
+    precision: Literal["ns"],
+) -> Timestamp: ...
+def generate(
+    dt: datetime | Timestamp,
+    utc: bool = True,
+    accept_naive: bool = False,
+    microseconds: bool = False,
+) -> str: ...
+def _parse_fast(
+    timestamp: str,
+    utc: bool,
+    produce_naive: bool,
+    strict: bool,
+    precision: str,
+    /,
+) -> datetime | None: ...
+def _generate_fast(
+    dt: datetime | Timestamp,
+    utc: bool,
+    accept_naive: bool,
+    microseconds: bool,
+    /,
+) -> str | None: ...
+def _set_observed(observed: bool, /) -> None: ...
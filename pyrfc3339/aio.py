@@ -0,0 +1,234 @@
+"""
+Parse :RFC:`3339` timestamps from an :class:`asyncio.StreamReader` or other asynchronous source, one per line
+or from one column of a delimited stream, yielding control to the event loop between batches of records.
+
+>>> import asyncio
+>>> async def main():
+...     reader = asyncio.StreamReader()
+...     reader.feed_data(b'2009-01-01T10:01:02Z GET /\\n2009-01-01T10:01:03Z GET /favicon.ico\\n')
+...     reader.feed_eof()
+...     async for dt in aiter_parse(reader, column=0):
+...         print(dt)
+>>> asyncio.run(main())
+2009-01-01 10:01:02+00:00
+2009-01-01 10:01:03+00:00
+
+"""
+
+import asyncio
+from concurrent.futures import Executor
+from datetime import datetime
+from functools import partial
+from typing import AsyncIterable, AsyncIterator, Literal, overload
+
+from .parser import make_parser
+from .stream import DEFAULT_CHUNK_SIZE, RecordError, _parse_lines
+
+#: The number of lines :func:`aiter_parse()` parses at a time, by default, before yielding control to the event loop.
+DEFAULT_BATCH_SIZE = 4096
+
+_Source = asyncio.StreamReader | AsyncIterable[bytes | str]
+
+
+@overload
+def aiter_parse(
+    stream: _Source,
+    column: int | None = ...,
+    delimiter: str | None = ...,
+    utc: bool = ...,
+    produce_naive: bool = ...,
+    strict: bool = ...,
+    errors: Literal["raise", "skip"] = ...,
+    *,
+    output: Literal["datetime"] = ...,
+    chunk_size: int = ...,
+    batch_size: int = ...,
+    executor: Executor | None = ...,
+) -> AsyncIterator[datetime]: ...
+
+
+@overload
+def aiter_parse(
+    stream: _Source,
+    column: int | None = ...,
+    delimiter: str | None = ...,
+    utc: bool = ...,
+    produce_naive: bool = ...,
+    strict: bool = ...,
+    errors: Literal["raise", "skip"] = ...,
+    *,
+    output: Literal["epoch_us"],
+    chunk_size: int = ...,
+    batch_size: int = ...,
+    executor: Executor | None = ...,
+) -> AsyncIterator[int]: ...
+
+
+def aiter_parse(
+    stream: _Source,
+    column: int | None = None,
+    delimiter: str | None = None,
+    utc: bool = False,
+    produce_naive: bool = False,
+    strict: bool = False,
+    errors: Literal["raise", "skip"] = "raise",
+    *,
+    output: Literal["datetime", "epoch_us"] = "datetime",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    executor: Executor | None = None,
+) -> AsyncIterator[datetime | int]:
+    """
+    Lazily parse the timestamps in an asynchronous stream, one per line, as :func:`pyrfc3339.stream.iter_parse()`
+    does for a file.
+
+    :obj:`stream` may be an :class:`asyncio.StreamReader`, which is read :obj:`chunk_size` bytes at a time,
+    or any asynchronous iterable of :class:`bytes` or :class:`str` chunks, which need not be split on line boundaries.
+    Bytes are decoded as Latin-1.
+
+    Records are parsed :obj:`batch_size` lines at a time; control returns to the event loop between batches,
+    so that a large stream does not block other tasks. If an :obj:`executor` is given, each batch is parsed by it instead,
+    leaving the event loop free while it runs; a :class:`concurrent.futures.ProcessPoolExecutor` may be used.
+
+    >>> import asyncio
+    >>> async def chunks():
+    ...     yield 'id,time\\n1,2009-01-01T14:01:02-04:00\\n2,2009-01-'
+    ...     yield '01T14:01:03-04:00\\n3,tomorrow\\n'
+    >>> async def main():
+    ...     async for dt in aiter_parse(chunks(), column=1, delimiter=',', errors='skip', output='epoch_us'):
+    ...         print(dt)
+    >>> asyncio.run(main())
+    1230832862000000
+    1230832863000000
+
+    Unless :python:`errors='skip'` is specified, a record which does not contain a valid timestamp raises a
+    :exc:`~pyrfc3339.stream.RecordError` giving its line number, once the valid records before it have been produced.
+    An exception raised in another process does not carry its :attr:`~BaseException.__cause__`.
+
+    :param stream: the stream from which to read
+    :param column: as for :func:`pyrfc3339.stream.iter_parse()`
+    :type column: int or None
+    :param delimiter: as for :func:`pyrfc3339.stream.iter_parse()`
+    :type delimiter: str or None
+    :param bool utc: as for :func:`pyrfc3339.parse()`
+    :param bool produce_naive: as for :func:`pyrfc3339.parse()`
+    :param bool strict: as for :func:`pyrfc3339.parse()`
+    :param str errors: as for :func:`pyrfc3339.stream.iter_parse()`
+    :param str output: as for :func:`pyrfc3339.stream.iter_parse()`
+    :param int chunk_size: the number of bytes to read from an :class:`asyncio.StreamReader` at a time.
+                           Defaults to :data:`pyrfc3339.stream.DEFAULT_CHUNK_SIZE`.
+    :param int batch_size: the number of lines to parse at a time. Defaults to :data:`DEFAULT_BATCH_SIZE`.
+    :param executor: the executor in which to parse each batch, or :const:`None` to parse in the event loop
+    :type executor: concurrent.futures.Executor or None
+    :return: an asynchronous iterator over the parsed timestamps
+
+    """
+
+    if errors not in ("raise", "skip"):
+        raise ValueError(f"unknown error policy: {errors!r}")
+    if output not in ("datetime", "epoch_us"):
+        raise ValueError(f"unknown output: {output!r}")
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+
+    return _aiter_parse(
+        stream,
+        partial(
+            _parse_batch,
+            column=column,
+            delimiter=delimiter,
+            utc=utc,
+            produce_naive=produce_naive,
+            strict=strict,
+            errors=errors,
+            output=output,
+        ),
+        chunk_size,
+        batch_size,
+        executor,
+    )
+
+
+async def _chunks(stream: _Source, chunk_size: int) -> AsyncIterator[bytes | str]:
+    if isinstance(stream, asyncio.StreamReader):
+        while data := await stream.read(chunk_size):
+            yield data
+    else:
+        async for chunk in stream:
+            yield chunk
+
+
+async def _line_lists(stream: _Source, chunk_size: int) -> AsyncIterator[list[str]]:
+    # As for pyrfc3339.stream._lines(), but producing the complete lines of each chunk together.
+    remainder = ""
+
+    async for chunk in _chunks(stream, chunk_size):
+        text = chunk.decode("latin-1") if isinstance(chunk, bytes) else chunk
+        lines = (remainder + text).split("\n")
+        remainder = lines.pop()
+        if lines:
+            yield lines
+
+    if remainder:
+        yield [remainder]
+
+
+def _parse_batch(
+    lines: list[str],
+    first_line: int,
+    *,
+    column: int | None,
+    delimiter: str | None,
+    utc: bool,
+    produce_naive: bool,
+    strict: bool,
+    errors: str,
+    output: str,
+) -> tuple[list[datetime | int], RecordError | None]:
+    # Runs in the executor, if any, so it must be picklable and return, rather than raise, a RecordError;
+    # the values parsed before it are still to be produced.
+    values: list[datetime | int] = []
+    append = values.append
+    try:
+        for value in _parse_lines(
+            enumerate(lines, first_line),
+            column,
+            delimiter,
+            make_parser(utc, produce_naive, strict),
+            errors,
+            output,
+        ):
+            append(value)
+    except RecordError as exc:
+        return values, exc
+    return values, None
+
+
+async def _aiter_parse(
+    stream: _Source,
+    parse_batch: "partial[tuple[list[datetime | int], RecordError | None]]",
+    chunk_size: int,
+    batch_size: int,
+    executor: Executor | None,
+) -> AsyncIterator[datetime | int]:
+    loop = asyncio.get_running_loop()
+    line_number = 1
+
+    async for lines in _line_lists(stream, chunk_size):
+        for first in range(0, len(lines), batch_size):
+            last = first + batch_size
+            batch = lines[first:last]
+            if executor is None:
+                values, error = parse_batch(batch, line_number)
+            else:
+                values, error = await loop.run_in_executor(
+                    executor, partial(parse_batch, batch, line_number)
+                )
+            line_number += len(batch)
+
+            for value in values:
+                yield value
+            if error is not None:
+                raise error
+
+            await asyncio.sleep(0)
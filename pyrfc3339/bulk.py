@@ -0,0 +1,481 @@
+"""
+Parse large numbers of :RFC:`3339` timestamps: those held in fixed-width records,
+such as a column of a binary file mapped into memory with :mod:`mmap`, or those in a list, using several processes
+or, on free-threaded builds of Python, several threads.
+
+>>> import mmap, tempfile
+>>> with tempfile.TemporaryFile() as f:
+...     _ = f.write(b'2009-01-01T10:01:02Z 200\\n2009-01-01T10:01:03Z 404\\n')
+...     f.flush()
+...     with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+...         print(parse_records(m, stride=25, width=20).tolist())
+[1230804062000000, 1230804063000000]
+
+"""
+
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone, tzinfo
+from functools import partial
+from itertools import islice
+from mmap import mmap
+from typing import Callable, Iterable, Iterator, Literal, TypeVar, overload
+
+from . import generate, parse
+from .parser import make_parser
+from .utils import _MICROSECOND, _NAIVE_EPOCH, _gil_enabled, datetime_epoch_us
+
+_In = TypeVar("_In")
+_Out = TypeVar("_Out")
+
+# memoryview formats to which a Python int can be assigned as a signed 64-bit integer
+_INT64_FORMATS = (
+    ("q", "@q", "=q", "l", "@l") if array("l").itemsize == 8 else ("q", "@q", "=q")
+)
+
+_PADDING = " \0"
+
+_BLOCK_RECORDS = 4096
+
+#: The number of timestamps :func:`parse_parallel()` sends to a worker at a time, by default.
+DEFAULT_CHUNKSIZE = 16384
+
+#: The number of timestamps or datetimes :func:`parse_threaded()` and :func:`generate_threaded()`
+#: give a thread at a time, by default.
+DEFAULT_THREAD_CHUNKSIZE = 4096
+
+# The offset, in microseconds, recorded by a worker for a naive datetime; every real UTC offset is less than a day.
+_NAIVE_OFFSET = -(1 << 62)
+
+
+@overload
+def parse_records(
+    buffer: bytes | bytearray | memoryview | mmap,
+    stride: int,
+    width: int | None = ...,
+    offset: int = ...,
+    count: int | None = ...,
+    out: None = ...,
+    strict: bool = ...,
+) -> "array[int]": ...
+
+
+@overload
+def parse_records(
+    buffer: bytes | bytearray | memoryview | mmap,
+    stride: int,
+    width: int | None = ...,
+    offset: int = ...,
+    count: int | None = ...,
+    *,
+    out: _Out,
+    strict: bool = ...,
+) -> _Out: ...
+
+
+def parse_records(
+    buffer: bytes | bytearray | memoryview | mmap,
+    stride: int,
+    width: int | None = None,
+    offset: int = 0,
+    count: int | None = None,
+    out: object = None,
+    strict: bool = False,
+) -> object:
+    """
+    Parse timestamps from fixed-width records, producing the number of microseconds since the Unix epoch for each.
+
+    Record *i* occupies the :obj:`width` bytes starting at :python:`offset + i * stride` in :obj:`buffer`, which may be
+    any object supporting the buffer protocol, including :class:`bytes` and :class:`mmap.mmap`.
+    Trailing spaces and NUL bytes are ignored, so shorter timestamps may be padded to the record width.
+    Each timestamp is parsed as by :func:`pyrfc3339.parse()`, with a timestamp lacking a UTC offset being taken to be in UTC.
+
+    >>> records = b'2009-01-01T10:01:02Z       |2009-01-01T10:01:02.250000Z|'
+    >>> parse_records(records, stride=28, width=27)
+    array('q', [1230804062000000, 1230804062250000])
+
+    The results are written into :obj:`out`, if given, which must be a writable one-dimensional buffer of signed
+    64-bit integers with room for :obj:`count` values, such as :class:`array.array` with typecode ``'q'`` or a
+    NumPy array of dtype ``int64``. Otherwise, a new :class:`array.array` is returned.
+
+    An invalid record raises :exc:`ValueError` giving its index, chained to the exception raised by the parser.
+
+    >>> parse_records(b'2009-01-01T10:01:02Z2009-13-01T10:01:02Z', stride=20)
+    Traceback (most recent call last):
+    ...
+    ValueError: invalid timestamp in record 1 at byte 20: b'2009-13-01T10:01:02Z'
+
+    :param buffer: the records
+    :param int stride: the distance in bytes from the start of one record to the start of the next
+    :param width: the width in bytes of each timestamp. Defaults to :obj:`stride`.
+    :type width: int or None
+    :param int offset: the position of the first timestamp in :obj:`buffer`. Defaults to 0.
+    :param count: the number of records to parse. Defaults to as many as :obj:`buffer` holds.
+    :type count: int or None
+    :param out: a buffer to receive the results
+    :param bool strict: as for :func:`pyrfc3339.parse()`
+    :return: :obj:`out`, or a new :class:`array.array` of typecode ``'q'``
+
+    """
+
+    if width is None:
+        width = stride
+    if stride <= 0 or width <= 0 or offset < 0:
+        raise ValueError(
+            "stride and width must be positive and offset must not be negative"
+        )
+
+    view = memoryview(buffer).cast("B")
+    available = (
+        (len(view) - offset - width) // stride + 1 if len(view) >= offset + width else 0
+    )
+    if count is None:
+        count = available
+    elif not 0 <= count <= available:
+        raise ValueError(f"buffer holds {available} records, not {count}")
+
+    if out is None:
+        out = array("q", bytes(8 * count))
+    target = memoryview(out)  # type: ignore[arg-type]
+    if target.ndim != 1 or target.readonly or target.format not in _INT64_FORMATS:
+        raise TypeError(
+            "out must be a writable one-dimensional buffer of signed 64-bit integers"
+        )
+    if len(target) < count:
+        raise ValueError(f"out has room for {len(target)} values, not {count}")
+
+    parse_one = make_parser(False, False, strict)
+    # Store each block of results with a single slice assignment, whichever 64-bit format the target reports.
+    target = target.cast("B").cast("q")
+
+    for first in range(0, count, _BLOCK_RECORDS):
+        last = min(first + _BLOCK_RECORDS, count)
+        # Decode a block of records at once; this is as fast as any pure-Python field scanner, and
+        # Latin-1 cannot fail. Any non-ASCII character in a timestamp is rejected by the parser.
+        block_start = offset + first * stride
+        block_end = block_start + (last - first - 1) * stride + width
+        text = str(view[block_start:block_end], "latin-1")
+
+        values: list[int] = []
+        append = values.append
+        try:
+            for start, end in zip(
+                range(0, len(text), stride), range(width, len(text) + 1, stride)
+            ):
+                append(datetime_epoch_us(parse_one(text[start:end].rstrip(_PADDING))))
+        except ValueError as exc:
+            index = first + len(values)
+            start = offset + index * stride
+            end = start + width
+            raise ValueError(
+                f"invalid timestamp in record {index} at byte {start}: {bytes(view[start:end])!r}"
+            ) from exc
+
+        target[first:last] = array("q", values)
+
+    return out
+
+
+@overload
+def parse_parallel(
+    timestamps: Iterable[str],
+    workers: int | None = ...,
+    chunksize: int = ...,
+    output: Literal["epoch_us"] = ...,
+    utc: bool = ...,
+    produce_naive: bool = ...,
+    strict: bool = ...,
+) -> "array[int]": ...
+
+
+@overload
+def parse_parallel(
+    timestamps: Iterable[str],
+    workers: int | None = ...,
+    chunksize: int = ...,
+    *,
+    output: Literal["datetime"],
+    utc: bool = ...,
+    produce_naive: bool = ...,
+    strict: bool = ...,
+) -> list[datetime]: ...
+
+
+def parse_parallel(
+    timestamps: Iterable[str],
+    workers: int | None = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    output: Literal["epoch_us", "datetime"] = "epoch_us",
+    utc: bool = False,
+    produce_naive: bool = False,
+    strict: bool = False,
+) -> "array[int] | list[datetime]":
+    """
+    Parse timestamps in a pool of worker processes, producing the results in order.
+
+    The timestamps are sent to the workers :obj:`chunksize` at a time. Each worker returns its results as
+    arrays of integers, which are far cheaper to transfer than :class:`~datetime.datetime` instances.
+
+    >>> timestamps = ['2009-01-01T10:01:02Z', '2009-01-01T14:01:03-04:00'] * 3
+    >>> parse_parallel(timestamps, workers=2, chunksize=2)
+    array('q', [1230804062000000, 1230832863000000, 1230804062000000, 1230832863000000, 1230804062000000, 1230832863000000])
+    >>> parse_parallel(timestamps[:2], workers=1, output='datetime')[1]
+    datetime.datetime(2009, 1, 1, 14, 1, 3, tzinfo=datetime.timezone(datetime.timedelta(days=-1, seconds=72000)))
+
+    With :python:`output='epoch_us'`, the default, each timestamp produces the number of microseconds since the Unix epoch,
+    a timestamp lacking a UTC offset being taken to be in UTC. With :python:`output='datetime'`, the
+    :class:`~datetime.datetime` instances are rebuilt from those integers in this process, which is a substantial serial
+    cost; parallel parsing pays off most when integers are wanted.
+
+    An invalid timestamp raises :exc:`ValueError` giving its index.
+
+    >>> parse_parallel(['2009-01-01T10:01:02Z', '2009-13-01T10:01:02Z'], workers=1)
+    Traceback (most recent call last):
+    ...
+    ValueError: invalid timestamp at index 1: '2009-13-01T10:01:02Z'
+
+    :param timestamps: the timestamps to parse
+    :param workers: the number of worker processes. Defaults to the number of CPUs.
+    :type workers: int or None
+    :param int chunksize: the number of timestamps to send to a worker at a time. Defaults to :data:`DEFAULT_CHUNKSIZE`.
+    :param str output: ``"epoch_us"`` or ``"datetime"``. Defaults to ``"epoch_us"``.
+    :param bool utc: as for :func:`pyrfc3339.parse()`
+    :param bool produce_naive: as for :func:`pyrfc3339.parse()`
+    :param bool strict: as for :func:`pyrfc3339.parse()`
+    :return: a new :class:`array.array` of typecode ``'q'``, or a list of :class:`~datetime.datetime` instances
+
+    """
+
+    if output not in ("epoch_us", "datetime"):
+        raise ValueError(f"unknown output: {output!r}")
+    if chunksize <= 0:
+        raise ValueError("chunksize must be positive")
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    with_offsets = output == "datetime"
+    values = array("q")
+    offsets = array("q")
+
+    parse_chunk = partial(
+        _parse_chunk,
+        utc=utc,
+        produce_naive=produce_naive,
+        strict=strict,
+        with_offsets=with_offsets,
+    )
+
+    with ProcessPoolExecutor(workers) as executor:
+        for chunk_values, chunk_offsets in executor.map(
+            parse_chunk, _chunks(timestamps, chunksize)
+        ):
+            values.extend(chunk_values)
+            offsets.extend(chunk_offsets)
+
+    if not with_offsets:
+        return values
+
+    return _rebuild(values, offsets)
+
+
+def _chunks(
+    timestamps: Iterable[str], chunksize: int
+) -> Iterator[tuple[int, str | list[str]]]:
+    # A single string pickles in about half the time of a list of its lines,
+    # so join each chunk unless one of the timestamps itself contains a line break.
+    iterator = iter(timestamps)
+    start = 0
+    while chunk := list(islice(iterator, chunksize)):
+        joined = "\n".join(chunk)
+        yield start, joined if joined.count("\n") == len(chunk) - 1 else chunk
+        start += len(chunk)
+
+
+def _parse_chunk(
+    chunk: tuple[int, str | list[str]],
+    *,
+    utc: bool,
+    produce_naive: bool,
+    strict: bool,
+    with_offsets: bool,
+) -> "tuple[array[int], array[int]]":
+    # Runs in a worker process.
+    start, lines = chunk
+    timestamps = lines.split("\n") if isinstance(lines, str) else lines
+    parse_one = make_parser(utc, produce_naive, strict)
+    values = array("q")
+    offsets = array("q")
+
+    try:
+        for timestamp in timestamps:
+            dt = parse_one(timestamp)
+            values.append(datetime_epoch_us(dt))
+            if with_offsets:
+                offset = dt.utcoffset()
+                offsets.append(
+                    _NAIVE_OFFSET if offset is None else offset // _MICROSECOND
+                )
+    except ValueError as exc:
+        index = len(values)
+        raise ValueError(
+            f"invalid timestamp at index {start + index}: {timestamps[index]!r}"
+        ) from exc
+
+    return values, offsets
+
+
+def _rebuild(values: "array[int]", offsets: "array[int]") -> list[datetime]:
+    zones: dict[int, tzinfo] = {}
+    result: list[datetime] = []
+    append = result.append
+
+    for epoch_us, offset in zip(values, offsets):
+        if offset == _NAIVE_OFFSET:
+            append(_NAIVE_EPOCH + timedelta(microseconds=epoch_us))
+            continue
+        zone = zones.get(offset)
+        if zone is None:
+            zone = zones[offset] = timezone(timedelta(microseconds=offset))
+        local = _NAIVE_EPOCH + timedelta(microseconds=epoch_us + offset)
+        append(local.replace(tzinfo=zone))
+
+    return result
+
+
+def parse_threaded(
+    timestamps: Iterable[str],
+    workers: int | None = None,
+    chunksize: int = DEFAULT_THREAD_CHUNKSIZE,
+    utc: bool = False,
+    produce_naive: bool = False,
+    strict: bool = False,
+) -> list[datetime]:
+    """
+    Parse timestamps in a pool of threads, producing :class:`~datetime.datetime` instances in order.
+
+    >>> parse_threaded(['2009-01-01T10:01:02Z', '2009-01-01T14:01:03-04:00'], workers=2, chunksize=1)[1]
+    datetime.datetime(2009, 1, 1, 14, 1, 3, tzinfo=datetime.timezone(datetime.timedelta(days=-1, seconds=72000)))
+
+    Threads parse in parallel only on a free-threaded build of Python running without the GIL
+    (see :func:`sys._is_gil_enabled()`). With the GIL, they would take turns, so the timestamps are parsed
+    in the calling thread instead. Unlike :func:`parse_parallel()`, nothing is copied between processes,
+    so the :class:`~datetime.datetime` instances are produced directly.
+
+    An invalid timestamp raises :exc:`ValueError` giving its index.
+
+    >>> parse_threaded(['2009-01-01T10:01:02Z', '2009-13-01T10:01:02Z'])
+    Traceback (most recent call last):
+    ...
+    ValueError: invalid timestamp at index 1: '2009-13-01T10:01:02Z'
+
+    :param timestamps: the timestamps to parse
+    :param workers: the number of threads. Defaults to the number of CPUs.
+    :type workers: int or None
+    :param int chunksize: the number of timestamps to give a thread at a time.
+                          Defaults to :data:`DEFAULT_THREAD_CHUNKSIZE`.
+    :param bool utc: as for :func:`pyrfc3339.parse()`
+    :param bool produce_naive: as for :func:`pyrfc3339.parse()`
+    :param bool strict: as for :func:`pyrfc3339.parse()`
+    :return: the parsed timestamps
+    :rtype: list[datetime.datetime]
+
+    """
+
+    parse_chunk = partial(
+        _convert_chunk, parse, (utc, produce_naive, strict), "timestamp"
+    )
+    return _map_threaded(parse_chunk, timestamps, workers, chunksize)
+
+
+def generate_threaded(
+    datetimes: Iterable[datetime],
+    workers: int | None = None,
+    chunksize: int = DEFAULT_THREAD_CHUNKSIZE,
+    utc: bool = True,
+    accept_naive: bool = False,
+    microseconds: bool = False,
+) -> list[str]:
+    """
+    Generate timestamps for :class:`~datetime.datetime` instances in a pool of threads, producing them in order.
+
+    >>> from datetime import datetime, timezone
+    >>> generate_threaded([datetime(2009, 1, 1, 10, 1, second, tzinfo=timezone.utc) for second in (2, 3)], workers=2)
+    ['2009-01-01T10:01:02Z', '2009-01-01T10:01:03Z']
+
+    As for :func:`parse_threaded()`, threads are used only on a free-threaded build of Python running without the GIL;
+    otherwise, the timestamps are generated in the calling thread. A :class:`~datetime.datetime` which
+    :func:`pyrfc3339.generate()` would reject raises :exc:`ValueError` giving its index.
+
+    :param datetimes: the :class:`~datetime.datetime` instances for which to generate timestamps
+    :param workers: the number of threads. Defaults to the number of CPUs.
+    :type workers: int or None
+    :param int chunksize: the number of datetimes to give a thread at a time.
+                          Defaults to :data:`DEFAULT_THREAD_CHUNKSIZE`.
+    :param bool utc: as for :func:`pyrfc3339.generate()`
+    :param bool accept_naive: as for :func:`pyrfc3339.generate()`
+    :param bool microseconds: as for :func:`pyrfc3339.generate()`
+    :return: the generated timestamps
+    :rtype: list[str]
+
+    """
+
+    generate_chunk = partial(
+        _convert_chunk, generate, (utc, accept_naive, microseconds), "datetime"
+    )
+    return _map_threaded(generate_chunk, datetimes, workers, chunksize)
+
+
+def _map_threaded(
+    convert_chunk: Callable[[tuple[int, list[_In]]], list[_Out]],
+    items: Iterable[_In],
+    workers: int | None,
+    chunksize: int,
+) -> list[_Out]:
+    # Convert the items a chunk at a time in a pool of threads, or in this thread if they would not run in parallel.
+    if chunksize <= 0:
+        raise ValueError("chunksize must be positive")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    elif workers <= 0:
+        raise ValueError("workers must be positive")
+
+    if workers == 1 or _gil_enabled():
+        return convert_chunk((0, list(items)))
+
+    result: list[_Out] = []
+    # parse() and generate(), compiled or not, hold no state of their own, and the caches they may use are
+    # safe to share between threads.
+    with ThreadPoolExecutor(workers) as executor:
+        for converted in executor.map(convert_chunk, _list_chunks(items, chunksize)):
+            result += converted
+    return result
+
+
+def _list_chunks(
+    items: Iterable[_In], chunksize: int
+) -> Iterator[tuple[int, list[_In]]]:
+    iterator = iter(items)
+    start = 0
+    while chunk := list(islice(iterator, chunksize)):
+        yield start, chunk
+        start += len(chunk)
+
+
+def _convert_chunk(
+    convert: Callable[..., _Out],
+    options: tuple[bool, ...],
+    kind: str,
+    chunk: tuple[int, list[_In]],
+) -> list[_Out]:
+    # Pass the options positionally: calling the compiled functions with keywords, or through a partial with
+    # keywords, costs more than the conversion itself.
+    start, items = chunk
+    results: list[_Out] = []
+    append = results.append
+    try:
+        for index, item in enumerate(items):
+            append(convert(item, *options))
+    except ValueError as exc:
+        raise ValueError(f"invalid {kind} at index {start + index}: {item!r}") from exc
+    return results
@@ -1,9 +1,175 @@
-import re
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Iterable,
+    Iterator,
+    Literal,
+    Protocol,
+    overload,
+)
+
+from . import utils
+from .utils import CacheInfo, LRUCache, Timestamp, _cached_utcoffset
+
+if TYPE_CHECKING:
+    from .instrumentation import _Observer
+
+
+class _SupportsWrite(Protocol):
+    """
+    Any object with a :meth:`~io.TextIOBase.write()` method accepting :class:`str`,
+    such as a :class:`io.TextIOBase` instance.
+
+    """
+
+    def write(self, s: str, /) -> object: ...
+
+
+#: The number of timestamps :func:`write_many()` renders before each write.
+WRITE_CHUNK_SIZE = 1024
+
+_NAIVE_EPOCH = datetime(1970, 1, 1)
+
+# Set by pyrfc3339.instrumentation while it is enabled.
+_observer: "_Observer | None" = None
+
+
+def configure_caches(offset_size: int = 0) -> None:
+    """
+    Enable, resize or disable the cache of UTC offsets used by :func:`make_generator()` and the functions built on it,
+    by :class:`Rfc3339Formatter`, by the Python implementation of :func:`generate()`,
+    and by :func:`pyrfc3339.utils.datetime_utcoffset()`.
+    The cache is disabled by default, and reconfiguring it discards its contents and statistics.
+
+    When the cache is enabled, the offset of a :class:`~datetime.datetime` whose :attr:`~datetime.datetime.tzinfo`
+    is not a fixed :class:`datetime.timezone`, such as a :class:`zoneinfo.ZoneInfo`, is remembered for the rest of
+    the hour, along with its rendering, and reused for other datetimes in the same zone and hour. The datetime is then
+    formatted without consulting its zone again, which pays off most for zones whose offsets are computed in Python.
+    The compiled :func:`generate()` resolves offsets itself, faster still, and does not use the cache.
+
+    >>> from datetime import datetime
+    >>> from zoneinfo import ZoneInfo
+    >>> configure_caches(offset_size=256)
+    >>> eastern = ZoneInfo('US/Eastern')
+    >>> generate_many([datetime(2009, 1, 1, 12, minute, tzinfo=eastern) for minute in (0, 30)], utc=False)
+    ['2009-01-01T12:00:00-05:00', '2009-01-01T12:30:00-05:00']
+    >>> cache_info()
+    CacheInfo(hits=1, misses=1, evictions=0, maxsize=256, currsize=1)
+    >>> configure_caches()
+
+    Offsets are cached by zone, local date and hour, and :attr:`~datetime.datetime.fold`, so the transitions
+    into and out of daylight saving time are handled as :meth:`~datetime.datetime.utcoffset()` would handle them.
+    An hour during which the offset changes is never cached.
+
+    :param int offset_size: the number of zone-hours to remember, or ``0`` to disable the cache
+
+    """
+
+    if offset_size < 0:
+        raise ValueError("cache sizes must not be negative")
+
+    utils._offset_cache = LRUCache(offset_size) if offset_size else None
+
+
+def cache_info() -> CacheInfo:
+    """
+    Return the statistics for the cache configured with :func:`configure_caches()`.
+    A disabled cache is reported with a :attr:`~pyrfc3339.utils.CacheInfo.maxsize` of ``0``.
+
+    """
+
+    cache = utils._offset_cache
+    return cache.info() if cache is not None else CacheInfo(0, 0, 0, 0, 0)
+
+
+def cache_clear() -> None:
+    """
+    Discard the contents and statistics of the cache configured with :func:`configure_caches()`.
+
+    """
+
+    cache = utils._offset_cache
+    if cache is not None:
+        cache.clear()
+
+
+def _generate_cached(dt: datetime, utc: bool, timespec: str) -> str | None:
+    # Generate a timestamp for an aware datetime using the offset cache, or return None if it cannot.
+    cached = _cached_utcoffset(dt)
+    if cached is None:
+        return None
+
+    local = dt - cached.anchor
+    if utc:
+        return (cached.utc_epoch + local).isoformat("T", timespec) + "Z"
+    suffix = cached.suffix
+    if suffix == "+00:00" and dt.tzinfo == timezone.utc:
+        suffix = "Z"
+    return (_NAIVE_EPOCH + local).isoformat("T", timespec) + suffix
+
+
+def make_generator(
+    utc: bool = True, accept_naive: bool = False, microseconds: bool = False
+) -> Callable[[datetime], str]:
+    """
+    Return a function which generates an :RFC:`3339`-formatted timestamp for a single :class:`datetime.datetime`
+    as :func:`generate()` would with the given options. The options are examined once, when the function is made,
+    rather than on every call, which suits a loop generating many timestamps.
+
+    >>> from datetime import datetime, timezone
+    >>> generate_precise = make_generator(microseconds=True)
+    >>> generate_precise(datetime(2009, 1, 1, 12, 59, 59, 250000, tzinfo=timezone.utc))
+    '2009-01-01T12:59:59.250000Z'
+
+    :param bool utc: as for :func:`generate()`
+    :param bool accept_naive: as for :func:`generate()`
+    :param bool microseconds: as for :func:`generate()`
+    :return: a function accepting a :class:`~datetime.datetime` and returning a timestamp
+
+    """
+
+    timespec = "microseconds" if microseconds else "seconds"
+
+    if utc:
+
+        def generate_utc(dt: datetime) -> str:
+            tz = dt.tzinfo
+            if tz is None:
+                if accept_naive:
+                    return dt.isoformat("T", timespec) + "Z"
+                raise ValueError("naive datetime and accept_naive is False")
+            if tz is not timezone.utc:
+                timestamp = _generate_cached(dt, True, timespec)
+                if timestamp is not None:
+                    return timestamp
+                dt = dt.astimezone(timezone.utc)
+            return dt.isoformat("T", timespec)[:-6] + "Z"
+
+        return generate_utc
+
+    def generate_local(dt: datetime) -> str:
+        tz = dt.tzinfo
+        if tz is None:
+            if accept_naive:
+                raise ValueError(
+                    "cannot generate a local timestamp from a naive datetime"
+                )
+            raise ValueError("naive datetime and accept_naive is False")
+        cached = _generate_cached(dt, False, timespec)
+        if cached is not None:
+            return cached
+        timestamp = dt.isoformat("T", timespec)
+        if tz == timezone.utc:
+            timestamp = timestamp[:-6] + "Z"
+        return timestamp
+
+    return generate_local
 
 
 def generate(
-    dt: datetime,
+    dt: datetime | Timestamp,
     utc: bool = True,
     accept_naive: bool = False,
     microseconds: bool = False,
@@ -11,7 +177,7 @@ def generate(
     """
     Generate an :RFC:`3339`-formatted timestamp from a :class:`datetime.datetime`.
 
-    >>> from datetime import datetime, timezone
+    >>> from datetime import datetime, timedelta, timezone, tzinfo
     >>> from zoneinfo import ZoneInfo
     >>> generate(datetime(2009, 1, 1, 12, 59, 59, 0, timezone.utc))
     '2009-01-01T12:59:59Z'
@@ -44,7 +210,16 @@ def generate(
     ...
     ValueError: cannot generate a local timestamp from a naive datetime
 
-    :param datetime.datetime dt: the :class:`~datetime.datetime` for which to generate an :RFC:`3339` timestamp.
+    A :class:`~pyrfc3339.utils.Timestamp`, as returned by :python:`parse(timestamp, precision='ns')`, may be given in place
+    of a :class:`~datetime.datetime`, in which case :python:`microseconds=True` produces all 9 fractional digits.
+
+    >>> from pyrfc3339.utils import Timestamp
+    >>> generate(Timestamp(1230832799, 123456789, -300), utc=False, microseconds=True)
+    '2009-01-01T12:59:59.123456789-05:00'
+
+    :param dt: the :class:`~datetime.datetime` or :class:`~pyrfc3339.utils.Timestamp` for which to generate
+               an :RFC:`3339` timestamp.
+    :type dt: datetime.datetime or pyrfc3339.utils.Timestamp
     :param bool utc: :const:`True` to normalize the supplied :class:`datetime.datetime` to UTC; :const:`False` otherwise.
                      Defaults to :const:`True`.
     :param bool accept_naive: :const:`True` if :func:`generate()` should accept a 'naive' datetime
@@ -59,6 +234,14 @@ def generate(
 
     """
 
+    if _observer is not None and not _observer.busy:
+        return _observer.generate(dt, utc, accept_naive, microseconds)
+
+    if isinstance(dt, Timestamp):
+        return generate_from_epoch(
+            dt.epoch_ns, 0 if utc else dt.offset_minutes, nanoseconds=microseconds
+        )
+
     if dt.tzinfo is None:
         if accept_naive:
             if utc:
@@ -70,12 +253,519 @@ def generate(
         else:
             raise ValueError("naive datetime and accept_naive is False")
 
+    timespec = "microseconds" if microseconds else "seconds"
+
+    if dt.tzinfo is not timezone.utc:
+        cached = _generate_cached(dt, utc, timespec)
+        if cached is not None:
+            return cached
+
     if utc:
         dt = dt.astimezone(timezone.utc)
 
-    timestamp = dt.isoformat(timespec="microseconds" if microseconds else "seconds")
+    timestamp = dt.isoformat(timespec=timespec)
 
     if dt.tzinfo == timezone.utc:
-        timestamp = re.sub(r"\+00:00$", "Z", timestamp)
+        timestamp = timestamp[:-6] + "Z"
 
     return timestamp
+
+
+def generate_from_epoch(
+    epoch_ns: int,
+    offset_minutes: int = 0,
+    microseconds: bool = False,
+    nanoseconds: bool = False,
+) -> str:
+    """
+    Generate an :RFC:`3339`-formatted timestamp from a number of nanoseconds since the Unix epoch.
+
+    >>> generate_from_epoch(1230832862123456789)
+    '2009-01-01T18:01:02Z'
+
+    The timestamp is expressed with the given UTC offset, in minutes; an offset of zero is written as ``Z``.
+
+    >>> generate_from_epoch(1230832862123456789, offset_minutes=-240, microseconds=True)
+    '2009-01-01T14:01:02.123456-04:00'
+    >>> generate_from_epoch(-1, nanoseconds=True)
+    '1969-12-31T23:59:59.999999999Z'
+
+    The result is the same as :func:`generate()` would produce for the equivalent :class:`datetime.datetime`.
+    As with :func:`generate()`, fractional seconds are truncated, not rounded.
+
+    :param int epoch_ns: the number of nanoseconds since 1970-01-01T00:00:00Z
+    :param int offset_minutes: the UTC offset of the timestamp, in minutes. Defaults to 0.
+    :param bool microseconds: :const:`True` to include 6 fractional digits; :const:`False` otherwise.
+                              Defaults to :const:`False`.
+    :param bool nanoseconds: :const:`True` to include 9 fractional digits; :const:`False` otherwise.
+                             Takes precedence over :obj:`microseconds`. Defaults to :const:`False`.
+    :return: an :RFC:`3339` timestamp
+    :rtype: str
+
+    """
+
+    if not -1440 < offset_minutes < 1440:
+        raise ValueError("offset_minutes must be strictly between -1440 and 1440")
+
+    seconds, fraction = divmod(epoch_ns, 1_000_000_000)
+
+    # Adding whole seconds to a naive datetime and formatting it in C outpaces
+    # civil-calendar arithmetic and string formatting in Python.
+    try:
+        timestamp = (
+            _NAIVE_EPOCH + timedelta(seconds=seconds + offset_minutes * 60)
+        ).isoformat()
+    except OverflowError:
+        raise ValueError(f"{epoch_ns} is out of range") from None
+
+    if nanoseconds:
+        timestamp += f".{fraction:09d}"
+    elif microseconds:
+        timestamp += f".{fraction // 1000:06d}"
+
+    if offset_minutes == 0:
+        return timestamp + "Z"
+
+    sign = "-" if offset_minutes < 0 else "+"
+    hours, minutes = divmod(abs(offset_minutes), 60)
+
+    return f"{timestamp}{sign}{hours:02d}:{minutes:02d}"
+
+
+def generate_bytes(
+    dt: datetime,
+    utc: bool = True,
+    accept_naive: bool = False,
+    microseconds: bool = False,
+) -> bytes:
+    """
+    Generate an ASCII-encoded :RFC:`3339`-formatted timestamp for a :class:`datetime.datetime` instance.
+
+    >>> from datetime import datetime, timezone
+    >>> generate_bytes(datetime(2009, 1, 1, 12, 59, 59, tzinfo=timezone.utc))
+    b'2009-01-01T12:59:59Z'
+
+    The options and exceptions are exactly those of :func:`generate()`.
+
+    :param datetime.datetime dt: the :class:`~datetime.datetime` for which to generate an :RFC:`3339` timestamp
+    :param bool utc: as for :func:`generate()`
+    :param bool accept_naive: as for :func:`generate()`
+    :param bool microseconds: as for :func:`generate()`
+    :return: an :RFC:`3339` timestamp
+    :rtype: bytes
+
+    """
+
+    return generate(dt, utc, accept_naive, microseconds).encode("ascii")
+
+
+def generate_into(
+    buffer: bytearray | memoryview,
+    offset: int,
+    dt: datetime,
+    utc: bool = True,
+    accept_naive: bool = False,
+    microseconds: bool = False,
+) -> int:
+    """
+    Generate an ASCII-encoded :RFC:`3339`-formatted timestamp for a :class:`datetime.datetime` instance,
+    writing it into a writable buffer at the given offset.
+
+    >>> from datetime import datetime, timezone
+    >>> buffer = bytearray(b'Date: ' + bytes(20) + b'\\r\\n')
+    >>> generate_into(buffer, 6, datetime(2009, 1, 1, 12, 59, 59, tzinfo=timezone.utc))
+    20
+    >>> buffer
+    bytearray(b'Date: 2009-01-01T12:59:59Z\\r\\n')
+
+    The buffer is never resized: a :exc:`ValueError` is raised if the timestamp does not fit.
+    The options and other exceptions are exactly those of :func:`generate()`.
+
+    :param buffer: the buffer into which to write the timestamp
+    :type buffer: bytearray or memoryview
+    :param int offset: the position in :obj:`buffer` at which to write the timestamp
+    :param datetime.datetime dt: the :class:`~datetime.datetime` for which to generate an :RFC:`3339` timestamp
+    :param bool utc: as for :func:`generate()`
+    :param bool accept_naive: as for :func:`generate()`
+    :param bool microseconds: as for :func:`generate()`
+    :return: the number of bytes written
+    :rtype: int
+
+    """
+
+    timestamp = generate(dt, utc, accept_naive, microseconds).encode("ascii")
+    target = memoryview(buffer).cast("B")
+    end = offset + len(timestamp)
+
+    if offset < 0 or end > len(target):
+        raise ValueError(
+            f"{len(timestamp)} bytes do not fit in a buffer of {len(target)} bytes at offset {offset}"
+        )
+
+    target[offset:end] = timestamp
+
+    return len(timestamp)
+
+
+@overload
+def generate_many(
+    datetimes: Iterable[datetime],
+    utc: bool = ...,
+    accept_naive: bool = ...,
+    microseconds: bool = ...,
+    *,
+    lazy: Literal[False] = ...,
+) -> list[str]: ...
+
+
+@overload
+def generate_many(
+    datetimes: Iterable[datetime],
+    utc: bool = ...,
+    accept_naive: bool = ...,
+    microseconds: bool = ...,
+    *,
+    lazy: Literal[True],
+) -> Iterator[str]: ...
+
+
+def generate_many(
+    datetimes: Iterable[datetime],
+    utc: bool = True,
+    accept_naive: bool = False,
+    microseconds: bool = False,
+    *,
+    lazy: bool = False,
+) -> list[str] | Iterator[str]:
+    """
+    Generate :RFC:`3339`-formatted timestamps for many :class:`datetime.datetime` instances at once.
+
+    The options are interpreted exactly as for :func:`generate()`, but are examined only once
+    for the whole batch rather than once per :class:`~datetime.datetime`.
+
+    >>> from datetime import datetime, timedelta, timezone
+    >>> eastern = timezone(timedelta(hours=-5))
+    >>> generate_many([datetime(2009, 1, 1, 12, 59, 59, tzinfo=eastern), datetime(2009, 1, 1, 12, 59, 59, tzinfo=timezone.utc)])
+    ['2009-01-01T17:59:59Z', '2009-01-01T12:59:59Z']
+    >>> generate_many([datetime(2009, 1, 1, 12, 59, 59, tzinfo=eastern)], utc=False)
+    ['2009-01-01T12:59:59-05:00']
+
+    With :python:`lazy=True`, an iterator is returned instead of a list.
+
+    >>> next(generate_many(iter([datetime(2009, 1, 1, 12, 59, 59, 250000, tzinfo=eastern)]), microseconds=True, lazy=True))
+    '2009-01-01T17:59:59.250000Z'
+
+    :param datetimes: the :class:`~datetime.datetime` instances for which to generate :RFC:`3339` timestamps
+    :type datetimes: typing.Iterable[datetime.datetime]
+    :param bool utc: as for :func:`generate()`
+    :param bool accept_naive: as for :func:`generate()`
+    :param bool microseconds: as for :func:`generate()`
+    :param bool lazy: :const:`True` to return an iterator; :const:`False` to return a list. Defaults to :const:`False`.
+    :return: the generated timestamps, in the order in which the datetimes were supplied
+
+    """
+
+    results = map(make_generator(utc, accept_naive, microseconds), datetimes)
+
+    return results if lazy else list(results)
+
+
+def write_many(
+    datetimes: Iterable[datetime],
+    out: _SupportsWrite | bytearray,
+    separator: str = "\n",
+    utc: bool = True,
+    accept_naive: bool = False,
+    microseconds: bool = False,
+) -> int:
+    """
+    Generate :RFC:`3339`-formatted timestamps for many :class:`datetime.datetime` instances,
+    writing them to a text stream or appending them (ASCII-encoded) to a :class:`bytearray`.
+
+    Timestamps are rendered and written in chunks of :data:`WRITE_CHUNK_SIZE`, so
+    the output is never held in memory in its entirety.
+
+    >>> import io
+    >>> from datetime import datetime, timedelta, timezone, tzinfo
+    >>> out = io.StringIO()
+    >>> write_many([datetime(2009, 1, 1, 12, 59, 59, tzinfo=timezone.utc)] * 2, out, separator=',')
+    2
+    >>> out.getvalue()
+    '2009-01-01T12:59:59Z,2009-01-01T12:59:59Z'
+
+    >>> buffer = bytearray(b'[')
+    >>> write_many([datetime(2009, 1, 1, 12, 59, 59, tzinfo=timezone.utc)], buffer)
+    1
+    >>> buffer
+    bytearray(b'[2009-01-01T12:59:59Z')
+
+    The options are interpreted exactly as for :func:`generate()`.
+
+    :param datetimes: the :class:`~datetime.datetime` instances for which to generate :RFC:`3339` timestamps
+    :type datetimes: typing.Iterable[datetime.datetime]
+    :param out: the text stream or :class:`bytearray` to which to write the timestamps
+    :param str separator: the separator to write between timestamps. Defaults to a newline.
+    :param bool utc: as for :func:`generate()`
+    :param bool accept_naive: as for :func:`generate()`
+    :param bool microseconds: as for :func:`generate()`
+    :return: the number of timestamps written
+    :rtype: int
+
+    """
+
+    results = map(make_generator(utc, accept_naive, microseconds), datetimes)
+
+    write: Callable[[str], object]
+
+    if isinstance(out, bytearray):
+
+        def write(s: str) -> None:
+            out.extend(s.encode("ascii"))
+
+    else:
+        write = out.write
+
+    count = 0
+
+    while chunk := list(islice(results, WRITE_CHUNK_SIZE)):
+        if count:
+            write(separator)
+        write(separator.join(chunk))
+        count += len(chunk)
+
+    return count
+
+
+# Two-digit renderings of the numbers 0 to 59, for rendering seconds without a format specification.
+_TWO_DIGITS = [f"{number:02d}" for number in range(60)]
+
+
+class Rfc3339Formatter:
+    """
+    A stateful equivalent of :func:`generate()` with fixed options, for streams of timestamps which,
+    like those of a log, usually fall within the same minute as their predecessor.
+
+    The formatter remembers the date, hour and minute of the last timestamp it generated, along with its UTC offset,
+    and when they still apply it renders only the seconds (and fractional seconds); otherwise it falls back
+    to :func:`generate()`. Its output is always identical to that of :func:`generate()` with the same options.
+
+    >>> from datetime import datetime, timezone
+    >>> formatter = Rfc3339Formatter(microseconds=True)
+    >>> formatter(datetime(2009, 1, 1, 12, 59, 58, 250000, tzinfo=timezone.utc))
+    '2009-01-01T12:59:58.250000Z'
+    >>> formatter(datetime(2009, 1, 1, 12, 59, 59, tzinfo=timezone.utc))
+    '2009-01-01T12:59:59.000000Z'
+
+    A formatter is not thread-safe; each thread should use its own.
+
+    :param bool utc: as for :func:`generate()`
+    :param bool accept_naive: as for :func:`generate()`
+    :param bool microseconds: as for :func:`generate()`
+
+    """
+
+    def __init__(
+        self, utc: bool = True, accept_naive: bool = False, microseconds: bool = False
+    ) -> None:
+        self.utc = utc
+        self.accept_naive = accept_naive
+        self.microseconds = microseconds
+
+        self._generate = make_generator(utc, accept_naive, microseconds)
+        self._suffix_start = 26 if microseconds else 19
+        # The date, hour and minute of the last timestamp generated, as (minute, hour, day, month, year).
+        self._key: tuple[int, int, int, int, int] | None = None
+        self._prefix = ""
+        self._tzinfo: tzinfo | None = None
+        self._offset: timedelta | None = None
+        self._suffix = ""
+
+    def format(self, dt: datetime) -> str:
+        """
+        Generate an :RFC:`3339`-formatted timestamp from a :class:`datetime.datetime`, as :func:`generate()` would.
+
+        :param datetime.datetime dt: the :class:`~datetime.datetime` for which to generate an :RFC:`3339` timestamp.
+        :return: the supplied :class:`~datetime.datetime` instance represented as an :RFC:`3339` timestamp
+        :rtype: str
+
+        """
+
+        tz = dt.tzinfo
+
+        if self.utc:
+            if tz is None:
+                if not self.accept_naive:
+                    raise ValueError("naive datetime and accept_naive is False")
+            elif tz is not timezone.utc:
+                dt = dt.astimezone(timezone.utc)
+                tz = timezone.utc
+            offset = None
+        elif tz is None:
+            return self._generate(dt)
+        else:
+            cached = _cached_utcoffset(dt)
+            offset = dt.utcoffset() if cached is None else cached.offset
+
+        if (
+            tz is self._tzinfo
+            and offset == self._offset
+            and (dt.minute, dt.hour, dt.day, dt.month, dt.year) == self._key
+        ):
+            if self.microseconds:
+                return (
+                    f"{self._prefix}{dt.second:02d}.{dt.microsecond:06d}{self._suffix}"
+                )
+            return f"{self._prefix}{dt.second:02d}{self._suffix}"
+
+        timestamp = self._generate(dt)
+
+        self._key = (dt.minute, dt.hour, dt.day, dt.month, dt.year)
+        self._prefix = timestamp[:17]
+        self._tzinfo = tz
+        self._offset = offset
+        suffix_start = self._suffix_start
+        self._suffix = timestamp[suffix_start:]
+
+        return timestamp
+
+    __call__ = format
+
+
+def generate_range(
+    start: datetime,
+    stop: datetime,
+    step: timedelta,
+    utc: bool = True,
+    accept_naive: bool = False,
+    microseconds: bool = False,
+) -> Iterator[str]:
+    """
+    Generate :RFC:`3339`-formatted timestamps for a regular series of datetimes, as :func:`range()` would for numbers:
+    those of :python:`start + n * step`, for :python:`n = 0, 1, 2, ...`, which precede :obj:`stop`
+    (or, if :obj:`step` is negative, which follow it).
+
+    >>> from datetime import datetime, timedelta, timezone
+    >>> list(generate_range(datetime(2008, 12, 31, 23, 59, 58, tzinfo=timezone.utc),
+    ...                     datetime(2009, 1, 1, 0, 0, 1, tzinfo=timezone.utc), timedelta(seconds=1)))
+    ['2008-12-31T23:59:58Z', '2008-12-31T23:59:59Z', '2009-01-01T00:00:00Z']
+
+    The timestamps are exactly those :func:`generate()` would produce for each datetime with the same options,
+    but when :obj:`start` is naive or has a fixed :class:`datetime.timezone`, no :class:`~datetime.datetime`
+    is built for each: the fields of the previous timestamp are advanced by :obj:`step`, carrying into the next field
+    as needed, and only the fields which change are rendered again. For other zones, such as a
+    :class:`zoneinfo.ZoneInfo`, whose offset may change within the series, each datetime is built and generated in
+    turn, using :python:`start + n * step` as :class:`~datetime.datetime` arithmetic would.
+
+    The series is generated as it is consumed; the arguments are checked when :func:`generate_range()` is called.
+
+    :param datetime.datetime start: the first :class:`~datetime.datetime` of the series
+    :param datetime.datetime stop: the :class:`~datetime.datetime` at or beyond which the series ends
+    :param datetime.timedelta step: the interval between successive datetimes; must not be zero
+    :param bool utc: as for :func:`generate()`
+    :param bool accept_naive: as for :func:`generate()`
+    :param bool microseconds: as for :func:`generate()`
+    :return: an iterator of timestamps
+    :rtype: typing.Iterator[str]
+
+    """
+
+    if not step:
+        raise ValueError("step must not be zero")
+
+    # Raises ValueError for a naive start unless permitted, as generate() does.
+    generate_one = make_generator(utc, accept_naive, microseconds)
+    generate_one(start)
+
+    tz = start.tzinfo
+    if tz is not None and type(tz) is not timezone:
+        return _generate_range_zoned(start, stop, step, generate_one)
+
+    # For a fixed offset, start + n * step precedes stop for n < count; subtracting the datetimes raises
+    # TypeError if only one is naive, as comparing them would.
+    count = max(0, -((start - stop) // step))
+    if utc and tz is not None:
+        start = start.astimezone(timezone.utc)
+    return _generate_range_fixed(start, count, step, generate_one(start), microseconds)
+
+
+def _generate_range_zoned(
+    start: datetime,
+    stop: datetime,
+    step: timedelta,
+    generate_one: Callable[[datetime], str],
+) -> Iterator[str]:
+    n = 0
+    dt = start
+    while dt < stop if step > timedelta(0) else dt > stop:
+        yield generate_one(dt)
+        n += 1
+        try:
+            dt = start + n * step
+        except OverflowError:
+            # The next datetime would lie beyond year 1 or 9999, and so beyond stop.
+            return
+
+
+def _generate_range_fixed(
+    start: datetime, count: int, step: timedelta, first: str, microseconds: bool
+) -> Iterator[str]:
+    # The fields of the current timestamp; the date is kept as an ordinal and rendered only when it changes.
+    ordinal = start.toordinal()
+    hour, minute, second, microsecond = (
+        start.hour,
+        start.minute,
+        start.second,
+        start.microsecond,
+    )
+    # The step, as whole days (negative for a negative step) and non-negative hours, minutes, seconds and
+    # microseconds, each less than the next field's unit, so that a field never carries more than one.
+    step_hours, step_seconds = divmod(step.seconds, 3600)
+    step_minutes, step_seconds = divmod(step_seconds, 60)
+    step_days, step_microseconds = step.days, step.microseconds
+    # Whether every step changes more than the seconds.
+    coarse = bool(step_minutes or step_hours or step_days)
+
+    # The timestamp as far as its seconds, and everything after its seconds; that includes the fraction
+    # unless it changes from one timestamp to the next.
+    fraction_varies = microseconds and step_microseconds != 0
+    date_part = first[:11]
+    prefix = first[:17]
+    suffix = first[26:] if fraction_varies else first[19:]
+    two_digits = _TWO_DIGITS
+
+    for remaining in range(count - 1, -1, -1):
+        if fraction_varies:
+            yield f"{prefix}{two_digits[second]}.{microsecond:06d}{suffix}"
+        else:
+            yield f"{prefix}{two_digits[second]}{suffix}"
+        # Advance only between timestamps; beyond the last, the date may be out of range.
+        if not remaining:
+            break
+
+        microsecond += step_microseconds
+        carry = 0
+        if microsecond >= 1_000_000:
+            microsecond -= 1_000_000
+            carry = 1
+        second += step_seconds + carry
+        if second < 60 and not coarse:
+            continue
+        carry = 0
+        if second >= 60:
+            second -= 60
+            carry = 1
+        minute += step_minutes + carry
+        carry = 0
+        if minute >= 60:
+            minute -= 60
+            carry = 1
+        hour += step_hours + carry
+        carry = 0
+        if hour >= 24:
+            hour -= 24
+            carry = 1
+        if step_days + carry:
+            ordinal += step_days + carry
+            # Converting an ordinal to a date handles month and year lengths, including leap days.
+            date_part = f"{date.fromordinal(ordinal).isoformat()}T"
+        prefix = f"{date_part}{two_digits[hour]}:{two_digits[minute]}:"
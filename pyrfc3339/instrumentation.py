@@ -0,0 +1,385 @@
+"""
+Opt-in instrumentation of :func:`pyrfc3339.parse()` and :func:`pyrfc3339.generate()`, counting calls, errors by cause
+and fast-path hits, optionally timing them, and reporting each call to registered callbacks.
+
+>>> from pyrfc3339 import instrumentation, parse
+>>> instrumentation.enable()
+>>> _ = parse('2009-01-01T10:01:02Z')
+>>> parse('2009-13-01T10:01:02Z', strict=True)
+Traceback (most recent call last):
+...
+pyrfc3339.parser.ParseError: month must be in 1..12 at column 6 of '2009-13-01T10:01:02Z'
+>>> stats = instrumentation.snapshot()
+>>> stats.calls
+{'parse': 2}
+>>> stats.errors
+{'range': 1}
+>>> instrumentation.disable()
+
+While instrumentation is disabled, which it is by default, :func:`~pyrfc3339.parse()` and :func:`~pyrfc3339.generate()`
+do no more than check that it is. Calls made through :func:`~pyrfc3339.parser.parse_bytes()` and
+:func:`~pyrfc3339.generator.generate_bytes()` are observed; those made by the batch functions, which are built on
+:func:`~pyrfc3339.parser.make_parser()` and :func:`~pyrfc3339.generator.make_generator()`, are not.
+
+"""
+
+import threading
+from collections import Counter
+from datetime import datetime
+from time import perf_counter_ns
+from typing import Any, Callable, Literal, NamedTuple
+
+from . import generator, parser
+from .parser import ParseError
+from .utils import Timestamp
+
+#: The causes by which :attr:`Snapshot.errors` counts errors: a naive datetime given or requested where it cannot be,
+#: a missing or invalid UTC offset, a field out of range, any other malformed timestamp, and anything else.
+CAUSES = ("naive", "offset", "range", "syntax", "other")
+
+
+class Event(NamedTuple):
+    """
+    A call observed while instrumentation is enabled, as passed to each callback registered with :func:`add_callback()`.
+
+    """
+
+    #: ``"parse"`` or ``"generate"``.
+    function: str
+    #: ``"fast"`` if the call was handled by the compiled fast path, or ``"fallback"`` if by the Python implementation.
+    path: str
+    #: The cause of the error raised by the call, one of :data:`CAUSES`, or :const:`None` if it succeeded.
+    cause: str | None
+    #: The duration of the call in nanoseconds, if timing is enabled, or :const:`None`.
+    elapsed_ns: int | None
+
+
+class Snapshot(NamedTuple):
+    """
+    The counters accumulated since instrumentation was last enabled or reset, as returned by :func:`snapshot()`.
+    Each maps a function name, or an error cause, to a count; names with a count of zero are omitted.
+
+    """
+
+    #: The number of calls of each function.
+    calls: dict[str, int]
+    #: The number of errors raised, by cause; see :data:`CAUSES`.
+    errors: dict[str, int]
+    #: The number of calls of each function handled by the compiled fast path.
+    fast_path: dict[str, int]
+    #: The number of calls of each function handled by the Python implementation.
+    fallback: dict[str, int]
+    #: The cumulative duration of the calls of each function in nanoseconds, if timing is enabled.
+    time_ns: dict[str, int]
+
+
+class _State(threading.local):
+    busy = False
+
+
+def _parse_error_cause(exc: ParseError) -> str:
+    if exc.field == "offset":
+        return "offset"
+    return "syntax" if exc.value is None else "range"
+
+
+def _cause(exc: Exception, function: str, args: tuple[Any, ...]) -> str:
+    # Errors are classified by their type and by the arguments of the call, never by their messages.
+    if isinstance(exc, ParseError):
+        return _parse_error_cause(exc)
+    if isinstance(exc, OverflowError):
+        return "range"
+    if not isinstance(exc, ValueError):
+        return "other"
+
+    if function == "generate":
+        dt = args[0]
+        return (
+            "naive" if isinstance(dt, datetime) and dt.utcoffset() is None else "other"
+        )
+
+    timestamp, _, produce_naive, strict, precision = args
+    if precision not in ("us", "ns"):
+        return "other"
+    if not strict:
+        # datetime.fromisoformat() says nothing structured about a timestamp it rejects, so such a timestamp is
+        # validated again against the RFC 3339 grammar for the field at fault.
+        try:
+            parser._fromisoformat(timestamp)
+        except ValueError:
+            try:
+                parser._parse_strict(timestamp)
+            except ParseError as error:
+                return _parse_error_cause(error)
+            return "syntax"
+    # Otherwise the timestamp was parsed, but the result could not be converted as requested.
+    if produce_naive:
+        return "naive"
+    return "offset" if precision == "ns" else "other"
+
+
+def _parse_fallback(
+    timestamp: str,
+    utc: bool,
+    produce_naive: bool,
+    strict: bool,
+    precision: Literal["us", "ns"],
+) -> datetime | Timestamp:
+    return parser.parse(timestamp, utc, produce_naive, strict, precision=precision)
+
+
+class _Observer:
+    """
+    Counts the calls of :func:`pyrfc3339.parse()` and :func:`pyrfc3339.generate()` while instrumentation is enabled.
+    The Python implementations defer to it unless it is already handling the call.
+
+    """
+
+    def __init__(
+        self,
+        timing: bool,
+        callbacks: list[Callable[[Event], object]],
+        parse_fast: Callable[..., Any] | None,
+        generate_fast: Callable[..., Any] | None,
+    ) -> None:
+        self.timing = timing
+        self._callbacks = callbacks
+        self._parse_fast = parse_fast
+        self._generate_fast = generate_fast
+        self._state = _State()
+        self._lock = threading.Lock()
+        self.reset()
+
+    @property
+    def busy(self) -> bool:
+        return self._state.busy
+
+    def reset(self) -> None:
+        with self._lock:
+            self._calls: Counter[str] = Counter()
+            self._errors: Counter[str] = Counter()
+            self._fast_path: Counter[str] = Counter()
+            self._fallback: Counter[str] = Counter()
+            self._time_ns: Counter[str] = Counter()
+
+    def snapshot(self) -> Snapshot:
+        with self._lock:
+            return Snapshot(
+                dict(self._calls),
+                dict(self._errors),
+                dict(self._fast_path),
+                dict(self._fallback),
+                dict(self._time_ns),
+            )
+
+    def parse(
+        self,
+        timestamp: str,
+        utc: bool,
+        produce_naive: bool,
+        strict: bool,
+        precision: Literal["us", "ns"],
+    ) -> datetime | Timestamp:
+        result: datetime | Timestamp = self._observe(
+            "parse",
+            self._parse_fast,
+            _parse_fallback,
+            (timestamp, utc, produce_naive, strict, precision),
+        )
+        return result
+
+    def generate(
+        self,
+        dt: datetime | Timestamp,
+        utc: bool,
+        accept_naive: bool,
+        microseconds: bool,
+    ) -> str:
+        result: str = self._observe(
+            "generate",
+            self._generate_fast,
+            generator.generate,
+            (dt, utc, accept_naive, microseconds),
+        )
+        return result
+
+    def _observe(
+        self,
+        function: str,
+        fast: Callable[..., Any] | None,
+        fallback: Callable[..., Any],
+        args: tuple[Any, ...],
+    ) -> Any:
+        state = self._state
+        start = perf_counter_ns() if self.timing else 0
+        path = "fast"
+
+        state.busy = True
+        try:
+            try:
+                result = None if fast is None else fast(*args)
+                if result is None:
+                    path = "fallback"
+                    result = fallback(*args)
+            finally:
+                state.busy = False
+        except Exception as exc:
+            # Anything else, such as KeyboardInterrupt, is not an error of the call and goes unrecorded.
+            self._record(function, path, start, args, exc)
+            raise
+
+        self._record(function, path, start, args, None)
+        return result
+
+    def _record(
+        self,
+        function: str,
+        path: str,
+        start: int,
+        args: tuple[Any, ...],
+        error: Exception | None,
+    ) -> None:
+        elapsed_ns = perf_counter_ns() - start if self.timing else None
+        cause = None if error is None else _cause(error, function, args)
+
+        with self._lock:
+            self._calls[function] += 1
+            (self._fast_path if path == "fast" else self._fallback)[function] += 1
+            if cause is not None:
+                self._errors[cause] += 1
+            if elapsed_ns is not None:
+                self._time_ns[function] += elapsed_ns
+
+        if self._callbacks:
+            event = Event(function, path, cause, elapsed_ns)
+            for callback in self._callbacks:
+                callback(event)
+
+
+_callbacks: list[Callable[[Event], object]] = []
+
+# The most recently enabled observer, kept after it is disabled so that its counters remain available.
+_last: _Observer | None = None
+
+
+def _speedups_module() -> Any:
+    # The compiled functions are observed only if the package is using them.
+    from . import generate as public_generate
+
+    if public_generate is generator.generate:
+        return None
+
+    from . import _speedups
+
+    return _speedups
+
+
+def enable(timing: bool = False) -> None:
+    """
+    Enable instrumentation, starting from zero counts.
+
+    :param bool timing: :const:`True` to also measure the cumulative duration of the calls of each function;
+                        :const:`False` otherwise. Defaults to :const:`False`.
+
+    """
+
+    global _last
+
+    speedups = _speedups_module()
+    observer = _Observer(
+        timing,
+        _callbacks,
+        None if speedups is None else speedups._parse_fast,
+        None if speedups is None else speedups._generate_fast,
+    )
+    _last = parser._observer = generator._observer = observer
+    if speedups is not None:
+        speedups._set_observed(True)
+
+
+def disable() -> None:
+    """
+    Disable instrumentation. The counters remain available from :func:`snapshot()` until it is next enabled.
+
+    """
+
+    speedups = _speedups_module()
+    if speedups is not None:
+        speedups._set_observed(False)
+    parser._observer = generator._observer = None
+
+
+def is_enabled() -> bool:
+    """
+    Return whether instrumentation is enabled.
+
+    """
+
+    return parser._observer is not None
+
+
+def snapshot() -> Snapshot:
+    """
+    Return the counters accumulated since instrumentation was last enabled or reset.
+
+    >>> from pyrfc3339 import parse
+    >>> enable(timing=True)
+    >>> _ = parse('2009-01-01T10:01:02Z')
+    >>> stats = snapshot()
+    >>> stats.calls, stats.time_ns['parse'] > 0
+    ({'parse': 1}, True)
+    >>> disable()
+
+    """
+
+    if _last is None:
+        return Snapshot({}, {}, {}, {}, {})
+    return _last.snapshot()
+
+
+def reset() -> None:
+    """
+    Reset the counters to zero.
+
+    """
+
+    if _last is not None:
+        _last.reset()
+
+
+def add_callback(callback: Callable[[Event], object]) -> None:
+    """
+    Register a callable to be called with an :class:`Event` after each call observed while instrumentation is enabled,
+    for example to export it to a metrics system. An exception raised by the callable propagates to the caller.
+
+    >>> from datetime import datetime
+    >>> from pyrfc3339 import generate
+    >>> events = []
+    >>> add_callback(events.append)
+    >>> enable()
+    >>> generate(datetime(2009, 1, 1, 12, 59, 59))
+    Traceback (most recent call last):
+    ...
+    ValueError: naive datetime and accept_naive is False
+    >>> disable()
+    >>> remove_callback(events.append)
+    >>> events[0].function, events[0].cause
+    ('generate', 'naive')
+
+    :param callback: the callable
+
+    """
+
+    _callbacks.append(callback)
+
+
+def remove_callback(callback: Callable[[Event], object]) -> None:
+    """
+    Unregister a callable registered with :func:`add_callback()`.
+
+    :param callback: the callable
+    :raises ValueError: if it is not registered
+
+    """
+
+    _callbacks.remove(callback)
@@ -0,0 +1,225 @@
+"""
+Defer parsing :RFC:`3339` timestamps until they are used, such as those in a large JSON document
+of which only a few fields are read.
+
+>>> import json
+>>> doc = json.loads('{"id": 1, "created": "2009-01-01T10:01:02Z"}', object_hook=object_hook)
+>>> doc['created']
+LazyRFC3339('2009-01-01T10:01:02Z')
+>>> doc['created'].year
+2009
+>>> json.dumps(doc, cls=Rfc3339Encoder)
+'{"id": 1, "created": "2009-01-01T10:01:02Z"}'
+
+"""
+
+import json
+import re
+from datetime import datetime
+from typing import Any, Callable
+
+from .generator import generate
+from .parser import parse
+
+# The shape of a timestamp that object_hook() defers parsing; the fields are validated when it is parsed.
+_TIMESTAMP_RE = re.compile(
+    r"[0-9]{4}-[0-9]{2}-[0-9]{2}[Tt ][0-9]{2}:[0-9]{2}:[0-9]{2}(?:[.,][0-9]+)?(?:[Zz]|[+-][0-9]{2}:[0-9]{2})"
+)
+
+# A timestamp in UTC written canonically, which sorts as a string once its fraction is given a fixed width.
+_CANONICAL_UTC_RE = re.compile(
+    r"[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}(?:\.([0-9]+))?Z"
+)
+
+
+class LazyRFC3339:
+    """
+    An :RFC:`3339` timestamp which is parsed by :func:`pyrfc3339.parse()` when first needed, then remembered.
+
+    Any attribute of :class:`datetime.datetime` may be read from it, which parses it.
+
+    >>> ts = LazyRFC3339('2009-01-01T14:01:02-04:00')
+    >>> ts.hour, ts.utcoffset(), ts.timestamp()
+    (14, datetime.timedelta(days=-1, seconds=72000), 1230832862.0)
+    >>> ts.datetime
+    datetime.datetime(2009, 1, 1, 14, 1, 2, tzinfo=datetime.timezone(datetime.timedelta(days=-1, seconds=72000)))
+
+    It compares, sorts and hashes as the :class:`~datetime.datetime` it represents, and may be compared with one.
+    When both timestamps are written canonically in UTC (with ``T`` and ``Z``), they are compared without being parsed.
+    Such a timestamp is not validated until it is parsed, so the order of invalid timestamps is unspecified.
+
+    >>> sorted([LazyRFC3339('2009-01-01T10:01:02.5Z'), LazyRFC3339('2009-01-01T10:01:02Z')])
+    [LazyRFC3339('2009-01-01T10:01:02Z'), LazyRFC3339('2009-01-01T10:01:02.5Z')]
+    >>> LazyRFC3339('2009-01-01T14:01:02-04:00') == LazyRFC3339('2009-01-01T18:01:02Z')
+    True
+
+    :param str timestamp: the :RFC:`3339` timestamp
+    :param bool utc: as for :func:`pyrfc3339.parse()`
+    :param bool strict: as for :func:`pyrfc3339.parse()`
+
+    """
+
+    __slots__ = ("_timestamp", "_utc", "_strict", "_datetime", "_key")
+
+    def __init__(self, timestamp: str, utc: bool = False, strict: bool = False) -> None:
+        self._timestamp = timestamp
+        self._utc = utc
+        self._strict = strict
+        self._datetime: datetime | None = None
+        self._key: str | None | bool = False
+
+    @property
+    def raw(self) -> str:
+        """
+        The timestamp, as given.
+
+        """
+        return self._timestamp
+
+    @property
+    def datetime(self) -> datetime:
+        """
+        The parsed timestamp.
+
+        """
+        if self._datetime is None:
+            self._datetime = parse(self._timestamp, self._utc, strict=self._strict)
+        return self._datetime
+
+    @property
+    def parsed(self) -> bool:
+        """
+        Whether the timestamp has been parsed.
+
+        """
+        return self._datetime is not None
+
+    def _sort_key(self) -> str | None:
+        # The timestamp, less its "Z", with its fraction truncated or padded to microseconds, if it is
+        # canonical UTC; otherwise None.
+        if self._key is False:
+            match = _CANONICAL_UTC_RE.fullmatch(self._timestamp)
+            self._key = (
+                None
+                if match is None
+                else self._timestamp[:19] + (match.group(1) or "")[:6].ljust(6, "0")
+            )
+        return self._key  # type: ignore[return-value]
+
+    def _compare(self, other: object, op: Callable[[Any, Any], bool]) -> bool:
+        if isinstance(other, LazyRFC3339):
+            key = self._sort_key()
+            other_key = other._sort_key()
+            if key is not None and other_key is not None:
+                return op(key, other_key)
+            return op(self.datetime, other.datetime)
+        if isinstance(other, datetime):
+            return op(self.datetime, other)
+        return NotImplemented  # type: ignore[no-any-return]
+
+    def __eq__(self, other: object) -> bool:
+        return self._compare(other, _eq)
+
+    def __ne__(self, other: object) -> bool:
+        return self._compare(other, _ne)
+
+    def __lt__(self, other: object) -> bool:
+        return self._compare(other, _lt)
+
+    def __le__(self, other: object) -> bool:
+        return self._compare(other, _le)
+
+    def __gt__(self, other: object) -> bool:
+        return self._compare(other, _gt)
+
+    def __ge__(self, other: object) -> bool:
+        return self._compare(other, _ge)
+
+    def __hash__(self) -> int:
+        return hash(self.datetime)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not found on this object; delegate those of datetime.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.datetime, name)
+
+    def __str__(self) -> str:
+        return self._timestamp
+
+    def __repr__(self) -> str:
+        return f"LazyRFC3339({self._timestamp!r})"
+
+    def __reduce__(self) -> tuple[type, tuple[str, bool, bool]]:
+        return LazyRFC3339, (self._timestamp, self._utc, self._strict)
+
+
+def _eq(a: Any, b: Any) -> bool:
+    return bool(a == b)
+
+
+def _ne(a: Any, b: Any) -> bool:
+    return bool(a != b)
+
+
+def _lt(a: Any, b: Any) -> bool:
+    return bool(a < b)
+
+
+def _le(a: Any, b: Any) -> bool:
+    return bool(a <= b)
+
+
+def _gt(a: Any, b: Any) -> bool:
+    return bool(a > b)
+
+
+def _ge(a: Any, b: Any) -> bool:
+    return bool(a >= b)
+
+
+def object_hook(obj: dict[str, Any]) -> dict[str, Any]:
+    """
+    An ``object_hook`` for :func:`json.loads()` and :class:`json.JSONDecoder` which replaces each string value
+    shaped like an :RFC:`3339` timestamp with a :class:`LazyRFC3339`. Strings within lists are left alone.
+
+    >>> import json
+    >>> json.loads('{"at": "2009-01-01T10:01:02Z", "note": "2009-01-01"}', object_hook=object_hook)
+    {'at': LazyRFC3339('2009-01-01T10:01:02Z'), 'note': '2009-01-01'}
+
+    A string of the right shape with an invalid field, such as a thirteenth month, raises :exc:`ValueError` when parsed.
+
+    :param dict obj: a decoded JSON object
+    :return: :obj:`obj`, updated
+
+    """
+
+    match = _TIMESTAMP_RE.fullmatch
+    for key, value in obj.items():
+        if type(value) is str and match(value):
+            obj[key] = LazyRFC3339(value)
+    return obj
+
+
+class Rfc3339Encoder(json.JSONEncoder):
+    """
+    A :class:`json.JSONEncoder` which encodes a :class:`LazyRFC3339` as the timestamp it was given, without parsing it,
+    and a :class:`datetime.datetime` with :func:`pyrfc3339.generate()`, keeping its UTC offset and including
+    fractional seconds if it has any.
+
+    >>> import json
+    >>> from datetime import datetime, timezone
+    >>> json.dumps([datetime(2009, 1, 1, 10, 1, 2, 500000, timezone.utc), LazyRFC3339('2009-01-01t10:01:02z')],
+    ...            cls=Rfc3339Encoder)
+    '["2009-01-01T10:01:02.500000Z", "2009-01-01t10:01:02z"]'
+
+    A naive :class:`~datetime.datetime` raises :exc:`ValueError`, as it would for :func:`pyrfc3339.generate()`.
+
+    """
+
+    def default(self, o: Any) -> Any:
+        if isinstance(o, LazyRFC3339):
+            return o.raw
+        if isinstance(o, datetime):
+            return generate(o, utc=False, microseconds=bool(o.microsecond))
+        return super().default(o)
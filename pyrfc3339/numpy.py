@@ -0,0 +1,361 @@
+"""
+Parse and generate :RFC:`3339` timestamps held in `NumPy <https://numpy.org/>`_ arrays, operating on
+whole arrays at once rather than on one :class:`datetime.datetime` at a time.
+
+This module requires NumPy, which may be installed along with pyRFC3339 as the ``numpy`` extra:
+
+``$ pip install pyRFC3339[numpy]``
+
+>>> values, offsets = parse_array(['2009-01-01T10:01:02Z', '2009-01-01T14:01:02.25-04:00'])
+>>> values
+array(['2009-01-01T10:01:02.000000', '2009-01-01T14:01:02.250000'],
+      dtype='datetime64[us]')
+>>> offsets
+array([     0, -14400], dtype=int32)
+>>> generate_array(values, offsets, utc=False, microseconds=True)
+array(['2009-01-01T10:01:02.000000Z', '2009-01-01T14:01:02.250000-04:00'],
+      dtype='<U32')
+
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import numpy.typing as npt
+
+from .parser import parse
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+_DIGIT_COLUMNS = [0, 1, 2, 3, 5, 6, 8, 9, 11, 12, 14, 15, 17, 18]
+_SEPARATORS = {4: b"-", 7: b"-", 13: b":", 16: b":"}
+_DATE_TIME_SEPARATORS = b"Tt "
+
+# The number of days in each month of a non-leap year, indexed from 1.
+_DAYS_IN_MONTH = np.array(
+    [0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31], dtype=np.int64
+)
+
+_MICROSECONDS_PER_SECOND = 1_000_000
+_MICROSECONDS_PER_DAY = 86_400 * _MICROSECONDS_PER_SECOND
+
+# The earliest and latest instants a datetime can represent, in microseconds since the epoch.
+_MIN_WALL = (datetime.min - _EPOCH) // _MICROSECOND
+_MAX_WALL = (datetime.max - _EPOCH) // _MICROSECOND
+
+
+def _days_from_civil(
+    year: npt.NDArray[np.int64],
+    month: npt.NDArray[np.int64],
+    day: npt.NDArray[np.int64],
+) -> npt.NDArray[np.int64]:
+    # The number of days since 1970-01-01 of a date in the proleptic Gregorian calendar;
+    # see https://howardhinnant.github.io/date_algorithms.html#days_from_civil
+    year = year - (month <= 2)
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * ((month + 9) % 12) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    days: npt.NDArray[np.int64] = era * 146097 + day_of_era - 719468
+    return days
+
+
+def _civil_from_days(
+    days: npt.NDArray[np.int64],
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+    # The inverse of _days_from_civil();
+    # see https://howardhinnant.github.io/date_algorithms.html#civil_from_days
+    days = days + 719468
+    era = days // 146097
+    day_of_era = days - era * 146097
+    year_of_era = (
+        day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096
+    ) // 365
+    day_of_year = day_of_era - (
+        365 * year_of_era + year_of_era // 4 - year_of_era // 100
+    )
+    month_index = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * month_index + 2) // 5 + 1
+    month = np.where(month_index < 10, month_index + 3, month_index - 9)
+    year = year_of_era + era * 400 + (month <= 2)
+    return year, month, day
+
+
+def _number(columns: npt.NDArray[np.int64]) -> npt.NDArray[np.int64]:
+    # Combine a two-dimensional array of decimal digits, one number per row, into an array of numbers.
+    result = np.zeros(columns.shape[0], dtype=np.int64)
+    for column in range(columns.shape[1]):
+        result = result * 10 + columns[:, column]
+    return result
+
+
+def _parse_one(timestamp: bytes) -> tuple[int, int]:
+    dt = parse(timestamp.decode("ascii"))
+    offset = dt.utcoffset()
+    if offset is None:
+        raise ValueError(f"timestamp has no UTC offset: {timestamp.decode('ascii')!r}")
+    wall = (dt.replace(tzinfo=None) - _EPOCH) // _MICROSECOND
+    return wall, int(offset.total_seconds())
+
+
+def parse_array(
+    timestamps: npt.ArrayLike, utc: bool = False, produce_naive: bool = False
+) -> tuple[npt.NDArray[np.datetime64], npt.NDArray[np.int32]]:
+    """
+    Parse an array of :RFC:`3339`-formatted timestamps.
+
+    Two arrays of the same shape as :obj:`timestamps` are returned: the first holds the date and time of each timestamp
+    as written (that is, the wall-clock time in its own UTC offset) as a :class:`numpy.datetime64` with microsecond
+    precision, and the second holds each UTC offset in seconds. Element by element, they are equivalent to
+    :func:`pyrfc3339.parse()` called with the same options.
+
+    >>> values, offsets = parse_array(['2009-01-01T06:01:02.1234567-04:00'])
+    >>> values[0], offsets[0]
+    (np.datetime64('2009-01-01T06:01:02.123456'), np.int32(-14400))
+
+    If :python:`utc=True` is specified, each timestamp is normalized to UTC, and all of the offsets are therefore zero.
+
+    >>> values, offsets = parse_array(['2009-01-01T06:01:02.1234567-04:00'], utc=True)
+    >>> values[0], offsets[0]
+    (np.datetime64('2009-01-01T10:01:02.123456'), np.int32(0))
+
+    If :python:`produce_naive=True` is specified, every timestamp must be in UTC, as :func:`pyrfc3339.parse()` requires.
+
+    >>> parse_array(['2009-01-01T06:01:02-04:00'], produce_naive=True)
+    Traceback (most recent call last):
+    ...
+    ValueError: cannot produce a naive datetime from a local timestamp
+
+    Timestamps of the form ``YYYY-MM-DDTHH:MM:SS[.fraction](Z|±HH:MM)`` are parsed with whole-array operations;
+    any others are passed to :func:`pyrfc3339.parse()` one by one, and must carry a UTC offset.
+
+    :param timestamps: an array (or any sequence) of :class:`str` or ASCII :class:`bytes` timestamps
+    :param bool utc: as for :func:`pyrfc3339.parse()`
+    :param bool produce_naive: as for :func:`pyrfc3339.parse()`
+    :return: the wall-clock date and time of each timestamp, and its UTC offset in seconds
+    :rtype: tuple[numpy.ndarray, numpy.ndarray]
+
+    """
+
+    raw = np.asarray(timestamps)
+    shape = raw.shape
+    if raw.dtype.kind == "U":
+        raw = np.char.encode(raw, "ascii")
+    elif raw.dtype.kind != "S":
+        raise TypeError(f"expected an array of str or bytes, not {raw.dtype}")
+
+    flat = np.ascontiguousarray(raw.ravel())
+    count = flat.size
+    # Room for at least the date, the time and an offset, as well as six fractional digits.
+    width = max(flat.dtype.itemsize, 26)
+    flat = flat.astype(f"S{width}")
+    chars = flat.view(np.uint8).reshape(count, width).astype(np.int64)
+    lengths = np.char.str_len(flat).astype(np.int64)
+    rows = np.arange(count)
+
+    digits = chars - ord("0")
+    ok = lengths >= 20
+    ok &= ((digits[:, _DIGIT_COLUMNS] >= 0) & (digits[:, _DIGIT_COLUMNS] <= 9)).all(
+        axis=1
+    )
+    for column, separator in _SEPARATORS.items():
+        ok &= chars[:, column] == ord(separator)
+    ok &= np.isin(chars[:, 10], list(_DATE_TIME_SEPARATORS))
+
+    # Locate the 'Z' or the offset, and with it the end of the fractional seconds, if any.
+    last = chars[rows, np.maximum(lengths - 1, 0)]
+    zulu = (last == ord("Z")) | (last == ord("z"))
+    designator = np.where(zulu, lengths - 1, lengths - 6)
+    fraction_digits = designator - 20
+    has_fraction = chars[:, 19] == ord(".")
+    ok &= np.where(has_fraction, fraction_digits >= 1, designator == 19)
+
+    columns = np.arange(width)
+    in_fraction = (
+        has_fraction[:, None] & (columns >= 20) & (columns < designator[:, None])
+    )
+    ok &= ~(in_fraction & ((digits < 0) | (digits > 9))).any(axis=1)
+    weights = 10 ** np.clip(25 - columns, 0, None)
+    microsecond = (
+        np.where(in_fraction & (columns < 26), digits, 0)
+        * np.where(columns < 26, weights, 0)
+    ).sum(axis=1)
+
+    def at(offset: int) -> npt.NDArray[np.int64]:
+        column: npt.NDArray[np.int64] = chars[
+            rows, np.clip(designator + offset, 0, width - 1)
+        ]
+        return column
+
+    sign = np.where(at(0) == ord("-"), -1, 1)
+    offset_digits = np.stack([at(1), at(2), at(4), at(5)], axis=1) - ord("0")
+    ok &= zulu | (
+        ((at(0) == ord("+")) | (at(0) == ord("-")))
+        & (at(3) == ord(":"))
+        & ((offset_digits >= 0) & (offset_digits <= 9)).all(axis=1)
+    )
+
+    # Give rows which have already failed harmless values, so that they do not disturb the range checks.
+    digits = np.where(ok[:, None], digits, 1)
+    offset_digits = np.where(ok[:, None], offset_digits, 0)
+
+    year = _number(digits[:, 0:4])
+    month = _number(digits[:, 5:7])
+    day = _number(digits[:, 8:10])
+    hour = _number(digits[:, 11:13])
+    minute = _number(digits[:, 14:16])
+    second = _number(digits[:, 17:19])
+    offset_hour = np.where(zulu, 0, _number(offset_digits[:, 0:2]))
+    offset_minute = np.where(zulu, 0, _number(offset_digits[:, 2:4]))
+
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    days_in_month = _DAYS_IN_MONTH[np.clip(month, 0, 12)] + (leap & (month == 2))
+    ok &= (
+        (year >= 1) & (month >= 1) & (month <= 12) & (day >= 1) & (day <= days_in_month)
+    )
+    ok &= (
+        (hour <= 23)
+        & (minute <= 59)
+        & (second <= 59)
+        & (offset_hour <= 23)
+        & (offset_minute <= 59)
+    )
+
+    days = _days_from_civil(year, month, day)
+    wall = (
+        days * 86_400 + hour * 3_600 + minute * 60 + second
+    ) * _MICROSECONDS_PER_SECOND + microsecond
+    offset_seconds = sign * (offset_hour * 3_600 + offset_minute * 60)
+
+    # Anything which is not in the canonical form (or is invalid) is left to parse().
+    for row in np.flatnonzero(~ok):
+        wall[row], offset_seconds[row] = _parse_one(bytes(flat[row]))
+
+    if utc:
+        wall = wall - offset_seconds * _MICROSECONDS_PER_SECOND
+        offset_seconds = np.zeros_like(offset_seconds)
+        # Normalizing may carry a timestamp beyond the years 1 to 9999, as parse() would report.
+        if ((wall < _MIN_WALL) | (wall > _MAX_WALL)).any():
+            raise OverflowError("date value out of range")
+
+    if produce_naive and offset_seconds.any():
+        raise ValueError("cannot produce a naive datetime from a local timestamp")
+
+    return (
+        wall.astype("datetime64[us]").reshape(shape),
+        offset_seconds.astype(np.int32).reshape(shape),
+    )
+
+
+def _put_digits(
+    out: npt.NDArray[np.uint8], column: int, width: int, values: npt.NDArray[np.int64]
+) -> None:
+    for position in range(width):
+        out[:, column + position] = (
+            ord("0") + values // 10 ** (width - 1 - position) % 10
+        )
+
+
+def generate_array(
+    values: npt.ArrayLike,
+    offsets: npt.ArrayLike | None = None,
+    utc: bool = True,
+    microseconds: bool = False,
+) -> npt.NDArray[np.str_]:
+    """
+    Generate an array of :RFC:`3339`-formatted timestamps from an array of :class:`numpy.datetime64` values.
+
+    If :obj:`offsets` is omitted, the values are taken to be in UTC. Otherwise, each value is taken to be a wall-clock
+    date and time in the UTC offset given, in seconds, by the corresponding element of :obj:`offsets`,
+    as returned by :func:`parse_array()`. Element by element, the result is equivalent to :func:`pyrfc3339.generate()`
+    called with the same options, on a :class:`datetime.datetime` whose :attr:`~datetime.datetime.tzinfo` is
+    a :class:`datetime.timezone` with that offset.
+
+    >>> import numpy as np
+    >>> values = np.array(['2009-01-01T12:59:59.25'], dtype='datetime64[us]')
+    >>> generate_array(values)
+    array(['2009-01-01T12:59:59Z'], dtype='<U20')
+    >>> generate_array(values, [-18000])
+    array(['2009-01-01T17:59:59Z'], dtype='<U20')
+    >>> generate_array(values, [-18000], utc=False, microseconds=True)
+    array(['2009-01-01T12:59:59.250000-05:00'], dtype='<U32')
+
+    :param values: an array (or any sequence) of :class:`numpy.datetime64` values; values with a precision finer than
+                   microseconds are truncated to microseconds
+    :param offsets: an array (or any sequence) of UTC offsets in seconds, which must be whole minutes,
+                    of the same shape as :obj:`values`; or :const:`None`
+    :param bool utc: as for :func:`pyrfc3339.generate()`
+    :param bool microseconds: as for :func:`pyrfc3339.generate()`
+    :return: the generated timestamps
+    :rtype: numpy.ndarray
+
+    """
+
+    array = np.asarray(values)
+    if array.dtype.kind != "M":
+        raise TypeError(f"expected an array of datetime64, not {array.dtype}")
+    shape = array.shape
+
+    if np.isnat(array).any():
+        raise ValueError("cannot generate a timestamp from NaT")
+
+    wall = array.astype("datetime64[us]").astype(np.int64).ravel()
+
+    if offsets is None:
+        offset_seconds = np.zeros_like(wall)
+    else:
+        offset_seconds = np.broadcast_to(
+            np.asarray(offsets, dtype=np.int64), shape
+        ).ravel()
+        if (offset_seconds % 60 != 0).any() or (np.abs(offset_seconds) >= 86_400).any():
+            raise ValueError(
+                "offsets must be whole minutes, strictly between -24 and 24 hours"
+            )
+
+    if utc:
+        wall = wall - offset_seconds * _MICROSECONDS_PER_SECOND
+        offset_seconds = np.zeros_like(offset_seconds)
+
+    days, time_of_day = np.divmod(wall, _MICROSECONDS_PER_DAY)
+    year, month, day = _civil_from_days(days)
+    if ((year < 1) | (year > 9999)).any():
+        raise ValueError("year is out of range")
+
+    seconds, microsecond = np.divmod(time_of_day, _MICROSECONDS_PER_SECOND)
+
+    count = wall.size
+    fraction_width = 7 if microseconds else 0
+    designator = 19 + fraction_width
+    zulu = offset_seconds == 0
+    width = designator + (1 if zulu.all() else 6)
+
+    out = np.zeros((count, width), dtype=np.uint8)
+    _put_digits(out, 0, 4, year)
+    out[:, 4] = ord("-")
+    _put_digits(out, 5, 2, month)
+    out[:, 7] = ord("-")
+    _put_digits(out, 8, 2, day)
+    out[:, 10] = ord("T")
+    _put_digits(out, 11, 2, seconds // 3_600)
+    out[:, 13] = ord(":")
+    _put_digits(out, 14, 2, seconds // 60 % 60)
+    out[:, 16] = ord(":")
+    _put_digits(out, 17, 2, seconds % 60)
+    if microseconds:
+        out[:, 19] = ord(".")
+        _put_digits(out, 20, 6, microsecond)
+
+    if width > designator + 1:
+        offset_minutes = np.abs(offset_seconds) // 60
+        _put_digits(out, designator + 1, 2, offset_minutes // 60)
+        out[:, designator + 3] = ord(":")
+        _put_digits(out, designator + 4, 2, offset_minutes % 60)
+        out[:, designator] = np.where(offset_seconds < 0, ord("-"), ord("+"))
+        # Rows in UTC end in 'Z', followed by padding which is stripped from the result.
+        padding = designator + 1
+        out[zulu, padding:] = 0
+
+    out[zulu, designator] = ord("Z")
+
+    return out.view(f"S{width}").ravel().astype(f"U{width}").reshape(shape)
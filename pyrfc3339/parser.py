@@ -1,11 +1,455 @@
-import re
 import sys
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Iterable,
+    Iterator,
+    Literal,
+    NamedTuple,
+    TypeAlias,
+    overload,
+)
 
-from .utils import datetime_utcoffset
+from .utils import (
+    CacheInfo,
+    LRUCache,
+    Timestamp,
+    datetime_epoch_us,
+    datetime_utcoffset,
+)
 
+if TYPE_CHECKING:
+    from .instrumentation import _Observer
 
-def parse(timestamp: str, utc: bool = False, produce_naive: bool = False) -> datetime:
+#: An error policy for :func:`parse_many()`: one of ``"raise"``, ``"skip"`` or ``"none"``,
+#: or a callable which receives the offending timestamp and the :exc:`ValueError` raised for it,
+#: and returns the value to be produced in its place.
+ErrorPolicy: TypeAlias = (
+    Literal["raise", "skip", "none"] | Callable[[str, ValueError], datetime | None]
+)
+
+# Parsing is delegated to datetime.fromisoformat(), which is implemented in C and
+# outperforms any positional scanner written in Python; see benchmarks/bench_fast_path.py.
+# The functions below therefore only adjust a timestamp where fromisoformat() requires it.
+
+# noinspection PyUnreachableCode
+if sys.version_info >= (3, 11):
+
+    def _fromisoformat(timestamp: str) -> datetime:
+        # Python recognizes "Z", but not "z", as an alias for "+00:00".
+        if timestamp[-1:] == "z":
+            timestamp = timestamp[:-1] + "Z"
+
+        try:
+            return datetime.fromisoformat(timestamp)
+        except ValueError:
+            # A date alone is accepted with "+00:00", as it was before Python 3.11, but not with "Z".
+            if timestamp[-1:] == "Z":
+                try:
+                    return datetime.fromisoformat(timestamp[:-1] + "+00:00")
+                except ValueError:
+                    pass
+            raise
+
+else:
+    # Python releases prior to 3.11 only support three or six digits of fractional
+    # seconds. RFC 3339 is more lenient, so pad to six digits and truncate any
+    # excessive digits.
+    # This can be removed in October 2026, once Python 3.10 and earlier
+    # have been retired.
+    # A timestamp with three or six fractional digits in the canonical position,
+    # followed by a six-character offset, is 29 or 32 characters long.
+    import re
+
+    _CANONICAL_FRACTION_LENGTHS = (29, 32)
+    _FRACTION_RE = re.compile(r"(\.)([0-9]+)(?=[+\-][0-9]{2}:[0-9]{2}$)")
+
+    def _pad_fraction(match: "re.Match[str]") -> str:
+        return match.group(1) + match.group(2).ljust(6, "0")[:6]
+
+    def _fromisoformat(timestamp: str) -> datetime:
+        # Python does not recognize "Z" as an alias for "+00:00", so we perform the
+        # substitution here.
+        if timestamp[-1:] in ("Z", "z"):
+            timestamp = timestamp[:-1] + "+00:00"
+
+        # Only timestamps with an unsupported number of fractional digits need the
+        # regular expression; recognize the common shapes by position and length.
+        if "." in timestamp and not (
+            timestamp[19:20] == "." and len(timestamp) in _CANONICAL_FRACTION_LENGTHS
+        ):
+            timestamp = _FRACTION_RE.sub(_pad_fraction, timestamp)
+
+        return datetime.fromisoformat(timestamp)
+
+
+class ParseError(ValueError):
+    """
+    Raised by :func:`parse()` in strict mode when a timestamp does not conform to :RFC:`3339`.
+
+    >>> try:
+    ...     parse('2009-01-01T06:01:02', strict=True)
+    ... except ParseError as exc:
+    ...     print(exc.column, exc.reason, exc.field)
+    20 expected 'Z' or a UTC offset offset
+    >>> try:
+    ...     parse('2009-13-01T06:01:02Z', strict=True)
+    ... except ParseError as exc:
+    ...     print(exc.field, exc.value)
+    month 13
+
+    :param str timestamp: the timestamp which could not be parsed
+    :param int column: the (1-based) column at which the error was detected
+    :param str reason: a description of the error
+    :param field: the field being read when the error was detected: ``"year"``, ``"month"``, ``"day"``, ``"hour"``,
+                  ``"minute"``, ``"second"``, ``"fraction"`` or ``"offset"``, or :const:`None` if the timestamp
+                  continues after its UTC offset
+    :type field: str or None
+    :param value: the value of the field, if it is out of range, or :const:`None` if the field is malformed
+    :type value: int or None
+
+    """
+
+    def __init__(
+        self,
+        timestamp: str,
+        column: int,
+        reason: str,
+        field: str | None = None,
+        value: int | None = None,
+    ) -> None:
+        super().__init__(timestamp, column, reason, field, value)
+        self.timestamp = timestamp
+        self.column = column
+        self.reason = reason
+        self.field = field
+        self.value = value
+
+    def __str__(self) -> str:
+        return f"{self.reason} at column {self.column} of {self.timestamp!r}"
+
+
+# The number of days in each month of a non-leap year, indexed from 1.
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# The most fractional digits accepted in strict mode; anything beyond microseconds is truncated.
+_MAX_FRACTION_DIGITS = 9
+
+_MINUTE = timedelta(minutes=1)
+
+# Set by pyrfc3339.instrumentation while it is enabled.
+_observer: "_Observer | None" = None
+
+
+def _strict_field(
+    timestamp: str,
+    start: int,
+    width: int,
+    low: int,
+    high: int,
+    name: str,
+    field: str | None = None,
+) -> int:
+    field = field or name
+    end = start + width
+    digits = timestamp[start:end]
+    if len(digits) != width or not (digits.isascii() and digits.isdigit()):
+        for position in range(start, end):
+            if position >= len(timestamp) or not "0" <= timestamp[position] <= "9":
+                raise ParseError(timestamp, position + 1, "expected a digit", field)
+
+    value = int(digits)
+    if not low <= value <= high:
+        raise ParseError(
+            timestamp, start + 1, f"{name} must be in {low}..{high}", field, value
+        )
+    return value
+
+
+def _strict_char(
+    timestamp: str, position: int, allowed: str, description: str, field: str
+) -> str:
+    # A separator is attributed to the field which follows it.
+    if position >= len(timestamp) or timestamp[position] not in allowed:
+        raise ParseError(timestamp, position + 1, f"expected {description}", field)
+    return timestamp[position]
+
+
+def _parse_strict(timestamp: str) -> datetime:
+    """
+    Parse a timestamp according to the ``date-time`` production of :RFC:`3339` section 5.6,
+    in a single pass, raising :exc:`ParseError` at the first deviation from the grammar.
+
+    """
+
+    year = _strict_field(timestamp, 0, 4, 1, 9999, "year")
+    _strict_char(timestamp, 4, "-", "'-'", "month")
+    month = _strict_field(timestamp, 5, 2, 1, 12, "month")
+    _strict_char(timestamp, 7, "-", "'-'", "day")
+    days_in_month = _DAYS_IN_MONTH[month]
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        days_in_month = 29
+    day = _strict_field(timestamp, 8, 2, 1, days_in_month, "day")
+    _strict_char(timestamp, 10, "Tt ", "'T', 't' or ' '", "hour")
+    hour = _strict_field(timestamp, 11, 2, 0, 23, "hour")
+    _strict_char(timestamp, 13, ":", "':'", "minute")
+    minute = _strict_field(timestamp, 14, 2, 0, 59, "minute")
+    _strict_char(timestamp, 16, ":", "':'", "second")
+    # RFC 3339 permits a leap second, but datetime cannot represent one.
+    second = _strict_field(timestamp, 17, 2, 0, 59, "second")
+
+    length = len(timestamp)
+    position = 19
+    microsecond = 0
+
+    if position < length and timestamp[position] == ".":
+        start = end = position + 1
+        while end < length and "0" <= timestamp[end] <= "9":
+            end += 1
+        if end == start:
+            raise ParseError(timestamp, start + 1, "expected a digit", "fraction")
+        if end - start > _MAX_FRACTION_DIGITS:
+            raise ParseError(
+                timestamp,
+                start + _MAX_FRACTION_DIGITS + 1,
+                f"at most {_MAX_FRACTION_DIGITS} fractional digits are supported",
+                "fraction",
+            )
+        microsecond = int(timestamp[start:end][:6].ljust(6, "0"))
+        position = end
+
+    designator = _strict_char(
+        timestamp, position, "Zz+-", "'Z' or a UTC offset", "offset"
+    )
+
+    tz: tzinfo
+
+    if designator in "Zz":
+        tz = timezone.utc
+        position += 1
+    else:
+        offset_hour = _strict_field(
+            timestamp, position + 1, 2, 0, 23, "offset hour", "offset"
+        )
+        _strict_char(timestamp, position + 3, ":", "':'", "offset")
+        offset_minute = _strict_field(
+            timestamp, position + 4, 2, 0, 59, "offset minute", "offset"
+        )
+        offset = timedelta(hours=offset_hour, minutes=offset_minute)
+        tz = _intern_tzinfo(timezone(-offset if designator == "-" else offset))
+        position += 6
+
+    if position != length:
+        raise ParseError(
+            timestamp, position + 1, "unexpected character after UTC offset"
+        )
+
+    return datetime(year, month, day, hour, minute, second, microsecond, tz)
+
+
+class ParserCacheInfo(NamedTuple):
+    """
+    Statistics for the caches configured with :func:`configure_caches()`.
+
+    """
+
+    tzinfo: CacheInfo
+    timestamps: CacheInfo
+
+
+_tzinfo_cache: LRUCache[tzinfo, tzinfo] | None = None
+_timestamp_cache: LRUCache[str, datetime] | None = None
+
+
+def _intern_tzinfo(tz: tzinfo) -> tzinfo:
+    cache = _tzinfo_cache
+    if cache is None:
+        return tz
+
+    canonical = cache.get(tz)
+    if canonical is None:
+        cache.put(tz, tz)
+        return tz
+    return canonical
+
+
+def _parse_cached(timestamp: str) -> datetime:
+    cache = _timestamp_cache
+    if cache is not None:
+        dt_out = cache.get(timestamp)
+        if dt_out is not None:
+            return dt_out
+
+    dt_out = _fromisoformat(timestamp)
+    tz = dt_out.tzinfo
+    if tz is not None and tz is not timezone.utc:
+        canonical = _intern_tzinfo(tz)
+        if canonical is not tz:
+            dt_out = dt_out.replace(tzinfo=canonical)
+
+    if cache is not None:
+        cache.put(timestamp, dt_out)
+    return dt_out
+
+
+# The function used to parse a timestamp when strict parsing has not been requested;
+# replaced by configure_caches() while either cache is enabled.
+_parse_default: Callable[[str], datetime] = _fromisoformat
+
+
+def configure_caches(tzinfo_size: int = 0, timestamp_size: int = 0) -> None:
+    """
+    Enable, resize or disable the caches used by :func:`parse()` and :func:`parse_many()`.
+    Both caches are disabled by default, and reconfiguring them discards their contents and statistics.
+
+    When the *tzinfo* cache is enabled, equal fixed-offset :class:`datetime.timezone` instances are interned,
+    so that a feed which always carries the same offset produces datetimes sharing a single
+    :attr:`~datetime.datetime.tzinfo` object rather than one apiece.
+
+    >>> configure_caches(tzinfo_size=64)
+    >>> parse('2009-01-01T14:01:02-04:00').tzinfo is parse('2009-05-01T14:01:02-04:00').tzinfo
+    True
+
+    When the *timestamp* cache is enabled, the most recently parsed timestamps are remembered and, if repeated,
+    the same :class:`~datetime.datetime` is returned without parsing them again. Strict parsing always
+    parses the timestamp afresh.
+
+    >>> configure_caches(timestamp_size=4096)
+    >>> parse('2009-01-01T14:01:02-04:00') is parse('2009-01-01T14:01:02-04:00')
+    True
+    >>> cache_info().timestamps
+    CacheInfo(hits=1, misses=1, evictions=0, maxsize=4096, currsize=1)
+    >>> configure_caches()
+
+    The configuration applies to calls to :func:`parse()` and to batches started by :func:`parse_many()`
+    after this function returns.
+
+    :param int tzinfo_size: the number of distinct UTC offsets to intern, or ``0`` to disable interning
+    :param int timestamp_size: the number of distinct timestamps to remember, or ``0`` to disable the cache
+
+    """
+
+    global _tzinfo_cache, _timestamp_cache, _parse_default
+
+    if tzinfo_size < 0 or timestamp_size < 0:
+        raise ValueError("cache sizes must not be negative")
+
+    _tzinfo_cache = LRUCache(tzinfo_size) if tzinfo_size else None
+    _timestamp_cache = LRUCache(timestamp_size) if timestamp_size else None
+    _parse_default = _parse_cached if tzinfo_size or timestamp_size else _fromisoformat
+
+
+def cache_info() -> ParserCacheInfo:
+    """
+    Return the statistics for the caches configured with :func:`configure_caches()`.
+    A disabled cache is reported with a :attr:`~pyrfc3339.utils.CacheInfo.maxsize` of ``0``.
+
+    """
+
+    disabled = CacheInfo(0, 0, 0, 0, 0)
+    return ParserCacheInfo(
+        _tzinfo_cache.info() if _tzinfo_cache is not None else disabled,
+        _timestamp_cache.info() if _timestamp_cache is not None else disabled,
+    )
+
+
+def cache_clear() -> None:
+    """
+    Discard the contents and statistics of the caches configured with :func:`configure_caches()`.
+
+    """
+
+    for cache in (_tzinfo_cache, _timestamp_cache):
+        if cache is not None:
+            cache.clear()
+
+
+def _make_naive(dt_out: datetime) -> datetime:
+    if datetime_utcoffset(dt_out) == 0:
+        return dt_out.replace(tzinfo=None)
+    else:
+        raise ValueError("cannot produce a naive datetime from a local timestamp")
+
+
+def make_parser(
+    utc: bool = False, produce_naive: bool = False, strict: bool = False
+) -> Callable[[str], datetime]:
+    """
+    Return a function which parses a single :RFC:`3339`-formatted timestamp as :func:`parse()` would with the
+    given options. The options are examined once, when the function is made, rather than on every call,
+    which suits a loop parsing many timestamps.
+
+    >>> parse_utc = make_parser(utc=True)
+    >>> parse_utc('2009-01-01T14:01:02-04:00')
+    datetime.datetime(2009, 1, 1, 18, 1, 2, tzinfo=datetime.timezone.utc)
+
+    The function uses the caches (see :func:`configure_caches()`) configured when it was made.
+
+    :param bool utc: as for :func:`parse()`
+    :param bool produce_naive: as for :func:`parse()`
+    :param bool strict: as for :func:`parse()`
+    :return: a function accepting a timestamp and returning a :class:`datetime.datetime`
+
+    """
+
+    parse_base = _parse_strict if strict else _parse_default
+
+    if utc and produce_naive:
+
+        # Once normalized to UTC, a datetime can always be made naive.
+        def parse_utc_naive(timestamp: str) -> datetime:
+            return parse_base(timestamp).astimezone(timezone.utc).replace(tzinfo=None)
+
+        return parse_utc_naive
+
+    if utc:
+
+        def parse_utc(timestamp: str) -> datetime:
+            return parse_base(timestamp).astimezone(timezone.utc)
+
+        return parse_utc
+
+    if produce_naive:
+
+        def parse_naive(timestamp: str) -> datetime:
+            return _make_naive(parse_base(timestamp))
+
+        return parse_naive
+
+    return parse_base
+
+
+@overload
+def parse(
+    timestamp: str,
+    utc: bool = ...,
+    produce_naive: bool = ...,
+    strict: bool = ...,
+    *,
+    precision: Literal["us"] = ...,
+) -> datetime: ...
+
+
+@overload
+def parse(
+    timestamp: str,
+    utc: bool = ...,
+    produce_naive: bool = ...,
+    strict: bool = ...,
+    *,
+    precision: Literal["ns"],
+) -> Timestamp: ...
+
+
+def parse(
+    timestamp: str,
+    utc: bool = False,
+    produce_naive: bool = False,
+    strict: bool = False,
+    *,
+    precision: Literal["us", "ns"] = "us",
+) -> datetime | Timestamp:
     """
     Parse an :RFC:`3339`-formatted timestamp and return a :class:`datetime.datetime`.
 
@@ -41,42 +485,305 @@ def parse(timestamp: str, utc: bool = False, produce_naive: bool = False) -> dat
     ...
     ValueError: hour must be in 0..23
 
+    If :meth:`parse()` is called with :python:`strict=True`, the timestamp is instead validated against the
+    ``date-time`` grammar of :RFC:`3339` section 5.6 as it is parsed, and a :exc:`ParseError` identifying the
+    offending column is raised for any deviation.
+
+    >>> parse('2009-01-01 06:01:02.123456789z', strict=True)
+    datetime.datetime(2009, 1, 1, 6, 1, 2, 123456, tzinfo=datetime.timezone.utc)
+    >>> parse('2009-01-01T06:01:02', strict=True)
+    Traceback (most recent call last):
+    ...
+    pyrfc3339.parser.ParseError: expected 'Z' or a UTC offset at column 20 of '2009-01-01T06:01:02'
+
+    With :python:`precision='ns'`, the fraction is not truncated to microseconds: a :class:`~pyrfc3339.utils.Timestamp`
+    holding the instant to the nanosecond and the UTC offset is returned instead of a :class:`~datetime.datetime`.
+
+    >>> parse('2009-01-01T06:01:02.123456789-04:00', precision='ns')
+    Timestamp(seconds=1230804062, nanoseconds=123456789, offset_minutes=-240)
+
     :param str timestamp: the :RFC:`3339` timestamp to be parsed
     :param bool utc: :const:`True` to normalize the timestamp to UTC; :const:`False` otherwise. Defaults to :const:`False`.
     :param bool produce_naive: :const:`True` if the produced :class:`~datetime.datetime` instance should
                                not have a timezone attached (that is, be 'naive'); :const:`False` otherwise.
                                Defaults to :const:`False`.
+    :param bool strict: :const:`True` to reject any timestamp which does not conform to :RFC:`3339`;
+                        :const:`False` to accept anything :meth:`datetime.datetime.fromisoformat()` does.
+                        Defaults to :const:`False`.
+    :param str precision: ``"us"`` to return a :class:`~datetime.datetime`, truncating the fraction to microseconds,
+                          or ``"ns"`` to return a :class:`~pyrfc3339.utils.Timestamp`, preserving up to 9 digits
+                          (and taking a timestamp without a UTC offset to be in UTC). Defaults to ``"us"``.
     :return: the parsed timestamp
-    :rtype: datetime.datetime
+    :rtype: datetime.datetime or pyrfc3339.utils.Timestamp
 
     """
 
-    # Python does not recognize "Z" as an alias for "+00:00", so we perform the
-    # substitution here.
-    timestamp = re.sub("Z$", "+00:00", timestamp, flags=re.IGNORECASE)
+    if _observer is not None and not _observer.busy:
+        return _observer.parse(timestamp, utc, produce_naive, strict, precision)
 
-    # Python releases prior to 3.11 only support three or six digits of fractional
-    # seconds. RFC 3339 is more lenient, so pad to six digits and truncate any
-    # excessive digits.
-    # This can be removed in October 2026, once Python 3.10 and earlier
-    # have been retired.
-    # noinspection PyUnreachableCode
-    if sys.version_info < (3, 11):
-        timestamp = re.sub(
-            r"(\.)([0-9]+)(?=[+\-][0-9]{2}:[0-9]{2}$)",
-            lambda match: match.group(1) + match.group(2).ljust(6, "0")[:6],
-            timestamp,
-        )
+    if precision != "us":
+        if precision != "ns":
+            raise ValueError(f"unknown precision: {precision!r}")
+        if produce_naive:
+            raise ValueError("cannot produce a naive datetime with precision='ns'")
+        return _parse_ns(timestamp, utc, strict)
 
-    dt_out = datetime.fromisoformat(timestamp)
+    dt_out = _parse_strict(timestamp) if strict else _parse_default(timestamp)
 
     if utc:
         dt_out = dt_out.astimezone(timezone.utc)
 
     if produce_naive:
-        if datetime_utcoffset(dt_out) == 0:
-            dt_out = dt_out.replace(tzinfo=None)
-        else:
-            raise ValueError("cannot produce a naive datetime from a local timestamp")
+        dt_out = _make_naive(dt_out)
 
     return dt_out
+
+
+def parse_bytes(
+    timestamp: bytes | bytearray | memoryview,
+    utc: bool = False,
+    produce_naive: bool = False,
+    strict: bool = False,
+) -> datetime:
+    """
+    Parse an ASCII-encoded :RFC:`3339`-formatted timestamp and return a :class:`datetime.datetime`.
+
+    >>> parse_bytes(b'2009-01-01T14:01:02-04:00', utc=True)
+    datetime.datetime(2009, 1, 1, 18, 1, 2, tzinfo=datetime.timezone.utc)
+
+    The options, results and exceptions are exactly those of :func:`parse()`.
+
+    >>> parse_bytes(memoryview(b'2009-01-01T06:01:02'), strict=True)
+    Traceback (most recent call last):
+    ...
+    pyrfc3339.parser.ParseError: expected 'Z' or a UTC offset at column 20 of '2009-01-01T06:01:02'
+
+    :param timestamp: the :RFC:`3339` timestamp to be parsed
+    :type timestamp: bytes, bytearray or memoryview
+    :param bool utc: as for :func:`parse()`
+    :param bool produce_naive: as for :func:`parse()`
+    :param bool strict: as for :func:`parse()`
+    :return: the parsed timestamp
+    :rtype: datetime.datetime
+
+    """
+
+    # Decoding straight from the buffer is a single copy, and leaves any non-ASCII byte to be
+    # rejected by the parser with the same exception parse() would raise.
+    return parse(str(timestamp, "latin-1"), utc, produce_naive, strict)
+
+
+def _sub_microsecond(timestamp: str, dt: datetime) -> int:
+    # The parser has validated the timestamp as dt and truncated its fraction to microseconds;
+    # recover the next three digits, if there are any, as nanoseconds. The fraction is not always at index 19,
+    # as lenient forms such as 20090101T100102.123456789Z are accepted, so find the last separator before the UTC
+    # offset, which may itself have a fraction; the offset begins with its sign, as the time has none.
+    end = len(timestamp)
+    if dt.tzinfo is not None:
+        if timestamp[-1] in "Zz":
+            end -= 1
+        else:
+            end = max(timestamp.rfind("+"), timestamp.rfind("-"))
+    start = max(timestamp.rfind(".", 0, end), timestamp.rfind(",", 0, end)) + 1
+    if start:
+        first = start + 6
+        last = min(first + 3, end)
+        digits = timestamp[first:last]
+        if digits.isdigit():
+            return int(digits.ljust(3, "0"))
+    return 0
+
+
+def _parse_ns(timestamp: str, utc: bool, strict: bool) -> Timestamp:
+    dt = _parse_strict(timestamp) if strict else _parse_default(timestamp)
+
+    offset_minutes = 0
+    offset = dt.utcoffset()
+    if not utc and offset is not None:
+        offset_minutes, remainder = divmod(offset, _MINUTE)
+        if remainder:
+            raise ValueError("UTC offset is not a whole number of minutes")
+
+    seconds, nanoseconds = divmod(
+        datetime_epoch_us(dt) * 1000 + _sub_microsecond(timestamp, dt), 1_000_000_000
+    )
+    return Timestamp(seconds, nanoseconds, offset_minutes)
+
+
+def parse_to_epoch_us(timestamp: str, strict: bool = False) -> int:
+    """
+    Parse an :RFC:`3339`-formatted timestamp and return the number of microseconds since the Unix epoch.
+
+    >>> parse_to_epoch_us('2009-01-01T14:01:02.25-04:00')
+    1230832862250000
+
+    Timestamps are parsed as by :func:`parse()`, with a timestamp lacking a UTC offset being taken to be in UTC,
+    and fractions of a microsecond being truncated.
+
+    :param str timestamp: the :RFC:`3339` timestamp to be parsed
+    :param bool strict: as for :func:`parse()`
+    :return: the number of microseconds since 1970-01-01T00:00:00Z
+    :rtype: int
+
+    """
+
+    return datetime_epoch_us(
+        _parse_strict(timestamp) if strict else _parse_default(timestamp)
+    )
+
+
+def parse_to_epoch_ns(timestamp: str, strict: bool = False) -> int:
+    """
+    Parse an :RFC:`3339`-formatted timestamp and return the number of nanoseconds since the Unix epoch.
+
+    >>> parse_to_epoch_ns('2009-01-01T14:01:02.123456789-04:00')
+    1230832862123456789
+
+    Unlike :func:`parse()`, which is limited by the resolution of :class:`datetime.datetime`, this preserves
+    up to 9 fractional digits; any further digits are truncated. Otherwise, timestamps are parsed as by
+    :func:`parse_to_epoch_us()`.
+
+    :param str timestamp: the :RFC:`3339` timestamp to be parsed
+    :param bool strict: as for :func:`parse()`
+    :return: the number of nanoseconds since 1970-01-01T00:00:00Z
+    :rtype: int
+
+    """
+
+    dt = _parse_strict(timestamp) if strict else _parse_default(timestamp)
+
+    return datetime_epoch_us(dt) * 1000 + _sub_microsecond(timestamp, dt)
+
+
+@overload
+def parse_many(
+    timestamps: Iterable[str],
+    utc: bool = ...,
+    produce_naive: bool = ...,
+    strict: bool = ...,
+    errors: Literal["raise", "skip"] = ...,
+    *,
+    lazy: Literal[False] = ...,
+) -> list[datetime]: ...
+
+
+@overload
+def parse_many(
+    timestamps: Iterable[str],
+    utc: bool = ...,
+    produce_naive: bool = ...,
+    strict: bool = ...,
+    errors: Literal["raise", "skip"] = ...,
+    *,
+    lazy: Literal[True],
+) -> Iterator[datetime]: ...
+
+
+@overload
+def parse_many(
+    timestamps: Iterable[str],
+    utc: bool = ...,
+    produce_naive: bool = ...,
+    strict: bool = ...,
+    errors: ErrorPolicy = ...,
+    *,
+    lazy: Literal[False] = ...,
+) -> list[datetime | None]: ...
+
+
+@overload
+def parse_many(
+    timestamps: Iterable[str],
+    utc: bool = ...,
+    produce_naive: bool = ...,
+    strict: bool = ...,
+    errors: ErrorPolicy = ...,
+    *,
+    lazy: Literal[True],
+) -> Iterator[datetime | None]: ...
+
+
+def parse_many(
+    timestamps: Iterable[str],
+    utc: bool = False,
+    produce_naive: bool = False,
+    strict: bool = False,
+    errors: ErrorPolicy = "raise",
+    *,
+    lazy: bool = False,
+) -> (
+    list[datetime]
+    | list[datetime | None]
+    | Iterator[datetime]
+    | Iterator[datetime | None]
+):
+    """
+    Parse many :RFC:`3339`-formatted timestamps at once.
+
+    The options are interpreted exactly as for :func:`parse()`, but are examined only once
+    for the whole batch rather than once per timestamp.
+
+    >>> for dt in parse_many(['2009-01-01T10:01:02Z', '2009-01-01T14:01:02-04:00'], utc=True):
+    ...     print(dt)
+    2009-01-01 10:01:02+00:00
+    2009-01-01 18:01:02+00:00
+
+    By default, the first invalid timestamp raises a :exc:`ValueError`, as it would for :func:`parse()`.
+    With :python:`errors='skip'`, invalid timestamps are left out of the result; with :python:`errors='none'`,
+    they are replaced by :const:`None`.
+
+    >>> parse_many(['2009-01-01T10:01:02Z', 'yesterday'], errors='none')
+    [datetime.datetime(2009, 1, 1, 10, 1, 2, tzinfo=datetime.timezone.utc), None]
+
+    Alternatively, :obj:`errors` may be a callable, which is passed the invalid timestamp and the
+    :exc:`ValueError` raised for it, and whose return value is produced in place of the timestamp.
+
+    >>> parse_many(['yesterday'], errors=lambda timestamp, exc: datetime.min)
+    [datetime.datetime(1, 1, 1, 0, 0)]
+
+    With :python:`lazy=True`, an iterator is returned instead of a list, and timestamps are parsed as it is consumed.
+
+    >>> results = parse_many(iter(['2009-01-01T10:01:02Z']), lazy=True)
+    >>> next(results)
+    datetime.datetime(2009, 1, 1, 10, 1, 2, tzinfo=datetime.timezone.utc)
+
+    :param timestamps: an iterable of :RFC:`3339` timestamps to be parsed
+    :type timestamps: typing.Iterable[str]
+    :param bool utc: as for :func:`parse()`
+    :param bool produce_naive: as for :func:`parse()`
+    :param bool strict: as for :func:`parse()`
+    :param errors: the policy for invalid timestamps: ``"raise"``, ``"skip"``, ``"none"``, or a callable.
+                   Defaults to ``"raise"``.
+    :param bool lazy: :const:`True` to return an iterator; :const:`False` to return a list. Defaults to :const:`False`.
+    :return: the parsed timestamps, in the order in which they were supplied
+
+    """
+
+    parse_one = make_parser(utc, produce_naive, strict)
+
+    results: Iterator[datetime | None]
+
+    if errors == "raise":
+        results = map(parse_one, timestamps)
+    elif errors == "skip" or errors == "none" or callable(errors):
+        results = _parse_guarded(parse_one, timestamps, errors)
+    else:
+        raise ValueError(f"unknown error policy: {errors!r}")
+
+    return results if lazy else list(results)
+
+
+def _parse_guarded(
+    parse_one: Callable[[str], datetime], timestamps: Iterable[str], errors: ErrorPolicy
+) -> Iterator[datetime | None]:
+    for timestamp in timestamps:
+        try:
+            yield parse_one(timestamp)
+        except ValueError as exc:
+            if errors == "skip":
+                continue
+            elif errors == "none":
+                yield None
+            else:
+                assert callable(errors)
+                yield errors(timestamp, exc)
@@ -0,0 +1,173 @@
+"""
+Sort, compare and search :RFC:`3339` timestamps held as strings, by integer keys or, where they allow, as the strings
+themselves, rather than by :class:`~datetime.datetime` instances.
+
+>>> timestamps = ['2009-01-01T14:01:02-04:00', '2009-01-01T10:01:02Z', '2009-01-01T12:01:02+01:00']
+>>> sorted_timestamps(timestamps)
+['2009-01-01T10:01:02Z', '2009-01-01T12:01:02+01:00', '2009-01-01T14:01:02-04:00']
+
+"""
+
+from bisect import bisect_left
+from datetime import datetime
+from typing import Iterable, Sequence
+
+from .parser import parse_to_epoch_us
+from .utils import datetime_epoch_us
+
+# The length of a timestamp in UTC with six fractional digits.
+_MAX_STRING_LENGTH = 27
+
+
+def rfc3339_sort_key(timestamp: str) -> int:
+    """
+    Return a key by which :RFC:`3339` timestamps sort in chronological order: the number of microseconds since the
+    Unix epoch, as :func:`pyrfc3339.parser.parse_to_epoch_us()` returns.
+
+    >>> rfc3339_sort_key('2009-01-01T14:01:02.25-04:00')
+    1230832862250000
+    >>> sorted(['2009-01-01T14:01:02-04:00', '2009-01-01T18:01:01Z'], key=rfc3339_sort_key)
+    ['2009-01-01T18:01:01Z', '2009-01-01T14:01:02-04:00']
+
+    The timestamp is parsed as by :func:`~pyrfc3339.parser.parse_to_epoch_us()`, so an invalid timestamp raises
+    :exc:`ValueError`, a timestamp lacking a UTC offset is taken to be in UTC, and fractions of a microsecond are
+    truncated. Integer keys compare far faster than aware :class:`~datetime.datetime` instances, each comparison of
+    which looks up both UTC offsets.
+
+    :param str timestamp: the :RFC:`3339` timestamp
+    :return: the number of microseconds since 1970-01-01T00:00:00Z
+    :rtype: int
+
+    """
+
+    # Parsing the local time and applying the offset in Python is slower than
+    # datetime.fromisoformat() constructing the fixed-offset timezone in C.
+    return parse_to_epoch_us(timestamp)
+
+
+def _uniform_utc(timestamps: Sequence[str]) -> bool:
+    # Whether the timestamps have the same length, with "T" and "Z" and the same fraction separator, as valid
+    # timestamps in UTC with the same fraction width do; those sort as strings. Beyond six digits, the strings
+    # distinguish instants which parse to the same microsecond, so those are excluded.
+    if not timestamps:
+        return True
+    first = timestamps[0]
+    length = len(first)
+    separator = first[19:20]
+    return 20 <= length <= _MAX_STRING_LENGTH and all(
+        len(timestamp) == length
+        and timestamp[-1] == "Z"
+        and timestamp[10] == "T"
+        and timestamp[19] == separator
+        for timestamp in timestamps
+    )
+
+
+def compare(a: str, b: str) -> int:
+    """
+    Compare two :RFC:`3339` timestamps chronologically, returning a negative number if :obj:`a` is earlier than
+    :obj:`b`, zero if they denote the same instant, or a positive number if :obj:`a` is later.
+
+    >>> compare('2009-01-01T14:01:02-04:00', '2009-01-01T18:01:01Z')
+    1
+    >>> compare('2009-01-01T14:01:02-04:00', '2009-01-01T18:01:02Z')
+    0
+
+    Two timestamps in UTC, written with ``T`` and ``Z`` and having fractions of the same width, up to six digits, are compared as
+    strings; they are not validated. Otherwise, they are compared by :func:`rfc3339_sort_key()`.
+
+    :param str a: an :RFC:`3339` timestamp
+    :param str b: an :RFC:`3339` timestamp
+    :rtype: int
+
+    """
+
+    if (
+        len(a) == len(b)
+        and 20 <= len(a) <= _MAX_STRING_LENGTH
+        and a[-1] == b[-1] == "Z"
+        and a[10] == b[10] == "T"
+        and a[19] == b[19]
+    ):
+        return (a > b) - (a < b)
+    key_a = rfc3339_sort_key(a)
+    key_b = rfc3339_sort_key(b)
+    return (key_a > key_b) - (key_a < key_b)
+
+
+def sorted_timestamps(timestamps: Iterable[str], reverse: bool = False) -> list[str]:
+    """
+    Return a new list of :RFC:`3339` timestamps in chronological order, as :func:`sorted()` would;
+    the sort is stable, so timestamps denoting the same instant keep their relative order.
+
+    >>> sorted_timestamps(['2009-01-01T10:01:03Z', '2009-01-01T10:01:01Z', '2009-01-01T10:01:02Z'], reverse=True)
+    ['2009-01-01T10:01:03Z', '2009-01-01T10:01:02Z', '2009-01-01T10:01:01Z']
+
+    If every timestamp is in UTC, written with ``T`` and ``Z`` and having a fraction of the same width, up to six digits,
+    they are sorted as strings without being validated. Otherwise, they are sorted by :func:`rfc3339_sort_key()`.
+
+    :param timestamps: the timestamps to sort
+    :param bool reverse: :const:`True` to sort them latest first. Defaults to :const:`False`.
+    :return: the sorted timestamps
+    :rtype: list[str]
+
+    """
+
+    result = list(timestamps)
+    if _uniform_utc(result):
+        result.sort(reverse=reverse)
+    else:
+        result.sort(key=rfc3339_sort_key, reverse=reverse)
+    return result
+
+
+def bisect_range(
+    timestamps: Sequence[str],
+    start: str | datetime | None = None,
+    stop: str | datetime | None = None,
+) -> tuple[int, int]:
+    """
+    Find the timestamps within a range in a sequence of :RFC:`3339` timestamps in chronological order,
+    such as one returned by :func:`sorted_timestamps()`, by binary search.
+
+    Return the indices :python:`(lo, hi)` such that :python:`timestamps[lo:hi]` holds the timestamps
+    at or after :obj:`start` and before :obj:`stop`.
+
+    >>> timestamps = ['2009-01-01T10:01:01Z', '2009-01-01T10:01:02Z', '2009-01-01T06:01:03-04:00']
+    >>> bisect_range(timestamps, '2009-01-01T10:01:02Z')
+    (1, 3)
+    >>> from datetime import datetime, timezone
+    >>> bisect_range(timestamps, stop=datetime(2009, 1, 1, 10, 1, 3, tzinfo=timezone.utc))
+    (0, 2)
+
+    Only the timestamps examined by the search are parsed, :math:`O(\\log n)` of them.
+
+    :param timestamps: the timestamps to search, in chronological order
+    :param start: the inclusive lower bound, as a timestamp or :class:`~datetime.datetime`,
+                  or :const:`None` for no lower bound. A naive datetime is taken to be in UTC.
+    :type start: str, datetime.datetime or None
+    :param stop: the exclusive upper bound, likewise
+    :type stop: str, datetime.datetime or None
+    :rtype: tuple[int, int]
+
+    """
+
+    lo = (
+        0
+        if start is None
+        else bisect_left(timestamps, _bound(start), key=rfc3339_sort_key)
+    )
+    hi = (
+        len(timestamps)
+        if stop is None
+        else bisect_left(timestamps, _bound(stop), lo, key=rfc3339_sort_key)
+    )
+    return lo, hi
+
+
+def _bound(bound: str | datetime) -> int:
+    return (
+        datetime_epoch_us(bound)
+        if isinstance(bound, datetime)
+        else rfc3339_sort_key(bound)
+    )
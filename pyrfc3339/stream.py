@@ -0,0 +1,187 @@
+"""
+Parse :RFC:`3339` timestamps from a file, one per line or from one column of a delimited file,
+reading it in large chunks so that memory use does not grow with the size of the file.
+
+>>> import io
+>>> log = io.StringIO('2009-01-01T10:01:02Z GET /\\n2009-01-01T10:01:03Z GET /favicon.ico\\n')
+>>> for dt in iter_parse(log, column=0):
+...     print(dt)
+2009-01-01 10:01:02+00:00
+2009-01-01 10:01:03+00:00
+
+"""
+
+from datetime import datetime
+from typing import IO, Callable, Iterable, Iterator, Literal, overload
+
+from .parser import make_parser
+from .utils import datetime_epoch_us
+
+#: The number of characters (or bytes) :func:`iter_parse()` reads at a time, by default.
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+class RecordError(ValueError):
+    """
+    Raised by :func:`iter_parse()` when a record does not contain a valid timestamp.
+    The exception which caused it, if any, is available as :attr:`__cause__`.
+
+    :param int line: the (1-based) line number of the record
+    :param str record: the record, without its line ending
+    :param str reason: a description of the error
+
+    """
+
+    def __init__(self, line: int, record: str, reason: str) -> None:
+        super().__init__(line, record, reason)
+        self.line = line
+        self.record = record
+        self.reason = reason
+
+    def __str__(self) -> str:
+        return f"line {self.line}: {self.reason}"
+
+
+def _lines(fileobj: IO[str] | IO[bytes], chunk_size: int) -> Iterator[str]:
+    # Lines are reassembled across chunk boundaries. Binary files are decoded as Latin-1,
+    # which maps every byte to a single character and therefore cannot fail or split a character;
+    # any non-ASCII character in a timestamp is rejected when it is parsed.
+    remainder = ""
+
+    while chunk := fileobj.read(chunk_size):
+        text = chunk.decode("latin-1") if isinstance(chunk, bytes) else chunk
+        lines = (remainder + text).split("\n")
+        remainder = lines.pop()
+        yield from lines
+
+    if remainder:
+        yield remainder
+
+
+@overload
+def iter_parse(
+    fileobj: IO[str] | IO[bytes],
+    column: int | None = ...,
+    delimiter: str | None = ...,
+    utc: bool = ...,
+    produce_naive: bool = ...,
+    strict: bool = ...,
+    errors: Literal["raise", "skip"] = ...,
+    *,
+    output: Literal["datetime"] = ...,
+    chunk_size: int = ...,
+) -> Iterator[datetime]: ...
+
+
+@overload
+def iter_parse(
+    fileobj: IO[str] | IO[bytes],
+    column: int | None = ...,
+    delimiter: str | None = ...,
+    utc: bool = ...,
+    produce_naive: bool = ...,
+    strict: bool = ...,
+    errors: Literal["raise", "skip"] = ...,
+    *,
+    output: Literal["epoch_us"],
+    chunk_size: int = ...,
+) -> Iterator[int]: ...
+
+
+def iter_parse(
+    fileobj: IO[str] | IO[bytes],
+    column: int | None = None,
+    delimiter: str | None = None,
+    utc: bool = False,
+    produce_naive: bool = False,
+    strict: bool = False,
+    errors: Literal["raise", "skip"] = "raise",
+    *,
+    output: Literal["datetime", "epoch_us"] = "datetime",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[datetime | int]:
+    """
+    Lazily parse the timestamps in a text or binary file, one per line.
+
+    If :obj:`column` is :const:`None`, each line (less any surrounding whitespace) is a timestamp. Otherwise, each line
+    is split on :obj:`delimiter` (or on runs of whitespace, if :obj:`delimiter` is :const:`None`, as by :meth:`str.split()`)
+    and the timestamp is taken from the given (0-based) column. Quoted fields are not supported. Blank lines are ignored.
+
+    >>> import io
+    >>> csv = io.BytesIO(b'id,time\\r\\n1,2009-01-01T14:01:02-04:00\\r\\n2,2009-01-01T14:01:03-04:00\\r\\n')
+    >>> list(iter_parse(csv, column=1, delimiter=',', utc=True, errors='skip', output='epoch_us'))
+    [1230832862000000, 1230832863000000]
+
+    Unless :python:`errors='skip'` is specified, a record which does not contain a valid timestamp raises
+    a :exc:`RecordError` giving its line number.
+
+    >>> list(iter_parse(io.StringIO('2009-01-01T10:01:02Z\\nyesterday\\n')))
+    Traceback (most recent call last):
+    ...
+    pyrfc3339.stream.RecordError: line 2: Invalid isoformat string: 'yesterday'
+
+    :param fileobj: the file from which to read, opened in either text or binary mode
+    :param column: the column containing the timestamp, or :const:`None` if each line is a timestamp
+    :type column: int or None
+    :param delimiter: the column delimiter, or :const:`None` to split columns on whitespace
+    :type delimiter: str or None
+    :param bool utc: as for :func:`pyrfc3339.parse()`
+    :param bool produce_naive: as for :func:`pyrfc3339.parse()`
+    :param bool strict: as for :func:`pyrfc3339.parse()`
+    :param str errors: ``"raise"`` to raise :exc:`RecordError` for an invalid record, or ``"skip"`` to ignore it.
+                       Defaults to ``"raise"``.
+    :param str output: ``"datetime"`` to produce :class:`datetime.datetime` instances as :func:`pyrfc3339.parse()` would,
+                       or ``"epoch_us"`` to produce the number of microseconds since the Unix epoch instead
+                       (a naive :class:`~datetime.datetime` being taken to be in UTC). Defaults to ``"datetime"``.
+    :param int chunk_size: the number of characters (or bytes) to read at a time. Defaults to :data:`DEFAULT_CHUNK_SIZE`.
+    :return: an iterator over the parsed timestamps
+
+    """
+
+    if errors not in ("raise", "skip"):
+        raise ValueError(f"unknown error policy: {errors!r}")
+    if output not in ("datetime", "epoch_us"):
+        raise ValueError(f"unknown output: {output!r}")
+
+    return _parse_lines(
+        enumerate(_lines(fileobj, chunk_size), 1),
+        column,
+        delimiter,
+        make_parser(utc, produce_naive, strict),
+        errors,
+        output,
+    )
+
+
+def _parse_lines(
+    numbered_lines: Iterable[tuple[int, str]],
+    column: int | None,
+    delimiter: str | None,
+    parse_one: Callable[[str], datetime],
+    errors: str,
+    output: str,
+) -> Iterator[datetime | int]:
+    for line_number, line in numbered_lines:
+        line = line.rstrip("\r")
+        if not line or line.isspace():
+            continue
+
+        try:
+            if column is None:
+                timestamp = line.strip()
+            else:
+                fields = line.split(delimiter)
+                if not -len(fields) <= column < len(fields):
+                    raise RecordError(line_number, line, f"no column {column}")
+                timestamp = fields[column].strip()
+
+            try:
+                dt = parse_one(timestamp)
+            except ValueError as exc:
+                raise RecordError(line_number, line, str(exc)) from exc
+        except RecordError:
+            if errors == "skip":
+                continue
+            raise
+
+        yield dt if output == "datetime" else datetime_epoch_us(dt)
@@ -3,12 +3,90 @@ Test suite for pyRFC3339.
 
 """
 
+import asyncio
+import doctest
+import io
+import itertools
+import json
+import os
+import pickle
+import random
+import subprocess
+import sys
+import threading
 import unittest
 import zoneinfo
-from datetime import datetime, timezone
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Iterator
+from unittest import mock
 from zoneinfo import ZoneInfo
 
-from pyrfc3339 import generate, parse
+import pyrfc3339
+import pyrfc3339.generator
+import pyrfc3339.parser
+import pyrfc3339.utils
+from pyrfc3339 import (
+    ParseError,
+    Timestamp,
+    generate,
+    generate_bytes,
+    instrumentation,
+    make_generator,
+    make_parser,
+    parse,
+    parse_bytes,
+    parse_many,
+)
+from pyrfc3339.aio import aiter_parse
+from pyrfc3339.bulk import (
+    generate_threaded,
+    parse_parallel,
+    parse_records,
+    parse_threaded,
+)
+from pyrfc3339.generator import (
+    WRITE_CHUNK_SIZE,
+    Rfc3339Formatter,
+    generate_from_epoch,
+    generate_into,
+    generate_many,
+    generate_range,
+    write_many,
+)
+from pyrfc3339.lazy import LazyRFC3339, Rfc3339Encoder, object_hook
+from pyrfc3339.parser import (
+    cache_clear,
+    cache_info,
+    configure_caches,
+    parse_to_epoch_ns,
+    parse_to_epoch_us,
+)
+from pyrfc3339.sorting import (
+    bisect_range,
+    compare,
+    rfc3339_sort_key,
+    sorted_timestamps,
+)
+from pyrfc3339.stream import RecordError, iter_parse
+from pyrfc3339.utils import CacheInfo, LRUCache, datetime_epoch_us
+
+try:
+    import numpy as np
+
+    from pyrfc3339.numpy import generate_array, parse_array
+
+    HAVE_NUMPY = True
+except ImportError:  # pragma: no cover
+    HAVE_NUMPY = False
+
+try:
+    from pyrfc3339 import _speedups
+
+    HAVE_SPEEDUPS = True
+except ImportError:  # pragma: no cover
+    HAVE_SPEEDUPS = False
 
 
 class TestCore(unittest.TestCase):
@@ -57,6 +135,20 @@ class TestCore(unittest.TestCase):
         dt = parse(timestamp)
         self.assertEqual(dt.microsecond, 250000)
 
+    def test_fraction_digits(self) -> None:
+        """
+        Test that any number of fractional digits is accepted, with either
+        'Z' or an offset, and that the fraction is padded or truncated to microseconds.
+
+        """
+        for digits in range(1, 10):
+            fraction = "123456789"[:digits]
+            for suffix in ("Z", "z", "+00:00", "-04:00"):
+                with self.subTest(digits=digits, suffix=suffix):
+                    dt = parse(f"2009-01-01T10:02:03.{fraction}{suffix}")
+                    self.assertEqual(dt.microsecond, int(fraction[:6].ljust(6, "0")))
+                    self.assertEqual(dt.second, 3)
+
     def test_generate_microseconds(self) -> None:
         """
         Test generating timestamps with microseconds.
@@ -77,6 +169,23 @@ class TestCore(unittest.TestCase):
 
         self.assertEqual(dt1, dt2)
 
+    def test_date_z(self) -> None:
+        """
+        A date alone followed by 'Z' or 'z' is accepted as by earlier releases, on every supported version
+        of Python, while any other invalid timestamp is reported as it is given.
+
+        """
+        for timestamp in ("2009-01-01Z", "2009-01-01z"):
+            with self.subTest(timestamp=timestamp):
+                self.assertEqual(parse(timestamp), datetime(2009, 1, 1))
+                self.assertEqual(
+                    pyrfc3339.parser.parse(timestamp), datetime(2009, 1, 1)
+                )
+
+        with self.assertRaises(ValueError) as cm:
+            pyrfc3339.parser.parse("2009-13-01T10:01:02Z")
+        self.assertNotIn("+00:00", str(cm.exception))
+
     def test_z(self) -> None:
         """
         Timestamps which are explicitly in UTC should end in 'Z', while
@@ -145,6 +254,2738 @@ class TestCore(unittest.TestCase):
         self.assertEqual(generate(dt), "0999-01-01T00:00:00Z")
 
 
+class TestFactories(unittest.TestCase):
+    """
+    Tests for :func:`pyrfc3339.make_parser()` and :func:`pyrfc3339.make_generator()`,
+    which must agree with :func:`pyrfc3339.parse()` and :func:`pyrfc3339.generate()`.
+
+    """
+
+    def test_make_parser(self) -> None:
+        """
+        Every combination of options produces the same results and errors as :func:`parse()`.
+
+        """
+        timestamps = [
+            "2009-01-01T10:01:02Z",
+            "2009-01-01T14:01:02-04:00",
+            "2009-01-01t10:01:02.25z",
+            "2009-01-01T10:01:02",
+            "2009-01-01T25:01:02Z",
+        ]
+        for utc, produce_naive, strict in itertools.product((False, True), repeat=3):
+            parse_one = make_parser(utc, produce_naive, strict)
+            for timestamp in timestamps:
+                with self.subTest(
+                    timestamp=timestamp,
+                    utc=utc,
+                    produce_naive=produce_naive,
+                    strict=strict,
+                ):
+                    try:
+                        expected = parse(timestamp, utc, produce_naive, strict)
+                    except Exception as exc:
+                        with self.assertRaises(type(exc)) as cm:
+                            parse_one(timestamp)
+                        self.assertEqual(str(cm.exception), str(exc))
+                    else:
+                        actual = parse_one(timestamp)
+                        self.assertEqual(actual, expected)
+                        self.assertEqual(actual.tzinfo, expected.tzinfo)
+
+    def test_make_generator(self) -> None:
+        """
+        Every combination of options produces the same results and errors as :func:`generate()`.
+
+        """
+        datetimes = [
+            datetime(2009, 1, 1, 12, 59, 59, 250000),
+            datetime(2009, 1, 1, 12, 59, 59, tzinfo=timezone.utc),
+            datetime(2009, 1, 1, 12, 59, 59, tzinfo=timezone(timedelta(hours=-4))),
+            datetime(2024, 11, 3, 1, 30, tzinfo=ZoneInfo("US/Eastern"), fold=1),
+        ]
+        for utc, accept_naive, microseconds in itertools.product(
+            (False, True), repeat=3
+        ):
+            generate_one = make_generator(utc, accept_naive, microseconds)
+            for dt in datetimes:
+                with self.subTest(
+                    dt=dt, utc=utc, accept_naive=accept_naive, microseconds=microseconds
+                ):
+                    try:
+                        expected = generate(dt, utc, accept_naive, microseconds)
+                    except ValueError as exc:
+                        with self.assertRaises(ValueError) as cm:
+                            generate_one(dt)
+                        self.assertEqual(str(cm.exception), str(exc))
+                    else:
+                        self.assertEqual(generate_one(dt), expected)
+
+
+class TestParseMany(unittest.TestCase):
+    """
+    Tests for :func:`pyrfc3339.parse_many()`, which must agree with :func:`pyrfc3339.parse()`.
+
+    """
+
+    timestamps = [
+        "2009-01-01T10:01:02Z",
+        "2009-01-01T14:01:02-04:00",
+        "2009-01-01T10:01:02.25+05:30",
+        "2009-01-01t10:01:02z",
+    ]
+
+    def test_matches_parse(self) -> None:
+        """
+        Every combination of options produces the same results as :func:`parse()`.
+
+        """
+        for utc in (False, True):
+            with self.subTest(utc=utc):
+                self.assertEqual(
+                    parse_many(self.timestamps, utc=utc),
+                    [parse(timestamp, utc=utc) for timestamp in self.timestamps],
+                )
+
+        self.assertEqual(
+            parse_many(self.timestamps[:1], produce_naive=True),
+            [parse(self.timestamps[0], produce_naive=True)],
+        )
+
+    def test_lazy(self) -> None:
+        """
+        With :python:`lazy=True`, nothing is parsed until the iterator is consumed.
+
+        """
+        results = parse_many(["invalid"], lazy=True)
+        with self.assertRaises(ValueError):
+            next(results)
+
+    def test_error_policies(self) -> None:
+        """
+        Invalid timestamps are raised, skipped, replaced with :const:`None`,
+        or passed to a callback, according to the error policy.
+
+        """
+        timestamps = ["2009-01-01T10:01:02Z", "2009-01-01T25:01:02Z"]
+        expected = parse(timestamps[0])
+
+        with self.assertRaises(ValueError):
+            parse_many(timestamps)
+
+        self.assertEqual(parse_many(timestamps, errors="skip"), [expected])
+        self.assertEqual(parse_many(timestamps, errors="none"), [expected, None])
+
+        failures: list[tuple[str, ValueError]] = []
+
+        def record(timestamp: str, exc: ValueError) -> None:
+            failures.append((timestamp, exc))
+
+        self.assertEqual(parse_many(timestamps, errors=record), [expected, None])
+        self.assertEqual(len(failures), 1)
+        self.assertEqual(failures[0][0], timestamps[1])
+        self.assertIsInstance(failures[0][1], ValueError)
+
+    def test_produce_naive_local(self) -> None:
+        """
+        Local timestamps cannot be made naive, and are treated as any other error.
+
+        """
+        self.assertEqual(
+            parse_many(
+                ["2009-01-01T10:01:02-04:00"], produce_naive=True, errors="none"
+            ),
+            [None],
+        )
+
+    def test_unknown_policy(self) -> None:
+        """
+        An unrecognized error policy is rejected immediately, even when parsing lazily.
+
+        """
+        with self.assertRaises(ValueError):
+            parse_many([], errors="ignore", lazy=True)  # type: ignore[call-overload]
+
+
+class TestBytes(unittest.TestCase):
+    """
+    Tests for :func:`pyrfc3339.parse_bytes()`, :func:`pyrfc3339.generate_bytes()`
+    and :func:`pyrfc3339.generator.generate_into()`, which must agree with their :class:`str` counterparts.
+
+    """
+
+    timestamps = [
+        "2009-01-01T10:01:02Z",
+        "2009-01-01T14:01:02-04:00",
+        "2009-01-01T10:01:02.25+05:30",
+        "2009-01-01t10:01:02z",
+    ]
+
+    def test_parse_bytes(self) -> None:
+        """
+        Every buffer type and combination of options produces the same results as :func:`parse()`.
+
+        """
+        for timestamp in self.timestamps:
+            for data in (
+                timestamp.encode(),
+                bytearray(timestamp.encode()),
+                memoryview(b"|" + timestamp.encode())[1:],
+            ):
+                for utc, strict in itertools.product((False, True), repeat=2):
+                    with self.subTest(data=data, utc=utc, strict=strict):
+                        self.assertEqual(
+                            parse_bytes(data, utc=utc, strict=strict),
+                            parse(timestamp, utc=utc, strict=strict),
+                        )
+
+    def test_parse_bytes_errors(self) -> None:
+        """
+        Invalid input raises the same exceptions as :func:`parse()`.
+
+        """
+        for timestamp in ("2009-01-01T25:01:02Z", "2009-01-01T10:01:0²Z", ""):
+            for strict in (False, True):
+                with self.subTest(timestamp=timestamp, strict=strict):
+                    with self.assertRaises(ValueError) as expected:
+                        parse(timestamp, strict=strict)
+                    with self.assertRaises(ValueError) as actual:
+                        parse_bytes(timestamp.encode(), strict=strict)
+                    self.assertIs(type(actual.exception), type(expected.exception))
+
+        with self.assertRaises(ValueError) as cm:
+            parse_bytes(b"2009-01-01T10:01:02Z\xff", strict=True)
+        self.assertEqual(cm.exception.column, 21)  # type: ignore[attr-defined]
+
+    def test_generate_bytes(self) -> None:
+        """
+        :func:`generate_bytes()` and :func:`generate_into()` produce the ASCII encoding of :func:`generate()`.
+
+        """
+        dt = datetime(
+            2009, 1, 1, 10, 1, 2, 250000, tzinfo=timezone(timedelta(hours=-4))
+        )
+        for utc, microseconds in itertools.product((False, True), repeat=2):
+            with self.subTest(utc=utc, microseconds=microseconds):
+                expected = generate(dt, utc=utc, microseconds=microseconds).encode()
+                self.assertEqual(
+                    generate_bytes(dt, utc=utc, microseconds=microseconds), expected
+                )
+
+                buffer = bytearray(b"<" + bytes(len(expected)) + b">")
+                written = generate_into(
+                    memoryview(buffer), 1, dt, utc=utc, microseconds=microseconds
+                )
+                self.assertEqual(written, len(expected))
+                self.assertEqual(buffer, b"<" + expected + b">")
+
+        with self.assertRaises(ValueError):
+            generate_bytes(datetime(2009, 1, 1))
+
+    def test_generate_into_bounds(self) -> None:
+        """
+        :func:`generate_into()` never resizes the buffer or writes outside it.
+
+        """
+        dt = datetime(2009, 1, 1, tzinfo=timezone.utc)
+        for size, offset in ((19, 0), (20, 1), (40, -1)):
+            with self.subTest(size=size, offset=offset):
+                buffer = bytearray(size)
+                with self.assertRaises(ValueError):
+                    generate_into(buffer, offset, dt)
+                self.assertEqual(buffer, bytearray(size))
+
+
+class TestGenerateMany(unittest.TestCase):
+    """
+    Tests for :func:`pyrfc3339.generator.generate_many()` and :func:`pyrfc3339.generator.write_many()`,
+    which must agree with :func:`pyrfc3339.generate()`.
+
+    """
+
+    datetimes = [
+        datetime(2009, 1, 1, 12, 59, 59, 250000, tzinfo=timezone.utc),
+        datetime(2009, 1, 1, 12, 59, 59, tzinfo=ZoneInfo("US/Eastern")),
+        datetime(2009, 7, 1, 12, 59, 59, 1, tzinfo=ZoneInfo("US/Eastern")),
+        datetime(
+            2009, 1, 1, 12, 59, 59, tzinfo=timezone(timedelta(hours=5, minutes=30))
+        ),
+        datetime(2009, 1, 1, 12, 59, 59, tzinfo=timezone(timedelta(0), "GMT")),
+        datetime(1863, 1, 10, 6, 0, tzinfo=ZoneInfo("Europe/London")),
+    ]
+
+    def test_matches_generate(self) -> None:
+        """
+        Every combination of options produces the same results as :func:`generate()`.
+
+        """
+        for utc, microseconds in itertools.product((False, True), repeat=2):
+            with self.subTest(utc=utc, microseconds=microseconds):
+                self.assertEqual(
+                    generate_many(self.datetimes, utc=utc, microseconds=microseconds),
+                    [
+                        generate(dt, utc=utc, microseconds=microseconds)
+                        for dt in self.datetimes
+                    ],
+                )
+
+    def test_naive(self) -> None:
+        """
+        Naive datetimes are handled exactly as by :func:`generate()`.
+
+        """
+        naive = [datetime(2009, 1, 1, 12, 59, 59)]
+
+        self.assertEqual(
+            generate_many(naive, accept_naive=True),
+            [generate(naive[0], accept_naive=True)],
+        )
+
+        for utc, accept_naive in ((True, False), (False, False), (False, True)):
+            with self.subTest(utc=utc, accept_naive=accept_naive):
+                with self.assertRaises(ValueError) as expected:
+                    generate(naive[0], utc=utc, accept_naive=accept_naive)
+                with self.assertRaises(ValueError) as actual:
+                    generate_many(naive, utc=utc, accept_naive=accept_naive)
+                self.assertEqual(str(actual.exception), str(expected.exception))
+
+    def test_write_many(self) -> None:
+        """
+        Timestamps are written with separators between them, including across chunk boundaries.
+
+        """
+        datetimes = self.datetimes * (WRITE_CHUNK_SIZE // len(self.datetimes) + 1)
+        expected = "|".join(generate(dt) for dt in datetimes)
+
+        out = io.StringIO()
+        self.assertEqual(write_many(datetimes, out, separator="|"), len(datetimes))
+        self.assertEqual(out.getvalue(), expected)
+
+        buffer = bytearray()
+        self.assertEqual(
+            write_many(iter(datetimes), buffer, separator="|"), len(datetimes)
+        )
+        self.assertEqual(buffer.decode("ascii"), expected)
+
+    def test_write_nothing(self) -> None:
+        """
+        Writing no timestamps writes nothing at all.
+
+        """
+        out = io.StringIO()
+        self.assertEqual(write_many([], out), 0)
+        self.assertEqual(out.getvalue(), "")
+
+
+class TestStrict(unittest.TestCase):
+    """
+    Tests for strict parsing, which accepts exactly the :RFC:`3339` ``date-time`` grammar.
+
+    """
+
+    def test_valid(self) -> None:
+        """
+        Conforming timestamps are parsed exactly as they would be otherwise.
+
+        """
+        for timestamp in (
+            "2009-01-01T10:01:02Z",
+            "2009-01-01t10:01:02z",
+            "2009-01-01 10:01:02Z",
+            "2009-01-01T10:01:02.1Z",
+            "2009-01-01T10:01:02.123456789-04:00",
+            "2009-01-01T10:01:02+23:59",
+            "2009-01-01T10:01:02-00:00",
+            "2008-02-29T23:59:59+05:30",
+            "2000-02-29T00:00:00Z",
+            "0001-01-01T00:00:00Z",
+        ):
+            with self.subTest(timestamp=timestamp):
+                self.assertEqual(parse(timestamp, strict=True), parse(timestamp))
+                self.assertEqual(
+                    parse(timestamp, strict=True).utcoffset(),
+                    parse(timestamp).utcoffset(),
+                )
+
+    def test_invalid(self) -> None:
+        """
+        Non-conforming timestamps raise :exc:`ParseError` identifying the offending column.
+
+        """
+        for timestamp, column in (
+            ("", 1),
+            ("2009", 5),
+            ("2009-01-01T06:01:02", 20),
+            ("2009-01-01T06:01:02+04", 23),
+            ("2009-01-01T06:01:02+0400", 23),
+            ("2009-01-01", 11),
+            ("2009-1-01T06:01:02Z", 7),
+            ("2009/01/01T06:01:02Z", 5),
+            ("2009-13-01T06:01:02Z", 6),
+            ("2009-00-01T06:01:02Z", 6),
+            ("2009-02-29T06:01:02Z", 9),
+            ("1900-02-29T06:01:02Z", 9),
+            ("2009-04-31T06:01:02Z", 9),
+            ("0000-01-01T06:01:02Z", 1),
+            ("2009-01-01_06:01:02Z", 11),
+            ("2009-01-01T24:00:00Z", 12),
+            ("2009-01-01T06:60:02Z", 15),
+            ("2009-01-01T23:59:60Z", 18),
+            ("2009-01-01T06:01:02.Z", 21),
+            ("2009-01-01T06:01:02.1234567890Z", 30),
+            ("2009-01-01T06:01:02+24:00", 21),
+            ("2009-01-01T06:01:02+04:60", 24),
+            ("2009-01-01T06:01:02Z ", 21),
+            ("2009-01-01T06:01:02+04:00Z", 26),
+            ("+009-01-01T06:01:02Z", 1),
+            ("2009-01-01T06:01:0\u0662Z", 19),
+        ):
+            with self.subTest(timestamp=timestamp):
+                with self.assertRaises(ParseError) as context:
+                    parse(timestamp, strict=True)
+                self.assertEqual(context.exception.column, column)
+                self.assertEqual(context.exception.timestamp, timestamp)
+                self.assertIsInstance(context.exception, ValueError)
+
+    def test_fields(self) -> None:
+        """
+        :exc:`ParseError` identifies the field at fault, and its value if that is out of range.
+
+        """
+        for timestamp, field, value in (
+            ("", "year", None),
+            ("2009/01/01T06:01:02Z", "month", None),
+            ("2009-13-01T06:01:02Z", "month", 13),
+            ("2009-02-29T06:01:02Z", "day", 29),
+            ("2009-01-01_06:01:02Z", "hour", None),
+            ("2009-01-01T23:59:60Z", "second", 60),
+            ("2009-01-01T06:01:02.Z", "fraction", None),
+            ("2009-01-01T06:01:02", "offset", None),
+            ("2009-01-01T06:01:02+24:00", "offset", 24),
+            ("2009-01-01T06:01:02+04:60", "offset", 60),
+            ("2009-01-01T06:01:02Z ", None, None),
+        ):
+            with self.subTest(timestamp=timestamp):
+                with self.assertRaises(ParseError) as context:
+                    parse(timestamp, strict=True)
+                self.assertEqual(context.exception.field, field)
+                self.assertEqual(context.exception.value, value)
+
+    def test_options(self) -> None:
+        """
+        The other options apply to strictly parsed timestamps as usual.
+
+        """
+        self.assertEqual(
+            parse("2009-01-01T06:01:02-04:00", utc=True, strict=True),
+            datetime(2009, 1, 1, 10, 1, 2, tzinfo=timezone.utc),
+        )
+        self.assertEqual(
+            parse("2009-01-01T06:01:02Z", produce_naive=True, strict=True),
+            datetime(2009, 1, 1, 6, 1, 2),
+        )
+        self.assertEqual(
+            parse_many(
+                ["2009-01-01T06:01:02Z", "2009-01-01T06:01:02"],
+                strict=True,
+                errors="none",
+            ),
+            [datetime(2009, 1, 1, 6, 1, 2, tzinfo=timezone.utc), None],
+        )
+
+    def test_pickle(self) -> None:
+        """
+        :exc:`ParseError` survives pickling with its attributes intact.
+
+        """
+        with self.assertRaises(ParseError) as context:
+            parse("2009-01-01T06:01:02", strict=True)
+
+        unpickled = pickle.loads(pickle.dumps(context.exception))
+        self.assertEqual(str(unpickled), str(context.exception))
+        self.assertEqual(unpickled.column, 20)
+        self.assertEqual(unpickled.field, "offset")
+
+
+class TestFormatter(unittest.TestCase):
+    """
+    Tests for :class:`pyrfc3339.generator.Rfc3339Formatter`, which must agree with :func:`pyrfc3339.generate()`.
+
+    """
+
+    def assertMatchesGenerate(self, datetimes: list[datetime]) -> None:
+        for utc, microseconds in itertools.product((False, True), repeat=2):
+            with self.subTest(utc=utc, microseconds=microseconds):
+                formatter = Rfc3339Formatter(utc=utc, microseconds=microseconds)
+                self.assertEqual(
+                    [formatter(dt) for dt in datetimes],
+                    [
+                        generate(dt, utc=utc, microseconds=microseconds)
+                        for dt in datetimes
+                    ],
+                )
+
+    def test_monotonic_stream(self) -> None:
+        """
+        A stream of increasing timestamps crossing minute, hour, day, month and year boundaries.
+
+        """
+        start = datetime(2008, 12, 31, 23, 58, 30, tzinfo=timezone(timedelta(hours=-5)))
+        self.assertMatchesGenerate(
+            [start + timedelta(milliseconds=750 * i) for i in range(400)]
+        )
+
+    def test_dst_transition(self) -> None:
+        """
+        The offset changes mid-hour in wall-clock terms across a daylight saving time transition.
+
+        """
+        eastern = ZoneInfo("US/Eastern")
+        start = datetime(2024, 11, 3, 5, 58, tzinfo=timezone.utc)
+        self.assertMatchesGenerate(
+            [(start + timedelta(seconds=15 * i)).astimezone(eastern) for i in range(16)]
+        )
+
+    def test_mixed_zones(self) -> None:
+        """
+        Timestamps in different zones with the same wall-clock time, including UTC and a zero offset.
+
+        """
+        wall_time = datetime(2009, 1, 1, 12, 59, 59, 1)
+        self.assertMatchesGenerate(
+            [
+                wall_time.replace(tzinfo=tz)
+                for tz in (
+                    timezone.utc,
+                    ZoneInfo("Europe/London"),
+                    timezone(timedelta(hours=5, minutes=30)),
+                    timezone.utc,
+                    ZoneInfo("US/Eastern"),
+                )
+            ]
+        )
+
+    def test_naive(self) -> None:
+        """
+        Naive datetimes are handled exactly as by :func:`generate()`.
+
+        """
+        naive = datetime(2009, 1, 1, 12, 59, 59)
+
+        formatter = Rfc3339Formatter(accept_naive=True)
+        self.assertEqual(formatter(naive), generate(naive, accept_naive=True))
+        self.assertEqual(
+            formatter(naive.replace(second=58)),
+            generate(naive.replace(second=58), accept_naive=True),
+        )
+
+        for utc, accept_naive in ((True, False), (False, False), (False, True)):
+            with self.subTest(utc=utc, accept_naive=accept_naive):
+                with self.assertRaises(ValueError):
+                    Rfc3339Formatter(utc=utc, accept_naive=accept_naive).format(naive)
+
+
+class TestGenerateRange(unittest.TestCase):
+    """
+    Tests for :func:`pyrfc3339.generator.generate_range()`, which must agree with :func:`pyrfc3339.generate()`.
+
+    """
+
+    def assertMatchesGenerate(
+        self,
+        start: datetime,
+        stop: datetime,
+        step: timedelta,
+        accept_naive: bool = False,
+    ) -> None:
+        expected_datetimes = []
+        dt = start
+        while dt < stop if step > timedelta(0) else dt > stop:
+            expected_datetimes.append(dt)
+            try:
+                dt += step
+            except OverflowError:
+                break
+        for utc, microseconds in itertools.product((False, True), repeat=2):
+            if start.tzinfo is None and not utc:
+                continue
+            with self.subTest(step=step, utc=utc, microseconds=microseconds):
+                self.assertEqual(
+                    list(
+                        generate_range(
+                            start, stop, step, utc, accept_naive, microseconds
+                        )
+                    ),
+                    [
+                        generate(dt, utc, accept_naive, microseconds)
+                        for dt in expected_datetimes
+                    ],
+                )
+
+    def test_boundaries(self) -> None:
+        """
+        Series crossing minute, hour, day, month, year and leap-day boundaries, forwards and backwards.
+
+        """
+        tz = timezone(timedelta(hours=-5, minutes=-30))
+        for start, stop in (
+            (
+                datetime(2008, 12, 31, 23, 58, 30, tzinfo=tz),
+                datetime(2009, 1, 1, 0, 1, tzinfo=tz),
+            ),
+            (
+                datetime(2024, 2, 28, 23, 59, tzinfo=timezone.utc),
+                datetime(2024, 2, 29, 0, 1, tzinfo=timezone.utc),
+            ),
+            (
+                datetime(2024, 2, 29, 23, 59, tzinfo=timezone.utc),
+                datetime(2024, 3, 1, 0, 1, tzinfo=timezone.utc),
+            ),
+            (
+                datetime(2023, 2, 28, 23, 59, tzinfo=timezone.utc),
+                datetime(2023, 3, 1, 0, 1, tzinfo=timezone.utc),
+            ),
+        ):
+            for step in (
+                timedelta(seconds=1),
+                timedelta(milliseconds=750),
+                timedelta(seconds=59, microseconds=999999),
+                timedelta(minutes=7, seconds=13),
+                timedelta(hours=5, microseconds=1),
+            ):
+                self.assertMatchesGenerate(start, stop, step)
+                self.assertMatchesGenerate(stop, start, -step)
+
+    def test_long_steps(self) -> None:
+        """
+        Steps of days, across leap years and centuries, including a step of more than a year.
+
+        """
+        start = datetime(1899, 12, 31, 12, tzinfo=timezone(timedelta(hours=9)))
+        stop = datetime(2101, 3, 1, tzinfo=timezone.utc)
+        for step in (timedelta(days=29, hours=23), timedelta(days=400, seconds=1)):
+            self.assertMatchesGenerate(start, stop, step)
+            self.assertMatchesGenerate(stop, start, -step)
+
+    def test_limits(self) -> None:
+        """
+        Series ending within a step of the first or last representable instant, in fixed and other zones.
+
+        """
+        for tz in (timezone.utc, ZoneInfo("UTC")):
+            with self.subTest(tz=tz):
+                self.assertMatchesGenerate(
+                    datetime(9999, 12, 31, 23, 59, 58, tzinfo=tz),
+                    datetime(9999, 12, 31, 23, 59, 59, 500000, tzinfo=tz),
+                    timedelta(seconds=1),
+                )
+                self.assertMatchesGenerate(
+                    datetime(9999, 12, 30, tzinfo=tz),
+                    datetime(9999, 12, 31, 23, 59, 59, 999999, tzinfo=tz),
+                    timedelta(hours=7, microseconds=3),
+                )
+                self.assertMatchesGenerate(
+                    datetime(1, 1, 1, 0, 0, 3, tzinfo=tz),
+                    datetime(1, 1, 1, tzinfo=tz),
+                    timedelta(seconds=-2),
+                )
+        tz = timezone(-timedelta(minutes=1, seconds=15))
+        start = datetime(2, 11, 27, 0, 18, 44, tzinfo=tz)
+        self.assertMatchesGenerate(
+            start, datetime(1, 1, 1, tzinfo=tz), -timedelta(days=40)
+        )
+
+    def test_zones(self) -> None:
+        """
+        Series in a zone with daylight saving time, and with start and stop in different zones.
+
+        """
+        eastern = ZoneInfo("US/Eastern")
+        self.assertMatchesGenerate(
+            datetime(2024, 3, 10, 1, 50, tzinfo=eastern),
+            datetime(2024, 3, 10, 3, 10, tzinfo=eastern),
+            timedelta(minutes=5),
+        )
+        self.assertMatchesGenerate(
+            datetime(2009, 1, 1, 12, tzinfo=timezone(timedelta(hours=-4))),
+            datetime(2009, 1, 1, 17, tzinfo=timezone.utc),
+            timedelta(minutes=10),
+        )
+
+    def test_naive(self) -> None:
+        """
+        Naive datetimes are accepted only as :func:`generate()` accepts them.
+
+        """
+        start = datetime(2009, 1, 1, 23, 59, 59)
+        self.assertMatchesGenerate(
+            start, start + timedelta(seconds=3), timedelta(seconds=1), accept_naive=True
+        )
+        for utc, accept_naive in ((True, False), (False, False), (False, True)):
+            with self.subTest(utc=utc, accept_naive=accept_naive):
+                with self.assertRaises(ValueError):
+                    generate_range(
+                        start, start, timedelta(seconds=1), utc, accept_naive
+                    )
+        with self.assertRaises(TypeError):
+            generate_range(
+                start,
+                start.replace(tzinfo=timezone.utc),
+                timedelta(seconds=1),
+                accept_naive=True,
+            )
+
+    def test_empty_and_invalid(self) -> None:
+        """
+        A series which ends before it starts is empty; a zero step is rejected.
+
+        """
+        start = datetime(2009, 1, 1, tzinfo=timezone.utc)
+        self.assertEqual(list(generate_range(start, start, timedelta(seconds=1))), [])
+        self.assertEqual(
+            list(generate_range(start, start + timedelta(days=1), -timedelta(days=1))),
+            [],
+        )
+        with self.assertRaises(ValueError):
+            generate_range(start, start + timedelta(days=1), timedelta(0))
+
+
+class TestCaches(unittest.TestCase):
+    """
+    Tests for the optional tzinfo and timestamp caches used by :func:`parse()`.
+
+    """
+
+    def tearDown(self) -> None:
+        configure_caches()
+
+    def test_disabled_by_default(self) -> None:
+        """
+        Without configuration, nothing is cached.
+
+        """
+        dt1 = parse("2009-01-01T14:01:02-04:00")
+        dt2 = parse("2009-01-01T14:01:02-04:00")
+        self.assertIsNot(dt1, dt2)
+        self.assertEqual(cache_info().tzinfo.maxsize, 0)
+        self.assertEqual(cache_info().timestamps.maxsize, 0)
+
+    def test_tzinfo_interning(self) -> None:
+        """
+        Equal offsets share a single tzinfo, whether or not parsing is strict,
+        and the least recently used offset is evicted when the cache is full.
+
+        """
+        configure_caches(tzinfo_size=2)
+
+        dt1 = parse("2009-01-01T14:01:02-04:00")
+        dt2 = parse("2010-01-01T14:01:02.5-04:00", strict=True)
+        dt3 = parse_many(["2011-01-01T14:01:02-04:00"])[0]
+        self.assertIs(dt1.tzinfo, dt2.tzinfo)
+        self.assertIs(dt1.tzinfo, dt3.tzinfo)
+        self.assertEqual(
+            dt2, datetime(2010, 1, 1, 18, 1, 2, 500000, tzinfo=timezone.utc)
+        )
+
+        parse("2009-01-01T14:01:02+05:30")
+        parse("2009-01-01T14:01:02+09:00")
+        self.assertEqual(cache_info().tzinfo, (2, 3, 1, 2, 2))
+
+        # UTC is already a singleton, and is not cached.
+        self.assertIs(parse("2009-01-01T14:01:02Z").tzinfo, timezone.utc)
+        self.assertEqual(cache_info().tzinfo.currsize, 2)
+
+    def test_timestamp_cache(self) -> None:
+        """
+        Repeated timestamps are parsed once, and the other options apply to the cached result.
+
+        """
+        configure_caches(timestamp_size=2)
+
+        dt1 = parse("2009-01-01T14:01:02Z")
+        self.assertIs(parse("2009-01-01T14:01:02Z"), dt1)
+        self.assertEqual(
+            parse("2009-01-01T14:01:02Z", produce_naive=True),
+            datetime(2009, 1, 1, 14, 1, 2),
+        )
+        self.assertEqual(
+            parse("2009-01-01T14:01:02-04:00", utc=True),
+            datetime(2009, 1, 1, 18, 1, 2, tzinfo=timezone.utc),
+        )
+        self.assertIsNot(parse("2009-01-01T14:01:02Z", strict=True), dt1)
+
+        parse("2009-01-01T14:01:03Z")
+        self.assertEqual(cache_info().timestamps, (2, 3, 1, 2, 2))
+
+        cache_clear()
+        self.assertEqual(cache_info().timestamps, (0, 0, 0, 2, 0))
+
+    def test_invalid_size(self) -> None:
+        """
+        Cache sizes must not be negative.
+
+        """
+        with self.assertRaises(ValueError):
+            configure_caches(tzinfo_size=-1)
+
+
+class _SameZone(tzinfo):
+    """
+    A fixed-offset zone which compares equal to, and hashes like, every other instance, whatever its offset.
+
+    """
+
+    def __init__(self, hours: int) -> None:
+        self.offset = timedelta(hours=hours)
+
+    def utcoffset(self, dt: datetime | None) -> timedelta:
+        return self.offset
+
+    def dst(self, dt: datetime | None) -> timedelta:
+        return timedelta(0)
+
+    def tzname(self, dt: datetime | None) -> str:
+        return "same"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _SameZone)
+
+    def __hash__(self) -> int:
+        return 0
+
+
+class _UnhashableZone(_SameZone):
+    __hash__ = None  # type: ignore[assignment]
+
+
+class TestOffsetCache(unittest.TestCase):
+    """
+    Tests for the optional UTC offset cache used by :mod:`pyrfc3339.generator` and
+    :func:`pyrfc3339.utils.datetime_utcoffset()`.
+
+    """
+
+    def setUp(self) -> None:
+        pyrfc3339.generator.configure_caches(offset_size=64)
+
+    def tearDown(self) -> None:
+        pyrfc3339.generator.configure_caches()
+
+    def assertGenerated(self, dt: datetime) -> None:
+        local = dt.isoformat("T", "microseconds")
+        in_utc = dt.astimezone(timezone.utc).isoformat("T", "microseconds")[:-6] + "Z"
+        for utc, expected in ((False, local), (True, in_utc)):
+            with self.subTest(dt=dt, fold=dt.fold, utc=utc):
+                self.assertEqual(
+                    pyrfc3339.generator.generate(dt, utc=utc, microseconds=True),
+                    expected,
+                )
+                self.assertEqual(make_generator(utc, microseconds=True)(dt), expected)
+                self.assertEqual(
+                    Rfc3339Formatter(utc, microseconds=True)(dt),
+                    expected,
+                )
+        offset = dt.utcoffset()
+        assert offset is not None
+        self.assertEqual(pyrfc3339.utils.datetime_utcoffset(dt), offset.total_seconds())
+
+    def test_transitions(self) -> None:
+        """
+        Datetimes around transitions, in both folds, produce the same timestamps as without the cache,
+        including where the offset changes on the half hour or part way through an hour.
+
+        """
+        transitions = [
+            ("America/New_York", datetime(2009, 3, 8, 2)),  # spring forward: a gap
+            (
+                "America/New_York",
+                datetime(2009, 11, 1, 1),
+            ),  # fall back: a repeated hour
+            ("Europe/London", datetime(2009, 10, 25, 1)),
+            ("Australia/Lord_Howe", datetime(2009, 4, 5, 2)),  # a half-hour change
+            ("America/St_Johns", datetime(2009, 3, 8, 2)),
+            (
+                "America/New_York",
+                datetime(1883, 11, 18, 12),
+            ),  # from local mean time at 12:03:58
+        ]
+        for name, moment in transitions:
+            zone = ZoneInfo(name)
+            for minutes in range(-90, 150, 7):
+                for fold in (0, 1):
+                    local = moment + timedelta(minutes=minutes, seconds=13)
+                    self.assertGenerated(local.replace(tzinfo=zone, fold=fold))
+            # Repeat with the cache populated.
+            for minutes in range(-90, 150, 11):
+                for fold in (0, 1):
+                    local = moment + timedelta(minutes=minutes, microseconds=250)
+                    self.assertGenerated(local.replace(tzinfo=zone, fold=fold))
+
+        info = pyrfc3339.generator.cache_info()
+        self.assertGreater(info.hits, 0)
+        self.assertEqual(info.maxsize, 64)
+        self.assertLessEqual(info.currsize, 64)
+
+    def test_transition_hour_not_cached(self) -> None:
+        """
+        An hour during which the offset changes is not cached.
+
+        """
+        zone = ZoneInfo("America/New_York")
+        for minute in (0, 3, 4, 30):
+            self.assertGenerated(datetime(1883, 11, 18, 12, minute, tzinfo=zone))
+        self.assertEqual(pyrfc3339.generator.cache_info().currsize, 0)
+
+    def test_tzinfo_identity(self) -> None:
+        """
+        Equal but distinct tzinfo instances, and unhashable ones, are resolved correctly.
+
+        """
+        for dt in (
+            datetime(2009, 1, 1, 12, tzinfo=_SameZone(1)),
+            datetime(2009, 1, 1, 12, tzinfo=_SameZone(-5)),
+            datetime(2009, 1, 1, 12, tzinfo=_UnhashableZone(3)),
+        ):
+            self.assertGenerated(dt)
+
+        self.assertEqual(
+            generate_many([datetime(2009, 1, 1, 12, tzinfo=_SameZone(0))], utc=False),
+            ["2009-01-01T12:00:00+00:00"],
+        )
+
+    def test_configuration(self) -> None:
+        """
+        The cache is disabled by default, can be cleared and cannot have a negative size.
+
+        """
+        zone = ZoneInfo("America/New_York")
+        generate_many([datetime(2009, 1, 1, 12, tzinfo=zone)] * 3, utc=False)
+        self.assertEqual(pyrfc3339.generator.cache_info(), CacheInfo(2, 1, 0, 64, 1))
+        pyrfc3339.generator.cache_clear()
+        self.assertEqual(pyrfc3339.generator.cache_info(), CacheInfo(0, 0, 0, 64, 0))
+
+        pyrfc3339.generator.configure_caches()
+        pyrfc3339.generator.cache_clear()
+        generate_many([datetime(2009, 1, 1, 12, tzinfo=zone)], utc=False)
+        self.assertEqual(pyrfc3339.generator.cache_info(), CacheInfo(0, 0, 0, 0, 0))
+
+        with self.assertRaises(ValueError):
+            pyrfc3339.generator.configure_caches(offset_size=-1)
+
+
+class TestEpoch(unittest.TestCase):
+    """
+    Tests for :func:`pyrfc3339.parser.parse_to_epoch_us()`, :func:`pyrfc3339.parser.parse_to_epoch_ns()`
+    and :func:`pyrfc3339.generator.generate_from_epoch()`.
+
+    """
+
+    def setUp(self) -> None:
+        rng = random.Random(3339)
+        self.datetimes = [datetime(1, 1, 1, tzinfo=timezone.utc)] + [
+            (
+                datetime(1, 1, 2, tzinfo=timezone.utc)
+                + timedelta(microseconds=rng.randrange(315_500_000_000_000_000))
+            ).astimezone(timezone(timedelta(minutes=rng.randrange(-1439, 1440))))
+            for _ in range(500)
+        ]
+
+    def test_parse(self) -> None:
+        """
+        The epoch values agree with the instants :func:`parse()` produces, with sub-microsecond digits preserved.
+
+        """
+        for dt in self.datetimes:
+            for microseconds in (False, True):
+                timestamp = generate(dt, utc=False, microseconds=microseconds)
+                with self.subTest(timestamp=timestamp):
+                    expected = (
+                        dt - datetime(1970, 1, 1, tzinfo=timezone.utc)
+                    ) // timedelta(microseconds=1)
+                    if not microseconds:
+                        expected -= dt.microsecond
+                    self.assertEqual(parse_to_epoch_us(timestamp), expected)
+                    self.assertEqual(
+                        parse_to_epoch_us(timestamp, strict=True), expected
+                    )
+                    self.assertEqual(parse_to_epoch_ns(timestamp), expected * 1000)
+
+        for timestamp, expected in (
+            ("2009-01-01T10:01:02.1234567Z", 1230804062123456700),
+            ("2009-01-01T10:01:02.123456789+05:30", 1230784262123456789),
+            ("2009-01-01t10:01:02.123456789z", 1230804062123456789),
+            ("2009-01-01T10:01:02.12345+05:30", 1230784262123450000),
+            ("1969-12-31T23:59:59.999999999Z", -1),
+        ):
+            with self.subTest(timestamp=timestamp):
+                self.assertEqual(parse_to_epoch_ns(timestamp), expected)
+                self.assertEqual(parse_to_epoch_ns(timestamp, strict=True), expected)
+
+        # Strict parsing rejects more than 9 fractional digits; otherwise, they are truncated.
+        self.assertEqual(
+            parse_to_epoch_ns("2009-01-01T10:01:02.1234567891Z"), 1230804062123456789
+        )
+
+    def test_parse_errors(self) -> None:
+        """
+        Invalid timestamps raise the same exceptions as :func:`parse()`.
+
+        """
+        with self.assertRaises(ValueError):
+            parse_to_epoch_ns("2009-01-01T25:01:02.123456789Z")
+        with self.assertRaises(ParseError):
+            parse_to_epoch_us("2009-01-01T10:01:02", strict=True)
+
+    def test_generate(self) -> None:
+        """
+        :func:`generate_from_epoch()` agrees with :func:`generate()` for the equivalent :class:`datetime.datetime`.
+
+        """
+        epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+        rng = random.Random(3339)
+        for _ in range(500):
+            epoch_ns = rng.randrange(
+                -62135596800 * 10**9 + 86400 * 10**9, 253402214400 * 10**9
+            )
+            offset_minutes = rng.randrange(-1439, 1440)
+            dt = (epoch + timedelta(microseconds=epoch_ns // 1000)).astimezone(
+                timezone(timedelta(minutes=offset_minutes))
+            )
+            for microseconds in (False, True):
+                with self.subTest(epoch_ns=epoch_ns, offset_minutes=offset_minutes):
+                    self.assertEqual(
+                        generate_from_epoch(epoch_ns, offset_minutes, microseconds),
+                        generate(dt, utc=False, microseconds=microseconds),
+                    )
+            timestamp = generate_from_epoch(epoch_ns, offset_minutes, nanoseconds=True)
+            self.assertEqual(parse_to_epoch_ns(timestamp), epoch_ns)
+
+    def test_generate_range(self) -> None:
+        """
+        Offsets and instants outside the range of :RFC:`3339` raise :exc:`ValueError`.
+
+        """
+        with self.assertRaises(ValueError):
+            generate_from_epoch(0, 1440)
+        with self.assertRaises(ValueError):
+            generate_from_epoch(253402300800 * 10**9)
+        with self.assertRaises(ValueError):
+            generate_from_epoch(-62135596800 * 10**9, -60)
+
+
+class TestTimestamp(unittest.TestCase):
+    """
+    Tests for :python:`parse(..., precision='ns')` and :class:`pyrfc3339.utils.Timestamp`.
+
+    """
+
+    def test_parse(self) -> None:
+        """
+        All 9 fractional digits are preserved, along with the UTC offset unless :python:`utc=True` is specified.
+
+        """
+        for timestamp, expected in (
+            ("2009-01-01T10:01:02Z", Timestamp(1230804062, 0, 0)),
+            (
+                "2009-01-01T10:01:02.123456789+05:30",
+                Timestamp(1230784262, 123456789, 330),
+            ),
+            ("2009-01-01t10:01:02.1234567z", Timestamp(1230804062, 123456700, 0)),
+            ("2009-01-01T10:01:02.12345-00:01", Timestamp(1230804122, 123450000, -1)),
+            ("1969-12-31T23:59:59.999999999Z", Timestamp(-1, 999999999, 0)),
+        ):
+            with self.subTest(timestamp=timestamp):
+                self.assertEqual(parse(timestamp, precision="ns"), expected)
+                self.assertEqual(
+                    parse(timestamp, strict=True, precision="ns"), expected
+                )
+                self.assertEqual(
+                    parse(timestamp, utc=True, precision="ns"),
+                    expected._replace(offset_minutes=0),
+                )
+                self.assertEqual(parse_to_epoch_ns(timestamp), expected.epoch_ns)
+
+        # A timestamp without a UTC offset, accepted when not strict, is taken to be in UTC.
+        self.assertEqual(
+            parse("2009-01-01T10:01:02.000001", precision="ns"),
+            Timestamp(1230804062, 1000, 0),
+        )
+
+    @unittest.skipIf(
+        sys.version_info < (3, 11), "Python 3.10 rejects these non-canonical forms"
+    )
+    def test_parse_lenient(self) -> None:
+        """
+        Fractional digits beyond microseconds are found wherever the fraction lies in a timestamp accepted
+        by the lenient parser, and are not taken from a fraction of the UTC offset.
+
+        """
+        for timestamp, epoch_ns in (
+            ("20090101T100102.123456789Z", 1230804062123456789),
+            ("2009-01-01 10:01:02,123456789-01:00", 1230807662123456789),
+            ("2009-W01-1T10:01:02.123456789Z", 1230544862123456789),
+            ("2009-01-01T10:01:02.1234567891", 1230804062123456789),
+            ("2009-01-01T10:01:02+00:00:01.123456789", 1230804060876544000),
+            ("2009-01-01T10:01:02.25-00:00:01.123456789", 1230804063373456000),
+        ):
+            with self.subTest(timestamp=timestamp):
+                self.assertEqual(parse_to_epoch_ns(timestamp), epoch_ns)
+        self.assertEqual(
+            parse("20090101T100102.123456789Z", precision="ns"),
+            Timestamp(1230804062, 123456789, 0),
+        )
+
+    def test_parse_errors(self) -> None:
+        """
+        Invalid timestamps and options raise :exc:`ValueError`.
+
+        """
+        with self.assertRaises(ParseError):
+            parse("2009-01-01T10:01:02.123456789", strict=True, precision="ns")
+        with self.assertRaises(ValueError):
+            parse("2009-01-01T25:01:02.123456789Z", precision="ns")
+        with self.assertRaises(ValueError):
+            parse("2009-01-01T10:01:02+05:30:15", precision="ns")
+        with self.assertRaises(ValueError):
+            parse("2009-01-01T10:01:02Z", produce_naive=True, precision="ns")
+        with self.assertRaises(ValueError):
+            parse("2009-01-01T10:01:02Z", precision="ms")  # type: ignore[call-overload]
+
+    def test_generate(self) -> None:
+        """
+        :func:`generate()` writes all 9 fractional digits of a :class:`Timestamp`, with its own offset or in UTC.
+
+        """
+        rng = random.Random(3339)
+        for _ in range(500):
+            epoch_ns = rng.randrange(
+                -62135596800 * 10**9 + 86400 * 10**9, 253402214400 * 10**9
+            )
+            offset_minutes = rng.randrange(-1439, 1440)
+            timestamp = generate_from_epoch(epoch_ns, offset_minutes, nanoseconds=True)
+            with self.subTest(timestamp=timestamp):
+                ts = parse(timestamp, precision="ns")
+                self.assertEqual(ts.epoch_ns, epoch_ns)
+                self.assertEqual(ts.offset_minutes, offset_minutes)
+                self.assertEqual(generate(ts, utc=False, microseconds=True), timestamp)
+                self.assertEqual(
+                    generate(ts, microseconds=True),
+                    generate_from_epoch(epoch_ns, nanoseconds=True),
+                )
+                self.assertEqual(
+                    generate(ts, utc=False),
+                    generate(parse(timestamp), utc=False),
+                )
+                self.assertEqual(ts.to_datetime(), parse(timestamp))
+
+    def test_ordering(self) -> None:
+        """
+        Timestamps sort by instant and may be used as dictionary keys.
+
+        """
+        timestamps = [
+            "2009-01-01T10:01:02.000000002Z",
+            "2009-01-01T10:01:02.000000001+01:00",
+            "2009-01-01T10:01:02.000000001Z",
+            "2009-01-01T10:01:02Z",
+        ]
+        parsed = [parse(timestamp, precision="ns") for timestamp in timestamps]
+        self.assertEqual(sorted(parsed), [parsed[1], parsed[3], parsed[2], parsed[0]])
+        self.assertEqual(
+            len({parse(timestamp, precision="ns") for timestamp in timestamps * 2}), 4
+        )
+
+
+def offset_seconds(dt: datetime) -> int:
+    offset = dt.utcoffset()
+    assert offset is not None
+    return offset // timedelta(seconds=1)
+
+
+class TestStream(unittest.TestCase):
+    """
+    Tests for :func:`pyrfc3339.stream.iter_parse()`.
+
+    """
+
+    timestamps = [
+        "2009-01-01T10:01:02Z",
+        "2009-01-01T14:01:02-04:00",
+        "2009-01-01T10:01:02.25+05:30",
+        "2009-01-01t10:01:02z",
+    ]
+
+    def test_chunk_boundaries(self) -> None:
+        """
+        Lines split across chunks are reassembled, whatever the chunk size,
+        in both text and binary files, with or without a final line ending.
+
+        """
+        expected = [parse(timestamp) for timestamp in self.timestamps]
+        for ending in ("\n", "\r\n"):
+            text = ending.join(self.timestamps)
+            for chunk_size in (1, 2, 7, 20, 21, 4096):
+                for data in (io.StringIO(text), io.BytesIO(text.encode())):
+                    with self.subTest(
+                        ending=ending, chunk_size=chunk_size, type=type(data)
+                    ):
+                        self.assertEqual(
+                            list(iter_parse(data, chunk_size=chunk_size)), expected
+                        )
+
+    def test_columns(self) -> None:
+        """
+        The timestamp is taken from the given column, split on the delimiter or on whitespace.
+
+        """
+        csv = "".join(
+            f"{i},{timestamp},x\n" for i, timestamp in enumerate(self.timestamps)
+        )
+        self.assertEqual(
+            list(iter_parse(io.StringIO(csv), column=1, delimiter=",", utc=True)),
+            [parse(timestamp, utc=True) for timestamp in self.timestamps],
+        )
+
+        log = "".join(f"{timestamp}  GET /\n\n" for timestamp in self.timestamps)
+        self.assertEqual(
+            list(iter_parse(io.StringIO(log), column=0, utc=True, produce_naive=True)),
+            [
+                parse(timestamp, utc=True, produce_naive=True)
+                for timestamp in self.timestamps
+            ],
+        )
+
+    def test_epoch_output(self) -> None:
+        """
+        With :python:`output='epoch_us'`, each timestamp produces a count of microseconds since the epoch.
+
+        """
+        data = io.StringIO("\n".join(self.timestamps + ["1969-12-31T23:59:59.999999Z"]))
+        self.assertEqual(
+            list(iter_parse(data, output="epoch_us")),
+            [
+                1230804062000000,
+                1230832862000000,
+                1230784262250000,
+                1230804062000000,
+                -1,
+            ],
+        )
+
+    def test_errors(self) -> None:
+        """
+        An invalid record raises :exc:`RecordError` giving its line number, unless it is skipped.
+
+        """
+        text = "time ip\n2009-01-01T10:01:02Z 10.0.0.1\n\n2009-01-01T25:01:02Z 10.0.0.2\nshort\n"
+
+        with self.assertRaises(RecordError) as cm:
+            list(iter_parse(io.StringIO(text), column=0))
+        self.assertEqual(cm.exception.line, 1)
+        self.assertEqual(cm.exception.record, "time ip")
+        self.assertIsInstance(cm.exception.__cause__, ValueError)
+
+        body = text.partition("\n")[2]
+        records = iter_parse(io.StringIO(body), column=0, strict=True)
+        self.assertEqual(next(records), parse("2009-01-01T10:01:02Z"))
+        with self.assertRaises(RecordError) as cm:
+            next(records)
+        self.assertEqual(cm.exception.line, 3)
+        self.assertIsInstance(cm.exception.__cause__, ParseError)
+
+        with self.assertRaises(RecordError) as cm:
+            list(iter_parse(io.StringIO(text), column=1, errors="raise"))
+        self.assertEqual(str(cm.exception), "line 1: Invalid isoformat string: 'ip'")
+
+        self.assertEqual(
+            list(iter_parse(io.StringIO(text), column=0, errors="skip")),
+            [parse("2009-01-01T10:01:02Z")],
+        )
+
+        with self.assertRaises(ValueError):
+            iter_parse(io.StringIO(text), errors="none")  # type: ignore[call-overload]
+
+    def test_short_record(self) -> None:
+        """
+        A record with too few columns raises :exc:`RecordError`.
+
+        """
+        with self.assertRaises(RecordError) as cm:
+            list(
+                iter_parse(
+                    io.StringIO("2009-01-01T10:01:02Z,x\nshort\n"),
+                    column=1,
+                    delimiter=",",
+                )
+            )
+        self.assertEqual(str(cm.exception), "line 1: Invalid isoformat string: 'x'")
+
+        with self.assertRaises(RecordError) as cm:
+            list(
+                iter_parse(
+                    io.StringIO("x,2009-01-01T10:01:02Z\nshort\n"),
+                    column=1,
+                    delimiter=",",
+                )
+            )
+        self.assertEqual(str(cm.exception), "line 2: no column 1")
+
+    def test_negative_column(self) -> None:
+        """
+        A negative column counts from the end of the record, and one which a record lacks makes it invalid.
+
+        """
+        text = "x,2009-01-01T10:01:02Z,y\nshort\n2009-01-01T10:01:03Z,y\n"
+        self.assertEqual(
+            list(
+                iter_parse(io.StringIO(text), column=-2, delimiter=",", errors="skip")
+            ),
+            [
+                datetime(2009, 1, 1, 10, 1, 2, tzinfo=timezone.utc),
+                datetime(2009, 1, 1, 10, 1, 3, tzinfo=timezone.utc),
+            ],
+        )
+
+        with self.assertRaises(RecordError) as cm:
+            list(iter_parse(io.StringIO(text), column=-2, delimiter=","))
+        self.assertEqual(str(cm.exception), "line 2: no column -2")
+
+
+class TestAio(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests for :func:`pyrfc3339.aio.aiter_parse()`.
+
+    """
+
+    text = (
+        "time ip\n2009-01-01T10:01:02Z 10.0.0.1\n\n2009-01-01T14:01:02-04:00 10.0.0.2\r\n"
+        "2009-01-01T25:01:02Z 10.0.0.3\nshort\n2009-01-01T10:01:02.25+05:30 10.0.0.4"
+    )
+
+    @staticmethod
+    async def chunks(data: str | bytes, size: int) -> AsyncIterator[str | bytes]:
+        for start in range(0, len(data), size):
+            end = start + size
+            yield data[start:end]
+
+    async def collect(
+        self, source: AsyncIterable[str | bytes] | asyncio.StreamReader, **kwargs: Any
+    ) -> list[object]:
+        return [value async for value in aiter_parse(source, **kwargs)]
+
+    async def test_agrees_with_iter_parse(self) -> None:
+        """
+        The results agree with :func:`iter_parse()`, whatever the chunk and batch sizes, for text and bytes.
+
+        """
+        for output in ("datetime", "epoch_us"):
+            expected = list(
+                iter_parse(
+                    io.StringIO(self.text), column=0, errors="skip", output=output
+                )
+            )
+            self.assertEqual(len(expected), 3)
+            for data in (self.text, self.text.encode()):
+                for size, batch_size in itertools.product((1, 7, 4096), (1, 2, 4096)):
+                    with self.subTest(
+                        output=output, type=type(data), size=size, batch_size=batch_size
+                    ):
+                        actual = await self.collect(
+                            self.chunks(data, size),
+                            column=0,
+                            errors="skip",
+                            output=output,
+                            batch_size=batch_size,
+                        )
+                        self.assertEqual(actual, expected)
+
+    async def test_negative_column(self) -> None:
+        """
+        A record lacking a negative column is skipped, as by :func:`iter_parse()`.
+
+        """
+        text = "2009-01-01T10:01:02Z\n2009-01-01T10:01:03Z,a\n"
+        self.assertEqual(
+            await self.collect(
+                self.chunks(text, 7), column=-2, delimiter=",", errors="skip"
+            ),
+            [datetime(2009, 1, 1, 10, 1, 3, tzinfo=timezone.utc)],
+        )
+
+    async def test_stream_reader(self) -> None:
+        """
+        An :class:`asyncio.StreamReader` is read :obj:`chunk_size` bytes at a time.
+
+        """
+        for chunk_size in (1, 3, 4096):
+            with self.subTest(chunk_size=chunk_size):
+                reader = asyncio.StreamReader()
+                reader.feed_data(self.text.encode())
+                reader.feed_eof()
+                self.assertEqual(
+                    await self.collect(
+                        reader, column=0, utc=True, errors="skip", chunk_size=chunk_size
+                    ),
+                    list(
+                        iter_parse(
+                            io.StringIO(self.text), column=0, utc=True, errors="skip"
+                        )
+                    ),
+                )
+
+    async def test_errors(self) -> None:
+        """
+        An invalid record raises :exc:`RecordError` giving its line number, after the valid records before it.
+
+        """
+        for batch_size in (1, 2, 4096):
+            with self.subTest(batch_size=batch_size):
+                values = []
+                with self.assertRaises(RecordError) as cm:
+                    async for value in aiter_parse(
+                        self.chunks(self.text, 5), column=0, batch_size=batch_size
+                    ):
+                        values.append(value)
+                self.assertEqual(values, [])
+                self.assertEqual(cm.exception.line, 1)
+                self.assertIsInstance(cm.exception.__cause__, ValueError)
+
+                values = []
+                lines = self.text.split("\n")[1:]
+                with self.assertRaises(RecordError) as cm:
+                    async for value in aiter_parse(
+                        self.chunks("\n".join(lines), 5),
+                        column=0,
+                        batch_size=batch_size,
+                    ):
+                        values.append(value)
+                self.assertEqual(
+                    values,
+                    [parse("2009-01-01T10:01:02Z"), parse("2009-01-01T14:01:02-04:00")],
+                )
+                self.assertEqual(cm.exception.line, 4)
+
+        with self.assertRaises(ValueError):
+            aiter_parse(self.chunks("", 1), errors="ignore")  # type: ignore[call-overload]
+        with self.assertRaises(ValueError):
+            aiter_parse(self.chunks("", 1), output="date")  # type: ignore[call-overload]
+        with self.assertRaises(ValueError):
+            aiter_parse(self.chunks("", 1), batch_size=0)
+
+    async def test_yields_control(self) -> None:
+        """
+        Other tasks run between batches.
+
+        """
+        ticks = 0
+
+        async def tick() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(tick())
+        try:
+            await asyncio.sleep(0)
+            ticks = 0
+            text = "2009-01-01T10:01:02Z\n" * 100
+            await self.collect(self.chunks(text, len(text)), batch_size=10)
+            self.assertGreaterEqual(ticks, 9)
+        finally:
+            task.cancel()
+
+    async def test_executors(self) -> None:
+        """
+        Batches may be parsed in a thread or process pool, with the same results and errors.
+
+        """
+        lines = self.text.split("\n")[1:]
+        expected = list(iter_parse(io.StringIO(self.text), column=0, errors="skip"))
+        for executor_type in (ThreadPoolExecutor, ProcessPoolExecutor):
+            with (
+                self.subTest(executor_type=executor_type),
+                executor_type(2) as executor,
+            ):
+                self.assertEqual(
+                    await self.collect(
+                        self.chunks(self.text, 16),
+                        column=0,
+                        errors="skip",
+                        batch_size=2,
+                        executor=executor,
+                    ),
+                    expected,
+                )
+                values = []
+                with self.assertRaises(RecordError) as cm:
+                    async for value in aiter_parse(
+                        self.chunks("\n".join(lines), 16), column=0, executor=executor
+                    ):
+                        values.append(value)
+                self.assertEqual(len(values), 2)
+                self.assertEqual(cm.exception.line, 4)
+
+
+class TestLazy(unittest.TestCase):
+    """
+    Tests for :mod:`pyrfc3339.lazy`.
+
+    """
+
+    def test_deferred(self) -> None:
+        """
+        A timestamp is parsed on first access to a datetime attribute, and only once.
+
+        """
+        ts = LazyRFC3339("2009-01-01T14:01:02.5-04:00")
+        self.assertFalse(ts.parsed)
+        self.assertEqual(str(ts), "2009-01-01T14:01:02.5-04:00")
+        self.assertEqual(ts.raw, "2009-01-01T14:01:02.5-04:00")
+        self.assertFalse(ts.parsed)
+        self.assertEqual(ts.microsecond, 500000)
+        self.assertTrue(ts.parsed)
+        self.assertIs(ts.datetime, ts.datetime)
+        self.assertEqual(ts.datetime, parse("2009-01-01T14:01:02.5-04:00"))
+        self.assertEqual(
+            ts.astimezone(timezone.utc),
+            datetime(2009, 1, 1, 18, 1, 2, 500000, timezone.utc),
+        )
+        self.assertEqual(
+            LazyRFC3339("2009-01-01T14:01:02-04:00", utc=True).tzinfo, timezone.utc
+        )
+        self.assertEqual(ts.timestamp(), ts.datetime.timestamp())
+        self.assertEqual(ts.timestamp(), 1230832862.5)
+        with self.assertRaises(AttributeError):
+            ts.no_such_attribute
+
+    def test_invalid(self) -> None:
+        """
+        An invalid timestamp raises only when parsed.
+
+        """
+        ts = LazyRFC3339("2009-13-01T10:01:02Z", strict=True)
+        with self.assertRaises(ParseError):
+            ts.year
+        self.assertFalse(ts.parsed)
+
+    def test_canonical_comparison(self) -> None:
+        """
+        Canonical UTC timestamps compare as their datetimes do, without being parsed.
+
+        """
+        timestamps = [
+            "2009-01-01T10:01:02Z",
+            "2009-01-01T10:01:02.5Z",
+            "2009-01-01T10:01:02.500000Z",
+            "2009-01-01T10:01:02.5000009Z",
+            "2009-01-01T10:01:02.05Z",
+            "2008-12-31T23:59:59.999999Z",
+            "2009-01-01T10:01:03Z",
+        ]
+        lazies = [LazyRFC3339(timestamp) for timestamp in timestamps]
+        datetimes = [parse(timestamp) for timestamp in timestamps]
+        for (a, x), (b, y) in itertools.product(zip(lazies, datetimes), repeat=2):
+            with self.subTest(a=a, b=b):
+                self.assertEqual(a == b, x == y)
+                self.assertEqual(a != b, x != y)
+                self.assertEqual(a < b, x < y)
+                self.assertEqual(a <= b, x <= y)
+                self.assertEqual(a > b, x > y)
+                self.assertEqual(a >= b, x >= y)
+        self.assertEqual(
+            [ts.raw for ts in sorted(lazies)],
+            [
+                timestamps[i]
+                for i in sorted(range(len(timestamps)), key=datetimes.__getitem__)
+            ],
+        )
+        self.assertFalse(any(ts.parsed for ts in lazies))
+
+    def test_mixed_comparison(self) -> None:
+        """
+        Other timestamps, and datetimes, are compared by parsing.
+
+        """
+        a = LazyRFC3339("2009-01-01T14:01:02-04:00")
+        b = LazyRFC3339("2009-01-01T18:01:02Z")
+        self.assertEqual(a, b)
+        self.assertEqual(hash(a), hash(b))
+        self.assertTrue(a.parsed and b.parsed)
+        self.assertEqual(len({a, b}), 1)
+
+        dt = datetime(2009, 1, 1, 18, 1, 3, tzinfo=timezone.utc)
+        c = LazyRFC3339("2009-01-01t18:01:02z")
+        self.assertLess(c, dt)
+        self.assertGreater(dt, c)
+        self.assertNotEqual(dt, c)
+        self.assertEqual(LazyRFC3339("2009-01-01T18:01:03Z"), dt)
+        self.assertNotEqual(c, "2009-01-01t18:01:02z")
+        with self.assertRaises(TypeError):
+            c < "2009-01-01T18:01:03Z"
+
+    def test_pickle(self) -> None:
+        """
+        A timestamp pickles as its string and options.
+
+        """
+        ts = LazyRFC3339("2009-01-01T14:01:02-04:00", utc=True)
+        copy = pickle.loads(pickle.dumps(ts))
+        self.assertFalse(copy.parsed)
+        self.assertEqual(copy.tzinfo, timezone.utc)
+
+    def test_json(self) -> None:
+        """
+        The object hook defers timestamps in JSON objects, and the encoder writes them back unchanged.
+
+        """
+        text = json.dumps(
+            {
+                "a": "2009-01-01T10:01:02Z",
+                "b": "2009-01-01 10:01:02,25+05:30",
+                "c": "2009-01-01",
+                "d": ["2009-01-01T10:01:02Z"],
+                "e": {"f": "2009-13-01T10:01:02Z"},
+                "g": 1,
+                "h": "2009-01-01T10:01:02",
+            }
+        )
+        doc = json.loads(text, object_hook=object_hook)
+        self.assertIsInstance(doc["a"], LazyRFC3339)
+        self.assertIsInstance(doc["b"], LazyRFC3339)
+        self.assertEqual(doc["c"], "2009-01-01")
+        self.assertEqual(doc["d"], ["2009-01-01T10:01:02Z"])
+        self.assertIsInstance(doc["e"]["f"], LazyRFC3339)
+        self.assertEqual(doc["h"], "2009-01-01T10:01:02")
+        self.assertEqual(json.dumps(doc, cls=Rfc3339Encoder), text)
+        self.assertFalse(doc["a"].parsed)
+
+        self.assertEqual(
+            json.dumps(
+                {
+                    "a": datetime(
+                        2009, 1, 1, 10, 1, 2, tzinfo=timezone(timedelta(hours=5))
+                    ),
+                    "b": datetime(2009, 1, 1, 10, 1, 2, 250, tzinfo=timezone.utc),
+                },
+                cls=Rfc3339Encoder,
+            ),
+            '{"a": "2009-01-01T10:01:02+05:00", "b": "2009-01-01T10:01:02.000250Z"}',
+        )
+        with self.assertRaises(ValueError):
+            json.dumps(datetime(2009, 1, 1), cls=Rfc3339Encoder)
+        with self.assertRaises(TypeError):
+            json.dumps(object(), cls=Rfc3339Encoder)
+
+
+class TestSorting(unittest.TestCase):
+    """
+    Tests for :mod:`pyrfc3339.sorting`.
+
+    """
+
+    def sample(self, offsets: bool, digits: int) -> list[str]:
+        rng = random.Random(3339)
+        timestamps = []
+        for _ in range(200):
+            dt = datetime(2009, 1, 1, tzinfo=timezone.utc) + timedelta(
+                seconds=rng.randrange(-(10**6), 10**6),
+                microseconds=rng.randrange(0, 10**6, 10**5),
+            )
+            if offsets:
+                dt = dt.astimezone(
+                    timezone(timedelta(minutes=rng.randrange(-720, 721, 30)))
+                )
+            timestamp = generate(dt, utc=False, microseconds=True)
+            timestamps.append(
+                timestamp[:19]
+                + ("." + timestamp[20:26])[: digits + 1 if digits else 0]
+                + timestamp[26:]
+            )
+        # Repeat some instants, in other offsets where there are offsets.
+        return timestamps + timestamps[:20]
+
+    def test_sort_key(self) -> None:
+        """
+        The sort key is the parsed instant, in microseconds.
+
+        """
+        for timestamp in self.sample(True, 9) + [
+            "2009-01-01t10:01:02.123456789z",
+            "2009-01-01 10:01:02.5+05:30",
+            "2009-01-01T10:01:02",
+            "0001-01-01T00:00:00+23:59",
+        ]:
+            with self.subTest(timestamp=timestamp):
+                self.assertEqual(
+                    rfc3339_sort_key(timestamp), datetime_epoch_us(parse(timestamp))
+                )
+        with self.assertRaises(ValueError):
+            rfc3339_sort_key("2009-13-01T10:01:02Z")
+
+    def test_sorted(self) -> None:
+        """
+        Sorting timestamps agrees with sorting their parsed datetimes, in both the string and the key paths.
+
+        """
+        for offsets, digits in itertools.product((False, True), (0, 3, 6, 9)):
+            timestamps = self.sample(offsets, digits)
+            for reverse in (False, True):
+                with self.subTest(offsets=offsets, digits=digits, reverse=reverse):
+                    self.assertEqual(
+                        sorted_timestamps(iter(timestamps), reverse=reverse),
+                        sorted(timestamps, key=parse, reverse=reverse),
+                    )
+        self.assertEqual(sorted_timestamps([]), [])
+        with self.assertRaises(ValueError):
+            sorted_timestamps(["2009-01-01T10:01:02Z", "2009-01-01T10:01:02+25:00"])
+
+    def test_compare(self) -> None:
+        """
+        Comparing timestamps agrees with comparing their parsed datetimes.
+
+        """
+        for offsets, digits in itertools.product((False, True), (0, 6, 9)):
+            timestamps = self.sample(offsets, digits)[::10]
+            for a, b in itertools.product(timestamps, repeat=2):
+                with self.subTest(a=a, b=b):
+                    x, y = parse(a), parse(b)
+                    self.assertEqual(compare(a, b), (x > y) - (x < y))
+        self.assertEqual(
+            compare("2009-01-01T10:01:02.1234561Z", "2009-01-01T10:01:02.1234569Z"), 0
+        )
+        self.assertEqual(compare("2009-01-01T10:01:02.5z", "2009-01-01T10:01:02.4Z"), 1)
+
+    def test_bisect_range(self) -> None:
+        """
+        A range search finds the timestamps within the bounds that a linear scan does.
+
+        """
+        timestamps = sorted_timestamps(self.sample(True, 6))
+        datetimes = [parse(timestamp) for timestamp in timestamps]
+        rng = random.Random(3339)
+        for _ in range(50):
+            start, stop = sorted(rng.sample(datetimes, 2))
+            for bounds in ((start, stop), (generate(start, utc=False), generate(stop))):
+                with self.subTest(bounds=bounds):
+                    lo, hi = bisect_range(timestamps, *bounds)
+                    self.assertEqual(
+                        datetimes[lo:hi], [dt for dt in datetimes if start <= dt < stop]
+                    )
+        self.assertEqual(bisect_range(timestamps), (0, len(timestamps)))
+        self.assertEqual(bisect_range(timestamps, stop=datetimes[0]), (0, 0))
+        self.assertEqual(bisect_range(timestamps, datetimes[-1])[1], len(timestamps))
+        naive = datetimes[0].astimezone(timezone.utc).replace(tzinfo=None)
+        self.assertEqual(bisect_range(timestamps, stop=naive), (0, 0))
+        self.assertEqual(bisect_range(timestamps, naive)[0], 0)
+        self.assertGreater(
+            bisect_range(timestamps, stop=naive + timedelta(microseconds=1))[1], 0
+        )
+
+
+class TestRecords(unittest.TestCase):
+    """
+    Tests for :func:`pyrfc3339.bulk.parse_records()`.
+
+    """
+
+    timestamps = [
+        "2009-01-01T10:01:02Z",
+        "2009-01-01T14:01:02-04:00",
+        "2009-01-01T10:01:02.25+05:30",
+        "2009-01-01t10:01:02z",
+        "1969-12-31T23:59:59.999999Z",
+    ]
+
+    def expected(self) -> list[int]:
+        return [datetime_epoch_us(parse(timestamp)) for timestamp in self.timestamps]
+
+    def test_matches_parse(self) -> None:
+        """
+        Padded records, at any offset and stride, produce the same instants as :func:`parse()`.
+
+        """
+        for padding in (b" ", b"\0"):
+            for width, stride, offset in ((28, 28, 0), (28, 32, 0), (28, 31, 3)):
+                with self.subTest(padding=padding, stride=stride, offset=offset):
+                    data = b"#" * offset + b"".join(
+                        timestamp.encode().ljust(width, padding).ljust(stride, b"|")
+                        for timestamp in self.timestamps
+                    )
+                    result = parse_records(data, stride, width, offset)
+                    self.assertEqual(result.typecode, "q")
+                    self.assertEqual(result.tolist(), self.expected())
+
+    def test_large(self) -> None:
+        """
+        Inputs spanning several blocks are parsed completely and in order.
+
+        """
+        data = b"".join(
+            generate(
+                datetime(2009, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=i)
+            ).encode()
+            for i in range(10_000)
+        )
+        self.assertEqual(
+            parse_records(memoryview(data), 20).tolist(),
+            [1230768000000000 + i * 1000000 for i in range(10_000)],
+        )
+
+    def test_count(self) -> None:
+        """
+        :obj:`count` limits the number of records parsed, and may not exceed the number available.
+
+        """
+        data = b"2009-01-01T10:01:02Z2009-01-01T10:01:03Z2009-01-01"
+        self.assertEqual(
+            parse_records(data, 20).tolist(), [1230804062000000, 1230804063000000]
+        )
+        self.assertEqual(parse_records(data, 20, count=1).tolist(), [1230804062000000])
+        self.assertEqual(parse_records(data, 20, offset=40).tolist(), [])
+        with self.assertRaises(ValueError):
+            parse_records(data, 20, count=3)
+        with self.assertRaises(ValueError):
+            parse_records(data, 0)
+
+    def test_out(self) -> None:
+        """
+        Results are written into a supplied buffer of signed 64-bit integers.
+
+        """
+        data = "".join(timestamp.ljust(28) for timestamp in self.timestamps).encode()
+        out = array("q", [7] * 6)
+        self.assertIs(parse_records(data, 28, out=out), out)
+        self.assertEqual(out.tolist(), self.expected() + [7])
+
+        with self.assertRaises(ValueError):
+            parse_records(data, 28, out=array("q", [0]))
+        with self.assertRaises(TypeError):
+            parse_records(data, 28, out=array("d", [0.0] * 5))
+        with self.assertRaises(TypeError):
+            parse_records(data, 28, out=bytes(40))
+
+    @unittest.skipUnless(HAVE_NUMPY, "NumPy is not installed")
+    def test_numpy_out(self) -> None:
+        """
+        A NumPy array of dtype ``int64`` can receive the results.
+
+        """
+        data = "".join(timestamp.ljust(28) for timestamp in self.timestamps).encode()
+        out = np.zeros(len(self.timestamps), dtype=np.int64)
+        parse_records(data, 28, out=out)
+        self.assertEqual(out.tolist(), self.expected())
+
+    def test_errors(self) -> None:
+        """
+        An invalid record raises :exc:`ValueError` giving its index and position.
+
+        """
+        for record in (
+            b"2009-13-01T10:01:02Z",
+            b"2009-01-01T10:01:0\xb2Z",
+            b"                    ",
+        ):
+            with self.subTest(record=record):
+                with self.assertRaises(ValueError) as cm:
+                    parse_records(b"2009-01-01T10:01:02Z" + record, 20)
+                self.assertEqual(
+                    str(cm.exception),
+                    f"invalid timestamp in record 1 at byte 20: {record!r}",
+                )
+                self.assertIsInstance(cm.exception.__cause__, ValueError)
+
+        with self.assertRaises(ValueError) as cm:
+            parse_records(b"2009-01-01T10:01:02.Z", 21, strict=True)
+        self.assertIsInstance(cm.exception.__cause__, ParseError)
+
+
+class TestParallel(unittest.TestCase):
+    """
+    Tests for :func:`pyrfc3339.bulk.parse_parallel()`.
+
+    """
+
+    timestamps = [
+        "2009-01-01T10:01:02Z",
+        "2009-01-01T14:01:02.5-04:00",
+        "2009-01-01t10:01:02.123456789z",
+        "0001-01-01T00:00:00-00:01",
+        "9999-12-31T23:59:59.999999+00:01",
+        "2009-01-01T10:01:02+05:30:15",
+    ] * 5
+
+    def test_agrees_with_parse(self) -> None:
+        """
+        The results agree with :func:`parse()` for every option, in order, whatever the chunk size.
+
+        """
+        for utc, produce_naive in ((False, False), (True, False), (True, True)):
+            expected = [
+                parse(timestamp, utc, produce_naive) for timestamp in self.timestamps
+            ]
+            for chunksize in (1, 3, 1000):
+                with self.subTest(
+                    utc=utc, produce_naive=produce_naive, chunksize=chunksize
+                ):
+                    actual = parse_parallel(
+                        iter(self.timestamps),
+                        2,
+                        chunksize,
+                        output="datetime",
+                        utc=utc,
+                        produce_naive=produce_naive,
+                    )
+                    self.assertEqual(
+                        [repr(dt) for dt in actual], [repr(dt) for dt in expected]
+                    )
+                    self.assertEqual(
+                        parse_parallel(
+                            self.timestamps,
+                            2,
+                            chunksize,
+                            utc=utc,
+                            produce_naive=produce_naive,
+                        ),
+                        array("q", map(datetime_epoch_us, expected)),
+                    )
+
+        timestamps = ["2009-01-01T10:01:02", "2009-01-01T10:01:02Z"]
+        self.assertEqual(
+            parse_parallel(timestamps, 1, output="datetime"),
+            [datetime(2009, 1, 1, 10, 1, 2), parse("2009-01-01T10:01:02Z")],
+        )
+        self.assertEqual(
+            parse_parallel(timestamps, 1), array("q", [1230804062000000] * 2)
+        )
+
+        self.assertEqual(parse_parallel([], 1), array("q"))
+        self.assertEqual(parse_parallel([], 1, output="datetime"), [])
+
+    def test_errors(self) -> None:
+        """
+        An invalid timestamp raises :exc:`ValueError` giving its index; invalid arguments raise :exc:`ValueError`.
+
+        """
+        timestamps = self.timestamps + ["2009-13-01T10:01:02Z"] + self.timestamps
+        with self.assertRaisesRegex(ValueError, "^invalid timestamp at index 30: "):
+            parse_parallel(timestamps, 2, 4)
+        with self.assertRaisesRegex(ValueError, "^invalid timestamp at index 1: "):
+            parse_parallel(
+                ["2009-01-01T10:01:02Z", "2009-01-01T10:01:02Z\n2009-01-01T10:01:02Z"],
+                1,
+            )
+        with self.assertRaises(ValueError):
+            parse_parallel(self.timestamps, output="date")  # type: ignore[call-overload]
+        with self.assertRaises(ValueError):
+            parse_parallel(self.timestamps, chunksize=0)
+
+
+class TestThreaded(unittest.TestCase):
+    """
+    Tests for :func:`pyrfc3339.bulk.parse_threaded()` and :func:`pyrfc3339.bulk.generate_threaded()`,
+    both in the calling thread, as with the GIL, and in a pool of threads, as without it.
+
+    """
+
+    timestamps = TestParallel.timestamps
+
+    def gil_modes(self) -> Iterator[None]:
+        for gil_enabled in (True, False):
+            with self.subTest(gil_enabled=gil_enabled):
+                with mock.patch(
+                    "pyrfc3339.bulk._gil_enabled", return_value=gil_enabled
+                ):
+                    yield
+
+    def test_agrees_with_parse(self) -> None:
+        """
+        The results of parsing agree with :func:`parse()` for every option, in order, whatever the chunk size.
+
+        """
+        for _ in self.gil_modes():
+            for utc, produce_naive in ((False, False), (True, False), (True, True)):
+                expected = [
+                    parse(timestamp, utc, produce_naive)
+                    for timestamp in self.timestamps
+                ]
+                for chunksize in (1, 4, 1000):
+                    actual = parse_threaded(
+                        iter(self.timestamps), 3, chunksize, utc, produce_naive
+                    )
+                    self.assertEqual(
+                        [repr(dt) for dt in actual], [repr(dt) for dt in expected]
+                    )
+            self.assertEqual(parse_threaded([], 2), [])
+
+    def test_agrees_with_generate(self) -> None:
+        """
+        The results of generating agree with :func:`generate()` for every option, in order, whatever the chunk size.
+
+        """
+        datetimes = [parse(timestamp) for timestamp in self.timestamps]
+        for _ in self.gil_modes():
+            for utc, microseconds in itertools.product((False, True), repeat=2):
+                expected = [generate(dt, utc, False, microseconds) for dt in datetimes]
+                for chunksize in (1, 4, 1000):
+                    self.assertEqual(
+                        generate_threaded(
+                            iter(datetimes), 3, chunksize, utc, False, microseconds
+                        ),
+                        expected,
+                    )
+            self.assertEqual(generate_threaded([], 2), [])
+
+    def test_errors(self) -> None:
+        """
+        An invalid timestamp or datetime raises :exc:`ValueError` giving its index;
+        invalid arguments raise :exc:`ValueError`.
+
+        """
+        timestamps = self.timestamps + ["2009-13-01T10:01:02Z"] + self.timestamps
+        naive = datetime(2009, 1, 1)
+        for _ in self.gil_modes():
+            with self.assertRaisesRegex(ValueError, "^invalid timestamp at index 30: "):
+                parse_threaded(timestamps, 2, 4)
+            with self.assertRaisesRegex(ValueError, "^invalid datetime at index 1: "):
+                generate_threaded([naive.replace(tzinfo=timezone.utc), naive], 2, 1)
+            with self.assertRaises(ValueError):
+                parse_threaded(self.timestamps, chunksize=0)
+            with self.assertRaises(ValueError):
+                generate_threaded([], workers=0)
+
+    def test_errors_convert_once(self) -> None:
+        """
+        Finding the index of an invalid timestamp does not convert any timestamp twice.
+
+        """
+        timestamps = [
+            "2009-01-01T10:01:02Z",
+            "2009-13-01T10:01:02Z",
+            "2009-01-01T10:01:02Z",
+        ]
+        for _ in self.gil_modes():
+            instrumentation.enable()
+            try:
+                with self.assertRaisesRegex(
+                    ValueError, "^invalid timestamp at index 1: "
+                ):
+                    parse_threaded(timestamps, 2)
+                self.assertEqual(instrumentation.snapshot().calls, {"parse": 2})
+            finally:
+                instrumentation.disable()
+
+    def test_shared_cache(self) -> None:
+        """
+        A cache made without the GIL holds a lock, and its statistics account for every call made by many threads.
+
+        """
+        with mock.patch("pyrfc3339.utils._gil_enabled", return_value=False):
+            cache = LRUCache[int, int](maxsize=8)
+
+        def use() -> None:
+            for key in range(1000):
+                if cache.get(key % 16) is None:
+                    cache.put(key % 16, key)
+
+        threads = [threading.Thread(target=use) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        info = cache.info()
+        self.assertEqual(info.hits + info.misses, 4000)
+        self.assertEqual(info.misses - info.evictions, info.currsize)
+        self.assertEqual(info.currsize, 8)
+
+
+@unittest.skipUnless(HAVE_NUMPY, "NumPy is not installed")
+class TestNumpy(unittest.TestCase):
+    """
+    Tests for :mod:`pyrfc3339.numpy`, which must agree with :func:`pyrfc3339.parse()` and :func:`pyrfc3339.generate()`.
+
+    """
+
+    zones = [
+        timezone.utc,
+        timezone(timedelta(0)),
+        timezone(timedelta(hours=-5)),
+        timezone(timedelta(hours=5, minutes=30)),
+        timezone(timedelta(hours=-9, minutes=-30)),
+        timezone(timedelta(hours=23, minutes=59)),
+    ]
+
+    def setUp(self) -> None:
+        rng = random.Random(3339)
+        self.datetimes = [
+            datetime(1, 1, 2, tzinfo=timezone.utc),
+            datetime(1969, 12, 31, 23, 59, 59, 999999, tzinfo=timezone.utc),
+            datetime(2000, 2, 29, 12, tzinfo=timezone(timedelta(hours=-5))),
+            datetime(9999, 12, 30, 23, 59, 59, tzinfo=timezone.utc),
+        ] + [
+            (
+                datetime(1, 1, 2, tzinfo=timezone.utc)
+                + timedelta(microseconds=rng.randrange(315_500_000_000_000_000))
+            ).astimezone(rng.choice(self.zones))
+            for _ in range(500)
+        ]
+
+    def test_parse_matches_parse(self) -> None:
+        """
+        Parsing agrees with :func:`parse()` for every option, fraction length and offset.
+
+        """
+        rng = random.Random(3339)
+        timestamps = []
+        for dt in self.datetimes:
+            timestamp = generate(dt, utc=False, microseconds=True)
+            digits = rng.randrange(10)
+            suffix = timestamp[26:]
+            fraction = (
+                f".{timestamp[20:26]}{rng.randrange(1000):03d}"[: digits + 1]
+                if digits
+                else ""
+            )
+            timestamps.append(
+                timestamp[:19]
+                + fraction
+                + (rng.choice("Zz") if suffix == "Z" else suffix)
+            )
+
+        for utc in (False, True):
+            with self.subTest(utc=utc):
+                values, offsets = parse_array(timestamps, utc=utc)
+                expected = [parse(timestamp, utc=utc) for timestamp in timestamps]
+                self.assertEqual(
+                    values.tolist(), [dt.replace(tzinfo=None) for dt in expected]
+                )
+                self.assertEqual(
+                    offsets.tolist(),
+                    [offset_seconds(dt) for dt in expected],
+                )
+
+        utc_timestamps = [
+            timestamp for timestamp in timestamps if timestamp[-1] in "Zz"
+        ]
+        values, offsets = parse_array(utc_timestamps, produce_naive=True)
+        self.assertEqual(
+            values.tolist(),
+            [parse(timestamp, produce_naive=True) for timestamp in utc_timestamps],
+        )
+
+    def test_parse_fallback(self) -> None:
+        """
+        Timestamps which are not in the canonical form are handed to :func:`parse()`, errors included.
+
+        """
+        timestamps = np.array(
+            [
+                ["2009-01-01 10:01:02+04:00", "2009-01-01T10:01:02-00:00"],
+                ["2009-01-01T10:01:02Z", "2009-01-01T10:01+00:00"],
+            ]
+        )
+        values, offsets = parse_array(timestamps)
+        self.assertEqual(values.shape, (2, 2))
+        self.assertEqual(
+            [[str(value) for value in row] for row in values.tolist()],
+            [
+                ["2009-01-01 10:01:02", "2009-01-01 10:01:02"],
+                ["2009-01-01 10:01:02", "2009-01-01 10:01:00"],
+            ],
+        )
+        self.assertEqual(offsets.tolist(), [[14400, 0], [0, 0]])
+
+        for timestamp in (
+            "2009-01-01T25:01:02Z",
+            "2009-02-29T10:01:02Z",
+            "2009-01-01T10:01:02+24:00",
+            "2009-01-01T10:01:02",
+        ):
+            with self.subTest(timestamp=timestamp):
+                with self.assertRaises(ValueError):
+                    parse_array(["2009-01-01T10:01:02Z", timestamp])
+
+        with self.assertRaises(ValueError):
+            parse_array(["2009-01-01T10:01:02-04:00"], produce_naive=True)
+
+    def test_parse_limits(self) -> None:
+        """
+        Normalizing to UTC a timestamp which would then fall outside the years 1 to 9999 raises :exc:`OverflowError`,
+        as :func:`parse()` does; one within them is accepted.
+
+        """
+        for timestamp in (
+            "9999-12-31T23:59:59-01:00",
+            "0001-01-01T00:00:00+01:00",
+            "9999-12-31 23:59:59-00:01",
+        ):
+            with self.subTest(timestamp=timestamp):
+                with self.assertRaises(OverflowError):
+                    parse(timestamp, utc=True)
+                with self.assertRaises(OverflowError):
+                    parse_array(["2009-01-01T10:01:02Z", timestamp], utc=True)
+                parse_array([timestamp])
+
+        for timestamp in ("9999-12-31T23:59:59.999999Z", "0001-01-01T00:59:00+00:59"):
+            with self.subTest(timestamp=timestamp):
+                values, _ = parse_array([timestamp], utc=True)
+                self.assertEqual(
+                    values.tolist(), [parse(timestamp, utc=True).replace(tzinfo=None)]
+                )
+
+    def test_parse_bytes(self) -> None:
+        """
+        ASCII bytes are accepted as well as str.
+
+        """
+        values, offsets = parse_array([b"2009-01-01T10:01:02.5-04:00"])
+        self.assertEqual(values.tolist(), [datetime(2009, 1, 1, 10, 1, 2, 500000)])
+        self.assertEqual(offsets.tolist(), [-14400])
+
+    def test_generate_matches_generate(self) -> None:
+        """
+        Generation agrees with :func:`generate()` for every option and offset.
+
+        """
+        values = np.array(
+            [dt.replace(tzinfo=None) for dt in self.datetimes], dtype="datetime64[us]"
+        )
+        offsets = [offset_seconds(dt) for dt in self.datetimes]
+
+        for utc, microseconds in itertools.product((False, True), repeat=2):
+            with self.subTest(utc=utc, microseconds=microseconds):
+                self.assertEqual(
+                    generate_array(
+                        values, offsets, utc=utc, microseconds=microseconds
+                    ).tolist(),
+                    [
+                        generate(dt, utc=utc, microseconds=microseconds)
+                        for dt in self.datetimes
+                    ],
+                )
+
+        utc_values = np.array(
+            [dt.astimezone(timezone.utc).replace(tzinfo=None) for dt in self.datetimes],
+            dtype="datetime64[us]",
+        )
+        self.assertEqual(
+            generate_array(utc_values).tolist(), [generate(dt) for dt in self.datetimes]
+        )
+
+        # Finer precision is truncated, as it is for datetime.
+        self.assertEqual(
+            generate_array(
+                np.array(["1969-12-31T23:59:59.9999999"], dtype="datetime64[ns]"),
+                microseconds=True,
+            ).tolist(),
+            ["1969-12-31T23:59:59.999999Z"],
+        )
+
+    def test_generate_invalid(self) -> None:
+        """
+        Values which cannot be represented as :RFC:`3339` timestamps are rejected.
+
+        """
+        for values, offsets in (
+            (np.array(["NaT"], dtype="datetime64[us]"), None),
+            (np.array(["10000-01-01"], dtype="datetime64[us]"), None),
+            (np.array(["0001-01-01"], dtype="datetime64[us]"), [60]),
+            (np.array(["2009-01-01"], dtype="datetime64[us]"), [30]),
+            (np.array(["2009-01-01"], dtype="datetime64[us]"), [86400]),
+        ):
+            with self.subTest(values=values, offsets=offsets):
+                with self.assertRaises(ValueError):
+                    generate_array(values, offsets)
+
+    def test_roundtrip(self) -> None:
+        """
+        The output of :func:`parse_array()` may be passed straight back to :func:`generate_array()`.
+
+        """
+        timestamps = [
+            generate(dt, utc=False, microseconds=True) for dt in self.datetimes
+        ]
+        self.assertEqual(
+            generate_array(
+                *parse_array(timestamps), utc=False, microseconds=True
+            ).tolist(),
+            timestamps,
+        )
+
+
+@unittest.skipUnless(HAVE_SPEEDUPS, "pyrfc3339._speedups is not built")
+class TestSpeedups(unittest.TestCase):
+    """
+    The compiled :func:`parse()` and :func:`generate()` must behave exactly as the pure-Python implementations,
+    returning equal results and raising the same exceptions with the same messages.
+
+    """
+
+    def assertSameOutcome(
+        self, compiled: Callable[[], object], python: Callable[[], object]
+    ) -> None:
+        try:
+            expected = python()
+        except Exception as exc:
+            with self.assertRaises(type(exc)) as cm:
+                compiled()
+            self.assertEqual(str(cm.exception), str(exc))
+        else:
+            actual = compiled()
+            self.assertEqual(actual, expected)
+            self.assertIs(type(actual), type(expected))
+            if isinstance(expected, datetime):
+                assert isinstance(actual, datetime)
+                self.assertEqual(actual.tzinfo, expected.tzinfo)
+                self.assertEqual(repr(actual), repr(expected))
+
+    def test_parse(self) -> None:
+        """
+        Parsing agrees for canonical and non-canonical timestamps, and for random corruptions of them.
+
+        """
+        rng = random.Random(3339)
+        timestamps = [
+            "2009-01-01T10:01:02Z",
+            "2009-01-01t10:01:02z",
+            "2009-01-01 10:01:02.1+05:30",
+            "2009-01-01T10:01:02.123456789-00:00",
+            "2009-01-01T10:01:02.1234567891+00:00",
+            "0001-01-01T00:00:00+00:01",
+            "0001-01-01T00:00:00-00:01",
+            "9999-12-31T23:59:59.999999-00:01",
+            "9999-12-31T23:59:59.999999+23:59",
+            "2000-02-29T23:30:00-01:00",
+            "2001-02-29T00:00:00Z",
+            "2009-01-01T10:01:60Z",
+            "2009-01-01T10:01:02",
+            "2009-01-01T10:01:02.Z",
+            "2009-01-01T10:01Z",
+            "2009-01-01T10:01:02+0530",
+            "2009-01-01T10:01:02+05:30:15",
+            "2009-01-01T10:01:02,5Z",
+            "2009-01-01T10:01:02Z ",
+            "2009-01-01X10:01:02Z",
+            "2009-01-01T10:01:0²Z",
+            "",
+        ]
+        for dt in [datetime(1, 1, 1, tzinfo=timezone.utc)] * 50:
+            dt += timedelta(microseconds=rng.randrange(315_537_000_000_000_000))
+            offset = timezone(timedelta(minutes=rng.randrange(-1439, 1440)))
+            timestamp = generate(dt.astimezone(offset), utc=False, microseconds=True)
+            timestamps.append(timestamp)
+            position = rng.randrange(len(timestamp))
+            following = position + 1
+            timestamps.append(
+                timestamp[:position] + rng.choice("09:-+.Zz ") + timestamp[following:]
+            )
+
+        for timestamp in timestamps:
+            for utc, produce_naive, strict in itertools.product(
+                (False, True), repeat=3
+            ):
+                with self.subTest(
+                    timestamp=timestamp,
+                    utc=utc,
+                    produce_naive=produce_naive,
+                    strict=strict,
+                ):
+                    self.assertSameOutcome(
+                        lambda: _speedups.parse(timestamp, utc, produce_naive, strict),
+                        lambda: pyrfc3339.parser.parse(
+                            timestamp, utc, produce_naive, strict
+                        ),
+                    )
+
+    def test_generate(self) -> None:
+        """
+        Generation agrees for every kind of :attr:`~datetime.datetime.tzinfo` and option.
+
+        """
+
+        class Subclass(datetime):
+            pass
+
+        datetimes = [
+            datetime(2009, 1, 1, 12, 59, 59, 123456),
+            datetime(2009, 1, 1, 12, 59, 59, tzinfo=timezone.utc),
+            datetime(2009, 1, 1, 12, 59, 59, tzinfo=timezone(timedelta(0), "UTC")),
+            datetime(2009, 1, 1, 12, 59, 59, tzinfo=timezone(timedelta(hours=-4))),
+            datetime(
+                2009, 1, 1, 12, 59, 59, tzinfo=timezone(timedelta(seconds=19800.5))
+            ),
+            datetime(2024, 11, 3, 1, 30, tzinfo=ZoneInfo("US/Eastern"), fold=1),
+            datetime(2024, 11, 3, 1, 30, tzinfo=ZoneInfo("US/Eastern")),
+            datetime(2009, 1, 1, tzinfo=ZoneInfo("UTC")),
+            datetime(1, 1, 1, tzinfo=timezone(timedelta(minutes=1))),
+            datetime(9999, 12, 31, 23, 59, tzinfo=timezone(timedelta(minutes=-1))),
+            datetime(1900, 1, 1, tzinfo=ZoneInfo("Europe/Amsterdam")),
+            Subclass(2009, 1, 1, tzinfo=timezone.utc),
+        ]
+        for dt in datetimes:
+            for utc, accept_naive, microseconds in itertools.product(
+                (False, True), repeat=3
+            ):
+                with self.subTest(
+                    dt=dt, utc=utc, accept_naive=accept_naive, microseconds=microseconds
+                ):
+                    self.assertSameOutcome(
+                        lambda: _speedups.generate(dt, utc, accept_naive, microseconds),
+                        lambda: pyrfc3339.generator.generate(
+                            dt, utc, accept_naive, microseconds
+                        ),
+                    )
+
+    def test_arguments(self) -> None:
+        """
+        Arguments are bound as they would be for the Python functions, with the same errors for invalid calls.
+
+        """
+        dt = datetime(2009, 1, 1, tzinfo=timezone(timedelta(hours=1)))
+        calls: list[tuple[tuple[object, ...], dict[str, object]]] = [
+            ((), {}),
+            ((dt,), {"utc": 0}),
+            ((), {"dt": dt, "microseconds": [1]}),
+            ((dt, False), {"utc": True}),
+            ((dt, False, False, False, False), {}),
+            ((dt,), {"timezone": True}),
+            (("2009-01-01T10:01:02+01:00",), {}),
+            ((b"2009-01-01T10:01:02Z",), {}),
+        ]
+        for args, kwargs in calls:
+            with self.subTest(args=args, kwargs=kwargs):
+                self.assertSameOutcome(
+                    lambda: _speedups.generate(*args, **kwargs),  # type: ignore[arg-type]
+                    lambda: pyrfc3339.generator.generate(*args, **kwargs),  # type: ignore[arg-type]
+                )
+
+        self.assertSameOutcome(
+            lambda: _speedups.parse(timestamp="2009-01-01T10:01:02+01:00", strict=True),
+            lambda: pyrfc3339.parser.parse(
+                timestamp="2009-01-01T10:01:02+01:00", strict=True
+            ),
+        )
+        timestamp = "2009-01-01T10:01:02.123456789Z"
+        for precision in ("us", "ns", "ms", None):
+            with self.subTest(precision=precision):
+                self.assertSameOutcome(
+                    lambda: _speedups.parse(timestamp, precision=precision),  # type: ignore[call-overload]
+                    lambda: pyrfc3339.parser.parse(timestamp, precision=precision),  # type: ignore[call-overload]
+                )
+        self.assertSameOutcome(
+            lambda: _speedups.parse("2009-01-01T10:01:02Z", False, False, False, "ns"),  # type: ignore[call-overload]
+            lambda: pyrfc3339.parser.parse("2009-01-01T10:01:02Z", False, False, False, "ns"),  # type: ignore[call-overload]
+        )
+        self.assertSameOutcome(
+            lambda: _speedups.parse(b"2009-01-01T10:01:02Z"),  # type: ignore[call-overload]
+            lambda: pyrfc3339.parser.parse(b"2009-01-01T10:01:02Z"),  # type: ignore[call-overload]
+        )
+
+    def test_caches(self) -> None:
+        """
+        While a cache is enabled, parsing is left to the Python implementation, which maintains it.
+
+        """
+        try:
+            configure_caches(timestamp_size=8)
+            _speedups.parse("2009-01-01T10:01:02Z")
+            _speedups.parse("2009-01-01T10:01:02Z")
+            self.assertEqual(cache_info().timestamps.hits, 1)
+        finally:
+            configure_caches()
+
+    def test_doctests(self) -> None:
+        """
+        The examples in the docstrings of the Python :func:`parse()` and :func:`generate()` hold for the functions
+        the package exports, which are the compiled ones unless the pure-Python implementation is forced.
+
+        """
+        finder = doctest.DocTestFinder()
+        runner = doctest.DocTestRunner()
+        report: list[str] = []
+        for function, module in (
+            (pyrfc3339.parser.parse, pyrfc3339.parser),
+            (pyrfc3339.generator.generate, pyrfc3339.generator),
+        ):
+            for test in finder.find(function, module=module):
+                test.globs.update(parse=pyrfc3339.parse, generate=pyrfc3339.generate)
+                self.assertGreater(len(test.examples), 0)
+                runner.run(test, out=report.append)
+        self.assertEqual(runner.failures, 0, "".join(report))
+
+    def test_selected(self) -> None:
+        """
+        The package exports the compiled functions unless the pure-Python implementation is forced.
+
+        """
+        if os.environ.get("PYRFC3339_PURE_PYTHON"):
+            self.assertIs(pyrfc3339.parse, pyrfc3339.parser.parse)
+            self.assertIs(pyrfc3339.generate, pyrfc3339.generator.generate)
+        else:
+            self.assertIs(pyrfc3339.parse, _speedups.parse)
+            self.assertIs(pyrfc3339.generate, _speedups.generate)
+
+
+class TestInstrumentation(unittest.TestCase):
+    """
+    Tests for :mod:`pyrfc3339.instrumentation`.
+
+    """
+
+    def tearDown(self) -> None:
+        instrumentation.disable()
+        instrumentation._callbacks.clear()
+
+    def test_counts(self) -> None:
+        """
+        Calls are counted by function, and errors by cause, only while instrumentation is enabled.
+
+        """
+        self.assertFalse(instrumentation.is_enabled())
+        pyrfc3339.parse("2009-01-01T10:01:02Z")
+
+        instrumentation.enable()
+        self.assertTrue(instrumentation.is_enabled())
+        self.assertEqual(instrumentation.snapshot().calls, {})
+
+        pyrfc3339.parse("2009-01-01T10:01:02Z")
+        pyrfc3339.parser.parse("2009-01-01T10:01:02.5+05:30", utc=True)
+        parse_bytes(b"2009-01-01T10:01:02Z")
+        pyrfc3339.generate(datetime(2009, 1, 1, tzinfo=timezone.utc))
+        generate_bytes(datetime(2009, 1, 1, tzinfo=timezone.utc))
+
+        for function, cause, call in (
+            ("parse", "syntax", lambda: pyrfc3339.parse("yesterday")),
+            (
+                "parse",
+                "syntax",
+                lambda: pyrfc3339.parse("2009-01-01T10:01:02.Z", strict=True),
+            ),
+            ("parse", "range", lambda: pyrfc3339.parse("2009-13-01T10:01:02Z")),
+            (
+                "parse",
+                "range",
+                lambda: pyrfc3339.parse("2009-02-29T10:01:02Z", strict=True),
+            ),
+            (
+                "parse",
+                "range",
+                lambda: pyrfc3339.parse("0001-01-01T00:00:00+00:01", utc=True),
+            ),
+            (
+                "parse",
+                "offset",
+                lambda: pyrfc3339.parse("2009-01-01T10:01:02", strict=True),
+            ),
+            (
+                "parse",
+                "offset",
+                lambda: pyrfc3339.parse("2009-01-01T10:01:02+24:00", strict=True),
+            ),
+            (
+                "parse",
+                "offset",
+                lambda: pyrfc3339.parse("2009-01-01T10:01:02+24:00"),
+            ),
+            ("parse", "other", lambda: pyrfc3339.parse(None)),  # type: ignore[call-overload]
+            (
+                "parse",
+                "offset",
+                lambda: pyrfc3339.parse("2009-01-01T10:01:02+05:30:15", precision="ns"),
+            ),
+            (
+                "parse",
+                "naive",
+                lambda: pyrfc3339.parse(
+                    "2009-01-01T10:01:02+01:00", produce_naive=True
+                ),
+            ),
+            ("parse", "other", lambda: pyrfc3339.parse("2009-01-01T10:01:02Z", precision="ms")),  # type: ignore[call-overload]
+            ("generate", "naive", lambda: pyrfc3339.generate(datetime(2009, 1, 1))),
+            ("generate", "other", lambda: pyrfc3339.generate("2009-01-01")),  # type: ignore[arg-type]
+        ):
+            with self.subTest(function=function, cause=cause):
+                instrumentation.reset()
+                with self.assertRaises(Exception):
+                    call()
+                stats = instrumentation.snapshot()
+                self.assertEqual(stats.calls, {function: 1})
+                self.assertEqual(stats.errors, {cause: 1})
+                self.assertEqual(stats.fallback, {function: 1})
+
+        instrumentation.reset()
+        pyrfc3339.parse("2009-01-01T10:01:02Z")
+        instrumentation.disable()
+        self.assertFalse(instrumentation.is_enabled())
+        pyrfc3339.parse("2009-01-01T10:01:02Z")
+        self.assertEqual(instrumentation.snapshot().calls, {"parse": 1})
+
+    def test_paths(self) -> None:
+        """
+        Calls handled by the compiled fast path are distinguished from those handled by the Python implementation,
+        and the results are unchanged.
+
+        """
+        timestamps = ["2009-01-01T10:01:02Z", "2009-01-01T10:01:02+05:30:15"]
+        datetimes = [
+            datetime(2009, 1, 1, tzinfo=timezone(timedelta(hours=1))),
+            datetime(2009, 1, 1, tzinfo=timezone(timedelta(hours=5, seconds=15))),
+        ]
+        expected = [pyrfc3339.parse(t) for t in timestamps], [
+            pyrfc3339.generate(dt, utc=False) for dt in datetimes
+        ]
+
+        instrumentation.enable()
+        actual = [pyrfc3339.parse(t) for t in timestamps], [
+            pyrfc3339.generate(dt, utc=False) for dt in datetimes
+        ]
+        self.assertEqual(actual, expected)
+
+        stats = instrumentation.snapshot()
+        self.assertEqual(stats.calls, {"parse": 2, "generate": 2})
+        if pyrfc3339.parse is pyrfc3339.parser.parse:
+            self.assertEqual(stats.fast_path, {})
+            self.assertEqual(stats.fallback, {"parse": 2, "generate": 2})
+        else:
+            self.assertEqual(stats.fast_path, {"parse": 1, "generate": 1})
+            self.assertEqual(stats.fallback, {"parse": 1, "generate": 1})
+
+    def test_interrupt(self) -> None:
+        """
+        An exception which is not an error, such as :exc:`KeyboardInterrupt`, propagates without being recorded.
+
+        """
+        instrumentation.enable()
+        with mock.patch.object(
+            pyrfc3339.parser, "_parse_default", side_effect=KeyboardInterrupt
+        ):
+            with self.assertRaises(KeyboardInterrupt):
+                pyrfc3339.parse("2009-01-01T10:01:02+05:30:15")
+
+        self.assertEqual(instrumentation.snapshot(), ({}, {}, {}, {}, {}))
+        pyrfc3339.parse("2009-01-01T10:01:02Z")
+        self.assertEqual(instrumentation.snapshot().calls, {"parse": 1})
+
+    def test_timing(self) -> None:
+        """
+        The cumulative duration of calls is measured only if requested.
+
+        """
+        instrumentation.enable()
+        pyrfc3339.parse("2009-01-01T10:01:02Z")
+        self.assertEqual(instrumentation.snapshot().time_ns, {})
+
+        instrumentation.enable(timing=True)
+        pyrfc3339.parse("2009-01-01T10:01:02Z")
+        pyrfc3339.generate(datetime(2009, 1, 1, tzinfo=timezone.utc))
+        time_ns = instrumentation.snapshot().time_ns
+        self.assertEqual(set(time_ns), {"parse", "generate"})
+        self.assertTrue(all(elapsed > 0 for elapsed in time_ns.values()))
+
+    def test_callbacks(self) -> None:
+        """
+        Each registered callback receives an event for each observed call, including calls made by callbacks.
+
+        """
+        events: list[instrumentation.Event] = []
+
+        def reparse(event: instrumentation.Event) -> None:
+            if event.function == "generate":
+                pyrfc3339.parse("2009-01-01T10:01:02Z")
+
+        instrumentation.add_callback(events.append)
+        instrumentation.add_callback(reparse)
+        instrumentation.enable(timing=True)
+
+        pyrfc3339.generate(datetime(2009, 1, 1, tzinfo=timezone.utc))
+        with self.assertRaises(ValueError):
+            pyrfc3339.parse("2009-01-01T10:01:02", strict=True)
+
+        self.assertEqual(
+            [(event.function, event.cause) for event in events],
+            [("generate", None), ("parse", None), ("parse", "offset")],
+        )
+        self.assertTrue(all(event.elapsed_ns is not None for event in events))
+
+        instrumentation.remove_callback(events.append)
+        pyrfc3339.parse("2009-01-01T10:01:02Z")
+        self.assertEqual(len(events), 3)
+        with self.assertRaises(ValueError):
+            instrumentation.remove_callback(events.append)
+
+    def test_threads(self) -> None:
+        """
+        Calls from several threads are all counted.
+
+        """
+        instrumentation.enable()
+        with ThreadPoolExecutor(4) as executor:
+            list(
+                executor.map(
+                    lambda i: pyrfc3339.parse(f"2009-01-01T10:01:{i % 60:02d}Z"),
+                    range(1000),
+                )
+            )
+        self.assertEqual(instrumentation.snapshot().calls, {"parse": 1000})
+
+
+class TestImport(unittest.TestCase):
+    """
+    Tests of the cost of importing the package; see also ``benchmarks/bench_import.py``.
+
+    """
+
+    def test_modules(self) -> None:
+        """
+        Importing the package does not import slow or optional modules.
+
+        """
+        script = (
+            "import sys; before = set(sys.modules); import pyrfc3339; "
+            "print(' '.join(sorted(set(sys.modules) - before)))"
+        )
+        imported = set(
+            subprocess.run(
+                [sys.executable, "-c", script],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.split()
+        )
+        self.assertIn("pyrfc3339.parser", imported)
+        for module in (
+            "asyncio",
+            "concurrent.futures",
+            "importlib.metadata",
+            "json",
+            "numpy",
+            "zoneinfo",
+        ):
+            with self.subTest(module=module):
+                self.assertNotIn(module, imported)
+        if sys.version_info >= (3, 12):
+            # Earlier versions of typing import re.
+            self.assertNotIn("re", imported)
+
+    def test_version(self) -> None:
+        """
+        The version is looked up when first requested, and other attributes are still missing.
+
+        """
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            expected = version("pyrfc3339")
+        except PackageNotFoundError:
+            self.assertFalse(hasattr(pyrfc3339, "__version__"))
+        else:
+            self.assertEqual(pyrfc3339.__version__, expected)
+            self.assertEqual(vars(pyrfc3339)["__version__"], expected)
+        with self.assertRaises(AttributeError):
+            pyrfc3339.no_such_attribute
+
+
 class TestExhaustiveRoundtrip(unittest.TestCase):
     """
     This test case exhaustively tests parsing and generation by generating
@@ -1,4 +1,18 @@
-from datetime import datetime
+import sys
+from collections import OrderedDict
+from collections.abc import Hashable
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import TYPE_CHECKING, Generic, NamedTuple, TypeVar
+
+if TYPE_CHECKING:
+    from threading import Lock
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_NAIVE_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
 
 
 def datetime_utcoffset(dt: datetime) -> float:
@@ -26,9 +40,280 @@ def datetime_utcoffset(dt: datetime) -> float:
 
     assert dt.tzinfo is not None
 
+    cached = _cached_utcoffset(dt)
+    if cached is not None:
+        return cached.offset.total_seconds()
+
     tz = dt.tzinfo
     offset = tz.utcoffset(dt)
 
     assert offset is not None
 
     return offset.total_seconds()
+
+
+def datetime_epoch_us(dt: datetime) -> int:
+    """
+    Return the number of microseconds between the Unix epoch and a :class:`datetime.datetime`.
+    A naive :class:`~datetime.datetime` is taken to be in UTC.
+
+    >>> from datetime import datetime, timedelta, timezone
+    >>> datetime_epoch_us(datetime(2009, 1, 1, 14, 1, 2, 250000, tzinfo=timezone(timedelta(hours=4))))
+    1230804062250000
+    >>> datetime_epoch_us(datetime(1969, 12, 31, 23, 59, 59, 999999))
+    -1
+
+    :param datetime.datetime dt: a :class:`~datetime.datetime` instance
+    :return: the number of microseconds since 1970-01-01T00:00:00Z
+    :rtype: int
+
+    """
+
+    if dt.tzinfo is None:
+        return (dt - _NAIVE_EPOCH) // _MICROSECOND
+    else:
+        return (dt - _EPOCH) // _MICROSECOND
+
+
+def _gil_enabled() -> bool:
+    # Whether the GIL is enabled: always, before Python 3.13, and otherwise unless this is a free-threaded build
+    # running without it.
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is None or bool(is_gil_enabled())
+
+
+class Timestamp(NamedTuple):
+    """
+    An instant with nanosecond precision, and the UTC offset with which it was written,
+    as produced by :python:`parse(..., precision='ns')` and accepted by :func:`~pyrfc3339.generate()`.
+
+    >>> from pyrfc3339 import generate, parse
+    >>> ts = parse('2009-01-01T14:01:02.123456789-04:00', precision='ns')
+    >>> ts
+    Timestamp(seconds=1230832862, nanoseconds=123456789, offset_minutes=-240)
+    >>> generate(ts, utc=False, microseconds=True)
+    '2009-01-01T14:01:02.123456789-04:00'
+
+    Timestamps compare and sort by instant, then by offset, so they may be used directly as sort keys.
+    Note that equal instants written with different offsets are therefore not equal.
+
+    >>> parse('2009-01-01T18:01:02.123456788Z', precision='ns') < ts
+    True
+
+    """
+
+    #: The number of whole seconds since 1970-01-01T00:00:00Z.
+    seconds: int
+    #: The number of nanoseconds since the start of the second, from 0 to 999,999,999.
+    nanoseconds: int
+    #: The UTC offset with which the timestamp was written, in minutes.
+    offset_minutes: int = 0
+
+    @property
+    def epoch_ns(self) -> int:
+        """
+        The number of nanoseconds since 1970-01-01T00:00:00Z.
+
+        """
+        return self.seconds * 1_000_000_000 + self.nanoseconds
+
+    def to_datetime(self) -> datetime:
+        """
+        Return an aware :class:`datetime.datetime` with the timestamp's UTC offset,
+        truncating the fraction to microseconds.
+
+        >>> Timestamp(1230832862, 123456789, -240).to_datetime()
+        datetime.datetime(2009, 1, 1, 14, 1, 2, 123456, tzinfo=datetime.timezone(datetime.timedelta(days=-1, seconds=72000)))
+
+        """
+        dt = _EPOCH + timedelta(
+            seconds=self.seconds, microseconds=self.nanoseconds // 1000
+        )
+        return dt.astimezone(timezone(timedelta(minutes=self.offset_minutes)))
+
+
+class _CachedOffset(NamedTuple):
+    # An entry of the offset cache.
+
+    # The UTC offset.
+    offset: timedelta
+    # The offset as datetime.isoformat() writes it.
+    suffix: str
+    # Midnight on 1970-01-01 in the zone. Subtracting it from a datetime with the same tzinfo gives the
+    # datetime's local time since then, without consulting the zone.
+    anchor: datetime
+    # The naive UTC datetime to which to add that local time to convert it to UTC.
+    utc_epoch: datetime
+
+
+def _cached_utcoffset(dt: datetime) -> _CachedOffset | None:
+    # The UTC offset of an aware datetime from the offset cache; or None if the cache is disabled, the datetime is
+    # naive, its tzinfo is a datetime.timezone or is unhashable, or the offset changes within the hour. An hour is
+    # cached only if its offset is the same at both ends, as zones change offset at most once in an hour;
+    # the fold distinguishes the two passes of a repeated hour.
+    cache = _offset_cache
+    tz = dt.tzinfo
+    if cache is None or tz is None or type(tz) is timezone:
+        return None
+
+    key = (tz, dt.toordinal(), dt.hour, dt.fold)
+    try:
+        cached = cache.get(key)
+    except TypeError:
+        return None
+    if cached is not None:
+        # An equal but distinct tzinfo would be consulted when subtracting the anchor.
+        return cached if cached.anchor.tzinfo is tz else None
+
+    first = dt.replace(minute=0, second=0, microsecond=0)
+    offset = first.utcoffset()
+    if (
+        offset is None
+        or offset != first.replace(minute=59, second=59, microsecond=999999).utcoffset()
+    ):
+        return None
+
+    cached = _CachedOffset(
+        offset,
+        _NAIVE_EPOCH.replace(tzinfo=timezone(offset)).isoformat()[19:],
+        _NAIVE_EPOCH.replace(tzinfo=tz),
+        _NAIVE_EPOCH - offset,
+    )
+    cache.put(key, cached)
+    return cached
+
+
+class CacheInfo(NamedTuple):
+    """
+    Statistics for an :class:`LRUCache`, in the manner of :meth:`functools.lru_cache`'s ``cache_info()``.
+
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache(Generic[K, V]):
+    """
+    A bounded mapping which discards its least recently used entry when full,
+    and which counts hits, misses and evictions.
+
+    >>> cache = LRUCache[str, int](maxsize=2)
+    >>> cache.put('a', 1)
+    >>> cache.put('b', 2)
+    >>> cache.get('a')
+    1
+    >>> cache.put('c', 3)
+    >>> cache.get('b') is None
+    True
+    >>> cache.info()
+    CacheInfo(hits=1, misses=1, evictions=1, maxsize=2, currsize=2)
+
+    The cache may be shared between threads; concurrent use never corrupts it, including on free-threaded
+    builds of Python running without the GIL, although with the GIL the statistics may undercount.
+
+    :param int maxsize: the greatest number of entries to retain; must be positive
+
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[K, V] = OrderedDict()
+        # With the GIL, each operation on the OrderedDict is atomic, and the methods tolerate the entries changing
+        # between operations. Without it, they hold a lock. A build without the GIL may re-enable it,
+        # but one running with the GIL never disables it.
+        self._lock: "Lock | None" = None
+        if not _gil_enabled():
+            import threading
+
+            self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> V | None:
+        """
+        Return the value cached for :obj:`key`, or :const:`None` if there is none.
+
+        """
+        lock = self._lock
+        if lock is not None:
+            with lock:
+                return self._get(key)
+        return self._get(key)
+
+    def _get(self, key: K) -> V | None:
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        try:
+            self._entries.move_to_end(key)
+        except KeyError:
+            # Evicted by another thread in the meantime.
+            pass
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        """
+        Cache :obj:`value` for :obj:`key`, evicting the least recently used entry if the cache is full.
+
+        """
+        lock = self._lock
+        if lock is not None:
+            with lock:
+                self._put(key, value)
+        else:
+            self._put(key, value)
+
+    def _put(self, key: K, value: V) -> None:
+        entries = self._entries
+        entries[key] = value
+        if len(entries) > self.maxsize:
+            try:
+                entries.popitem(last=False)
+            except KeyError:
+                # Emptied by another thread in the meantime.
+                return
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Discard all entries and reset the statistics.
+
+        """
+        lock = self._lock
+        if lock is not None:
+            with lock:
+                self._clear()
+        else:
+            self._clear()
+
+    def _clear(self) -> None:
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> CacheInfo:
+        """
+        Return the statistics for this cache.
+
+        """
+        return CacheInfo(
+            self.hits, self.misses, self.evictions, self.maxsize, len(self._entries)
+        )
+
+
+# The UTC offsets of tzinfo instances other than datetime.timezone, keyed by (tzinfo, ordinal, hour, fold);
+# enabled by pyrfc3339.generator.configure_caches().
+_offset_cache: LRUCache[tuple[tzinfo, int, int, int], _CachedOffset] | None = None
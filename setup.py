@@ -0,0 +1,18 @@
+import os
+
+from setuptools import Extension, setup
+
+# Setting PYRFC3339_PURE_PYTHON when building produces a pure-Python wheel, installable anywhere.
+setup(
+    ext_modules=(
+        []
+        if os.environ.get("PYRFC3339_PURE_PYTHON")
+        else [
+            Extension(
+                "pyrfc3339._speedups",
+                sources=["pyrfc3339/_speedups.c"],
+                optional=True,
+            )
+        ]
+    )
+)